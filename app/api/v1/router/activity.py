@@ -28,6 +28,7 @@ async def get_activity_endpoint(
     date_from: Optional[str] = Query(None),
     date_to: Optional[str] = Query(None),
     q: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
     db: AsyncSession = Depends(get_db),
     _: AdminUser = Depends(require_admin),
 ):
@@ -43,6 +44,7 @@ async def get_activity_endpoint(
         date_from=date_from,
         date_to=date_to,
         q=q,
+        cursor=cursor,
     )
 
 
@@ -17,10 +17,11 @@ router = APIRouter()
 async def get_announcements_endpoint(
     start: int = Query(0, ge=0),
     end: int = Query(4, gt=0, le=100),
+    cursor: Optional[str] = Query(None),
     lang: str = Depends(get_language),
     db: AsyncSession = Depends(get_db)
 ):
-    return await get_announcements_user(start=start, end=end, lang=lang, db=db)
+    return await get_announcements_user(start=start, end=end, cursor=cursor, lang=lang, db=db)
 
 @router.get("/{announcement_id}")
 async def get_announcement_details_enpoint(
@@ -36,11 +37,12 @@ async def get_announcement_details_enpoint(
 async def get_announcements_endpoint_admin(
     start: int = Query(0, ge=0),
     end: int = Query(4, gt=0, le=100),
+    cursor: Optional[str] = Query(None),
     lang: str = Depends(get_language),
     db: AsyncSession = Depends(get_db),
     _: AdminUser = Depends(require_admin),
 ):
-    return await get_announcements_admin(start=start, end=end, lang=lang, db=db)
+    return await get_announcements_admin(start=start, end=end, cursor=cursor, lang=lang, db=db)
 
 @router.post("/create")
 async def create_announcement_endpoint(
@@ -18,7 +18,8 @@ from app.core.security import (
 )
 from app.core.config import settings
 from app.core.rate_limit import limiter
-from app.core.auth_dependency import AUDIT_SCOPE_KEY, require_admin
+from app.core.actor_cache import prime_actor
+from app.core.auth_dependency import AUDIT_SCOPE_KEY, require_admin_record
 from app.models.admin.admin_user import AdminUser
 from app.services.rbac import get_role_snapshot
 
@@ -99,6 +100,7 @@ async def login(
     user.refresh_token_hash = hash_password(refresh_token)
     user.last_login_at = datetime.now(timezone.utc)
     await db.commit()
+    await prime_actor(db, user)
 
     _mark_audit(request, actor_id=user.id, actor_username=user.username)
 
@@ -126,7 +128,7 @@ async def login(
 async def me(
     request: Request,
     db: AsyncSession = Depends(get_db),
-    user: AdminUser = Depends(require_admin),
+    user: AdminUser = Depends(require_admin_record),
 ):
     snapshot = await get_role_snapshot(db, user.role_id)
     role = user.role
@@ -173,7 +175,7 @@ async def change_password(
     request: Request,
     body: ChangePasswordRequest,
     db: AsyncSession = Depends(get_db),
-    user: AdminUser = Depends(require_admin),
+    user: AdminUser = Depends(require_admin_record),
 ):
     if not verify_password(body.current_password, user.hashed_password):
         logger.warning(
@@ -285,6 +287,7 @@ async def refresh(
     user.refresh_token_hash = hash_password(new_refresh_token)
     user.updated_at = datetime.now(timezone.utc)
     await db.commit()
+    await prime_actor(db, user)
 
     response.set_cookie(
         key=REFRESH_COOKIE_NAME,
@@ -1,6 +1,7 @@
 from typing import Optional
 
 from fastapi import APIRouter, Request, Response, Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth_dependency import require_admin
@@ -8,7 +9,7 @@ from app.core.rate_limit import limiter
 from app.core.session import get_db
 from app.api.v1.schema.chat import ChatRequest, ChatResponse
 from app.models.admin.admin_user import AdminUser
-from app.services.chat import get_chat_reply
+from app.services.chat import get_chat_reply, stream_chat_reply
 from app.services.chat_admin import (
     DEFAULT_PAGE_SIZE,
     MAX_PAGE_SIZE,
@@ -47,6 +48,28 @@ async def chat_message(
     return ChatResponse(reply=reply, session_id=session_id)
 
 
+@router.post("/message/stream")
+@limiter.limit("20/minute")
+async def chat_message_stream(
+    request: Request,
+    response: Response,
+    body: ChatRequest,
+    db: AsyncSession = Depends(get_db),
+):
+    events = await stream_chat_reply(
+        message=body.message,
+        session_id=body.session_id,
+        ip_address=_get_client_ip(request),
+        db=db,
+    )
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        # X-Accel-Buffering stops nginx from holding the events back.
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/admin/sessions")
 async def list_chat_sessions_endpoint(
     page: int = Query(default=1, ge=1),
@@ -56,6 +79,7 @@ async def list_chat_sessions_endpoint(
     q: Optional[str] = Query(default=None),
     sort_by: str = Query(default="last_active_at"),
     sort_dir: str = Query(default="desc", pattern="^(asc|desc)$"),
+    cursor: Optional[str] = Query(default=None),
     db: AsyncSession = Depends(get_db),
     _: AdminUser = Depends(require_admin),
 ):
@@ -68,6 +92,7 @@ async def list_chat_sessions_endpoint(
         q=q,
         sort_by=sort_by,
         sort_dir=sort_dir,
+        cursor=cursor,
     )
 
 
@@ -8,6 +8,7 @@ from app.api.v1.schema.chatbot_knowledge import KnowledgeSourceCreate, Knowledge
 from app.models.admin.admin_user import AdminUser
 from app.models.chat.chatbot_knowledge_source import ChatbotKnowledgeSource
 from app.services.chatbot_scraper import scrape_source, scrape_all_sources
+from app.services.chat_knowledge import delete_source_chunks
 
 router = APIRouter(dependencies=[Depends(require_admin)])
 
@@ -49,6 +50,7 @@ async def delete_source(
         raise HTTPException(status_code=404, detail="Tapılmadı")
     await db.delete(source)
     await db.commit()
+    await delete_source_chunks(source_id)
 
 
 @router.post("/sources/{source_id}/scrape")
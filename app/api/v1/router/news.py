@@ -18,10 +18,11 @@ async def get_news_public_endpoint(
     category_id: Optional[int] = Query(None, description="Filter by category ID"),
     start: int = Query(0, ge=0, description="Start index"),
     end: int = Query(10, gt=0, description="End index (absolute offset; page size end-start is capped server-side)"),
+    cursor: Optional[str] = Query(None, description="Keyset pagination: empty for the first page, then the previous page's next_cursor"),
     lang_code: str = Depends(get_language),
     db: AsyncSession = Depends(get_db)
 ):
-    return await get_public_news(category_id=category_id, start=start, end=end, lang_code=lang_code, db=db)
+    return await get_public_news(category_id=category_id, start=start, end=end, cursor=cursor, lang_code=lang_code, db=db)
 
 @router.get("/gallery")
 async def get_news_gallery_endpoint(
@@ -73,7 +74,7 @@ async def get_news_admin_endpoint(
     db: AsyncSession = Depends(get_db),
     _: AdminUser = Depends(require_admin),
 ):
-    return await get_admin_news(category_id=news_data.category_id, start=news_data.start, end=news_data.end, lang_code=lang_code, db=db)
+    return await get_admin_news(category_id=news_data.category_id, start=news_data.start, end=news_data.end, cursor=news_data.cursor, lang_code=lang_code, db=db)
 
 @router.post("/create")
 async def create_news_endpoint(
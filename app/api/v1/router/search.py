@@ -25,7 +25,8 @@ async def admin_search_endpoint(
     db: AsyncSession = Depends(get_db),
     _: AdminUser = Depends(require_admin),
 ):
-    """Search news and announcements together for the admin dashboard."""
+    """Search news, announcements, faculties, cafedras, employees and offices
+    together for the admin dashboard."""
     return await admin_search(q=q, lang=lang_code, limit=limit, db=db)
 
 
@@ -13,6 +13,7 @@ class NewsGetter(BaseModel):
     category_id: int | None = None
     start: int | None = Field(default=0, ge=0, description="Start index")
     end: int | None = Field(default=10, gt=0, description="End index")
+    cursor: str | None = Field(default=None, description="Keyset pagination: empty for the first page, then the previous page's next_cursor")
 
 
 class GalleryImageOrder(BaseModel):
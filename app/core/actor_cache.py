@@ -0,0 +1,320 @@
+"""Shared cache of authenticated admins.
+
+Every admin request used to select its ``admin_users`` row, and each worker
+re-read the role's permissions every 30 s. ``get_actor`` now answers from a
+per-worker copy, then from Redis, and only then from the database:
+
+    local dict  ->  auth:actor:rec:<username>:<version>  ->  admin_users + roles
+
+A record is what the permission layer and the handlers read off the actor —
+id, username, role_id and the role's permission snapshot — not the ORM row;
+the routes that need the row (``/auth/me``, change-password) depend on
+``require_admin_record`` instead.
+
+The version in the key joins a global counter, bumped when any role's grants
+change, with the admin's own, bumped when their row changes. Writers call
+``invalidate_actor`` / ``invalidate_all_actors`` after ``db.commit()``: the
+counters move, so a record built by a request that read the old rows lands
+under the old version and is never read again (the scheme of
+``app.core.cache``), and a message on ``auth:actor:invalidate`` makes every
+worker drop its local copies and role snapshots. A worker trusts local copies
+only while that subscription is up, and never longer than
+ACTOR_CACHE_TTL_SECONDS.
+
+Login and refresh prime the record, so the first request after signing in is
+already a hit. Redis trouble never fails a request — the lookup falls back to
+the two queries, as before.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.core.redis_client import get_redis
+from app.models.admin.admin_user import AdminUser
+from app.services.rbac import RoleSnapshot, get_role_snapshot, invalidate_role_cache, load_role_snapshot
+
+logger = get_logger("aztu.auth.actors")
+
+CHANNEL = "auth:actor:invalidate"
+_RECORD_PREFIX = "auth:actor:rec"
+_VERSION_KEY = "auth:actor:ver"
+_ALL = "*"
+_BACKOFF_SECONDS = 30.0
+_RECONNECT_SECONDS = 5.0
+_MAX_LOCAL_ENTRIES = 1024
+
+_disabled_until = 0.0
+# username -> (stored at, record); only read while the listener is subscribed.
+_local: dict[str, tuple[float, "CachedActor"]] = {}
+# Bumped on every eviction, so a load that raced one is not kept locally.
+_evictions = 0
+_listening = False
+_listener: asyncio.Task | None = None
+
+
+@dataclass(frozen=True)
+class CachedActor:
+    """The authenticated admin as the permission layer and handlers see it."""
+
+    id: int
+    username: str
+    role_id: Optional[int]
+    role_snapshot: Optional[RoleSnapshot]
+
+    def to_json(self) -> str:
+        role = self.role_snapshot
+        return json.dumps({
+            "id": self.id,
+            "username": self.username,
+            "role_id": self.role_id,
+            "role": None if role is None else {
+                "id": role.id,
+                "code": role.code,
+                "is_system": role.is_system,
+                "permissions": sorted(role.permissions),
+            },
+        })
+
+    @classmethod
+    def from_json(cls, raw: str) -> "CachedActor":
+        data = json.loads(raw)
+        role = data["role"]
+        return cls(
+            id=data["id"],
+            username=data["username"],
+            role_id=data["role_id"],
+            role_snapshot=None if role is None else RoleSnapshot(
+                id=role["id"],
+                code=role["code"],
+                is_system=role["is_system"],
+                permissions=frozenset(role["permissions"]),
+            ),
+        )
+
+
+def _available() -> bool:
+    return settings.ACTOR_CACHE_ENABLED and time.monotonic() >= _disabled_until
+
+
+def _back_off(exc: Exception) -> None:
+    global _disabled_until
+    _disabled_until = time.monotonic() + _BACKOFF_SECONDS
+    logger.warning("Actor cache unavailable, bypassing for %ds: %s", _BACKOFF_SECONDS, exc)
+
+
+def _user_version_key(username: str) -> str:
+    return f"{_VERSION_KEY}:{username}"
+
+
+def _record_key(username: str, version: str) -> str:
+    return f"{_RECORD_PREFIX}:{username}:{version}"
+
+
+async def _version(redis, username: str) -> str:
+    shared, own = await redis.mget(_VERSION_KEY, _user_version_key(username))
+    return f"{shared or 0}.{own or 0}"
+
+
+async def _store(redis, actor: CachedActor, version: str) -> None:
+    # Nothing outlives the access token that needed it; refresh primes anew.
+    await redis.set(
+        _record_key(actor.username, version),
+        actor.to_json(),
+        ex=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    )
+
+
+async def _load(db: AsyncSession, username: str, shared: bool) -> Optional[CachedActor]:
+    row = (
+        await db.execute(
+            select(AdminUser.id, AdminUser.username, AdminUser.role_id).where(
+                AdminUser.username == username,
+                AdminUser.is_active == True,  # noqa: E712
+            )
+        )
+    ).one_or_none()
+    if row is None:
+        return None
+    # A record headed for Redis must not carry this worker's possibly stale
+    # role snapshot: it would outlive the invalidation that clears it here.
+    load = load_role_snapshot if shared else get_role_snapshot
+    return CachedActor(
+        id=row.id, username=row.username, role_id=row.role_id,
+        role_snapshot=await load(db, row.role_id),
+    )
+
+
+async def _shared(db: AsyncSession, username: str) -> Optional[CachedActor]:
+    if not _available():
+        return await _load(db, username, shared=False)
+
+    try:
+        redis = await get_redis()
+        version = await _version(redis, username)
+        raw = await redis.get(_record_key(username, version))
+    except Exception as exc:
+        _back_off(exc)
+        return await _load(db, username, shared=False)
+
+    if raw is not None:
+        try:
+            return CachedActor.from_json(raw)
+        except (ValueError, KeyError, TypeError) as exc:
+            logger.warning("Unreadable actor record for %s, rebuilding: %s", username, exc)
+
+    actor = await _load(db, username, shared=True)
+    if actor is not None:
+        try:
+            await _store(redis, actor, version)
+        except Exception as exc:
+            _back_off(exc)
+    return actor
+
+
+async def get_actor(db: AsyncSession, username: str) -> Optional[CachedActor]:
+    """The active admin ``username``, or ``None`` if there is none."""
+    if not settings.ACTOR_CACHE_ENABLED:
+        return await _load(db, username, shared=False)
+
+    if _listening:
+        entry = _local.get(username)
+        if entry is not None and time.monotonic() - entry[0] < settings.ACTOR_CACHE_TTL_SECONDS:
+            return entry[1]
+
+    evictions = _evictions
+    actor = await _shared(db, username)
+    if actor is not None and _listening and evictions == _evictions:
+        if len(_local) >= _MAX_LOCAL_ENTRIES:
+            _local.clear()
+        _local[username] = (time.monotonic(), actor)
+    return actor
+
+
+async def prime_actor(db: AsyncSession, user: AdminUser) -> None:
+    """Store ``user``'s record ahead of its first request — call on login and
+    refresh, after ``db.commit()``.
+
+    ``user`` was read before the password check, so the record is re-selected
+    after the version: a deactivation or role change that commits in between
+    then lands under a version this record does not.
+    """
+    if not _available():
+        return
+    try:
+        redis = await get_redis()
+        version = await _version(redis, user.username)
+    except Exception as exc:
+        _back_off(exc)
+        return
+    actor = await _load(db, user.username, shared=True)
+    if actor is None:
+        return
+    try:
+        await _store(redis, actor, version)
+    except Exception as exc:
+        _back_off(exc)
+
+
+def _evict(username: Optional[str]) -> None:
+    global _evictions
+    _evictions += 1
+    if username is None:
+        _local.clear()
+        invalidate_role_cache()
+    else:
+        _local.pop(username, None)
+
+
+async def _announce(version_keys: list[str], messages: list[str]) -> None:
+    if not settings.ACTOR_CACHE_ENABLED:
+        return
+    try:
+        redis = await get_redis()
+        async with redis.pipeline(transaction=False) as pipe:
+            for key in version_keys:
+                pipe.incr(key)
+            for message in messages:
+                pipe.publish(CHANNEL, message)
+            await pipe.execute()
+    except Exception as exc:
+        # Not backed off: the next invalidation must still try. Records missed
+        # here expire with the access tokens they were built for.
+        logger.error("Actor cache invalidation failed for %s: %s", messages, exc)
+
+
+async def invalidate_actor(*usernames: str) -> None:
+    """Drop the records of ``usernames`` everywhere. Call after ``db.commit()``."""
+    usernames = tuple(u for u in usernames if u)
+    if not usernames:
+        return
+    for username in usernames:
+        _evict(username)
+    await _announce(
+        [_user_version_key(u) for u in usernames],
+        [f"user:{u}" for u in usernames],
+    )
+
+
+async def invalidate_all_actors() -> None:
+    """Drop every record and role snapshot everywhere — after a role's grants change."""
+    _evict(None)
+    await _announce([_VERSION_KEY], [_ALL])
+
+
+async def _listen() -> None:
+    global _listening
+    while True:
+        pubsub = None
+        try:
+            redis = await get_redis()
+            pubsub = redis.pubsub()
+            await pubsub.subscribe(CHANNEL)
+            async for message in pubsub.listen():
+                if message["type"] == "subscribe":
+                    # Anything published before now was missed.
+                    _evict(None)
+                    _listening = True
+                elif message["type"] == "message":
+                    data = message["data"]
+                    _evict(None if data == _ALL else data.removeprefix("user:"))
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning(
+                "Actor cache listener disconnected, retrying in %ds: %s", _RECONNECT_SECONDS, exc
+            )
+        finally:
+            _listening = False
+            if pubsub is not None:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+        await asyncio.sleep(_RECONNECT_SECONDS)
+
+
+async def start_actor_listener() -> None:
+    global _listener
+    if settings.ACTOR_CACHE_ENABLED:
+        _listener = asyncio.create_task(_listen(), name="actor-cache-listener")
+
+
+async def stop_actor_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.cancel()
+        try:
+            await _listener
+        except asyncio.CancelledError:
+            pass
+        _listener = None
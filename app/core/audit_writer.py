@@ -0,0 +1,203 @@
+"""Batched writer for activity-log rows.
+
+``AuditLogMiddleware`` used to open a DB session, resolve the target's label
+and commit the row before the response went out, so every audited mutation
+paid for a second transaction. It now only queues the row here; a per-worker
+task wakes up every AUDIT_FLUSH_INTERVAL_MS, resolves the labels of the
+queued rows in one session and bulk-inserts them in another.
+
+``created_at`` is stamped when the row is queued, so batching never moves an
+event in the timeline. A batch the database rejects is split in half until
+the offending rows are found; those alone are dropped with an error log (an
+admin deleted before the flush, a NUL character jsonb refuses), so one bad row
+never holds up the rest. Batches that fail for any other reason — the database
+away, a dropped connection — are retried with back-off; the queue is bounded by
+AUDIT_QUEUE_MAX_ROWS and drops the oldest rows with an error log if the database
+stays away long enough to fill it. Shutdown flushes what is left.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.exc import DataError, DBAPIError, IntegrityError
+
+from app.core.audit_labels import label_from_fields, resolve_target_label
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.admin.activity_log import AdminActivityLog
+
+logger = logging.getLogger("aztu.audit")
+
+BATCH_SIZE = 500
+# SQLSTATE classes for rows the database will never accept: data exceptions
+# (22) and integrity violations (23). asyncpg surfaces some of them as a plain
+# DBAPIError, so the code is checked as well as the exception type.
+_REJECTED_SQLSTATE_CLASSES = ("22", "23")
+_RETRY_MIN_SECONDS = 2.0
+_RETRY_MAX_SECONDS = 60.0
+
+_queue: deque[dict[str, Any]] = deque()
+_wakeup: asyncio.Event | None = None
+_worker: asyncio.Task | None = None
+
+
+def _event() -> asyncio.Event:
+    global _wakeup
+    if _wakeup is None:
+        _wakeup = asyncio.Event()
+    return _wakeup
+
+
+def enqueue_activity(
+    row: dict[str, Any],
+    resolve_label: bool,
+    fallback_fields: Optional[dict] = None,
+) -> None:
+    """Queue one ``admin_activity_log`` row (column -> value). Never raises.
+
+    With ``resolve_label`` the target's current name is looked up at flush
+    time; ``fallback_fields`` label the row when that finds nothing.
+    """
+    if len(_queue) >= settings.AUDIT_QUEUE_MAX_ROWS:
+        dropped = _queue.popleft()
+        logger.error(
+            "Activity log queue full, dropped %s %s",
+            dropped["row"]["action_key"], dropped["row"]["created_at"].isoformat(),
+        )
+    _queue.append({
+        "row": {**row, "created_at": datetime.now(timezone.utc)},
+        "resolve_label": resolve_label,
+        "fallback_fields": fallback_fields,
+    })
+    _event().set()
+
+
+async def _label(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """The rows of ``entries`` with ``target_label`` filled in."""
+    resolved: dict[tuple[str, str], Optional[str]] = {}
+    async with AsyncSessionLocal() as db:
+        for entry in entries:
+            row = entry["row"]
+            key = (row.get("target_type"), row.get("target_id"))
+            if entry["resolve_label"] and key not in resolved:
+                resolved[key] = await resolve_target_label(db, *key)
+    rows = []
+    for entry in entries:
+        row = entry["row"]
+        label = resolved.get((row.get("target_type"), row.get("target_id"))) if entry["resolve_label"] else None
+        if label is None:
+            label = label_from_fields(entry["fallback_fields"])
+        rows.append({**row, "target_label": label})
+    return rows
+
+
+async def _insert(rows: list[dict[str, Any]]) -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(AdminActivityLog), rows)
+        await db.commit()
+
+
+def _rejected(exc: Exception) -> bool:
+    """Whether ``exc`` means the rows are bad, not that the database is away."""
+    if isinstance(exc, (IntegrityError, DataError)):
+        return True
+    if isinstance(exc, DBAPIError):
+        sqlstate = getattr(exc.orig, "sqlstate", None) or ""
+        return sqlstate[:2] in _REJECTED_SQLSTATE_CLASSES
+    return False
+
+
+def _take_batch() -> list[dict[str, Any]]:
+    return [_queue.popleft() for _ in range(min(BATCH_SIZE, len(_queue)))]
+
+
+def _requeue(entries: list[dict[str, Any]]) -> None:
+    room = settings.AUDIT_QUEUE_MAX_ROWS - len(_queue)
+    _queue.extendleft(reversed(entries[:max(room, 0)]))
+
+
+async def _process(batch: list[dict[str, Any]]) -> bool:
+    """Write ``batch``, dropping the rows the database rejects. On any other
+    failure put what is unwritten back at the front of the queue."""
+    try:
+        rows = await _label(batch)
+    except Exception as exc:
+        logger.warning("Activity log: labelling %d rows failed, will retry: %s", len(batch), exc)
+        _requeue(batch)
+        return False
+
+    # Chunks of (entry, row) still to write, in queue order.
+    chunks = [list(zip(batch, rows))]
+    while chunks:
+        chunk = chunks[0]
+        try:
+            await _insert([row for _, row in chunk])
+        except Exception as exc:
+            if not _rejected(exc):
+                logger.warning(
+                    "Activity log: writing %d rows failed, will retry: %s",
+                    sum(len(c) for c in chunks), exc,
+                )
+                _requeue([entry for c in chunks for entry, _ in c])
+                return False
+            if len(chunk) > 1:
+                middle = len(chunk) // 2
+                chunks[0:1] = [chunk[:middle], chunk[middle:]]
+                continue
+            row = chunk[0][1]
+            logger.error(
+                "Activity log: dropped %s %s, rejected by the database: %s",
+                row["action_key"], row["created_at"].isoformat(), exc,
+            )
+        chunks.pop(0)
+    return True
+
+
+async def _run() -> None:
+    delay = _RETRY_MIN_SECONDS
+    while True:
+        await _event().wait()
+        _event().clear()
+        await asyncio.sleep(settings.AUDIT_FLUSH_INTERVAL_MS / 1000)
+
+        while _queue:
+            if await _process(_take_batch()):
+                delay = _RETRY_MIN_SECONDS
+            else:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _RETRY_MAX_SECONDS)
+
+
+async def start_activity_writer() -> None:
+    global _worker
+    _worker = asyncio.create_task(_run(), name="activity-log-writer")
+
+
+async def stop_activity_writer(timeout: float = 5.0) -> None:
+    """Stop the task and write what is queued (bounded by ``timeout``)."""
+    global _worker
+    if _worker is not None:
+        _worker.cancel()
+        try:
+            await _worker
+        except asyncio.CancelledError:
+            pass
+        _worker = None
+
+    async def drain() -> None:
+        while _queue:
+            if not await _process(_take_batch()):
+                return
+
+    try:
+        await asyncio.wait_for(drain(), timeout)
+    except Exception as exc:
+        logger.warning("Activity log: final flush skipped: %s", exc)
+    if _queue:
+        logger.error("Activity log: %d rows not written at shutdown", len(_queue))
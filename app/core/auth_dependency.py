@@ -5,8 +5,10 @@ rather than on 180 handlers. App-level dependencies are solved after the router
 set ``scope["route"]``, so ``(method, route.path)`` is available for the map lookup.
 
 The resolved actor is cached in ``scope["aztu_admin_user"]``; ``require_admin`` reads
-it back, so every one of the 131 existing call sites keeps working and the request
-still costs a single user query.
+it back, so every one of the 131 existing call sites keeps working. It is a
+``CachedActor`` from ``app.core.actor_cache`` rather than the ORM row, so a request
+whose actor is cached costs no query at all; ``require_admin_record`` loads the row
+for the routes that need more than id, username and role.
 """
 
 import logging
@@ -19,13 +21,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.core import audit_payload
+from app.core.actor_cache import CachedActor, get_actor
 from app.core.audit_payload import SECRET_FIELD_NAMES  # re-exported
 from app.core.config import settings
 from app.core.permission_map import ROUTE_PERMISSIONS, RouteRule
 from app.core.security import decode_token
 from app.core.session import get_db
 from app.models.admin.admin_user import AdminUser
-from app.services.rbac import has_permission
+from app.services.rbac import snapshot_permits
 
 logger = logging.getLogger("aztu.auth")
 
@@ -71,7 +74,7 @@ def _bearer_token(request: Request) -> Optional[str]:
     return token.strip()
 
 
-async def _load_active_admin(db: AsyncSession, token: str) -> AdminUser:
+async def _load_active_admin(db: AsyncSession, token: str) -> CachedActor:
     try:
         payload = decode_token(token)
         if payload.get("type") != "access":
@@ -80,19 +83,13 @@ async def _load_active_admin(db: AsyncSession, token: str) -> AdminUser:
     except (JWTError, ValueError, KeyError):
         raise _unauthorized("Invalid or expired token")
 
-    result = await db.execute(
-        select(AdminUser).where(
-            AdminUser.username == username,
-            AdminUser.is_active == True,  # noqa: E712
-        )
-    )
-    user = result.scalar_one_or_none()
+    user = await get_actor(db, username)
     if not user:
         raise _unauthorized("User not found or inactive")
     return user
 
 
-async def resolve_actor(request: Request, db: AsyncSession) -> AdminUser:
+async def resolve_actor(request: Request, db: AsyncSession) -> CachedActor:
     """Return the authenticated admin, reusing the one already resolved this request."""
     cached = request.scope.get(ACTOR_SCOPE_KEY)
     if cached is not None:
@@ -173,7 +170,7 @@ async def _capture_request_body(request: Request) -> Optional[Any]:
     return audit_payload.from_json_bytes(raw)
 
 
-async def _seed_audit_ctx(request: Request, user: Optional[AdminUser], rule: RouteRule) -> None:
+async def _seed_audit_ctx(request: Request, user: Optional[CachedActor], rule: RouteRule) -> None:
     """Write contract C3 into the raw scope so the audit middleware can read it."""
     if rule.no_audit:
         return
@@ -225,7 +222,7 @@ async def enforce_permission(request: Request, db: AsyncSession = Depends(get_db
     if rule.authenticated_only:
         return
 
-    if await has_permission(db, user, rule.key):
+    if snapshot_permits(user.role_snapshot, rule.key):
         return
 
     audit = request.scope.get(AUDIT_SCOPE_KEY)
@@ -245,9 +242,9 @@ async def require_admin(
     request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
     db: AsyncSession = Depends(get_db),
-) -> AdminUser:
+) -> CachedActor:
     """
-    FastAPI dependency that validates the Bearer JWT and returns the active AdminUser.
+    FastAPI dependency that validates the Bearer JWT and returns the active admin.
     Attach as `_: AdminUser = Depends(require_admin)` on every write endpoint.
     """
     cached = request.scope.get(ACTOR_SCOPE_KEY)
@@ -260,3 +257,20 @@ async def require_admin(
     user = await _load_active_admin(db, credentials.credentials)
     request.scope[ACTOR_SCOPE_KEY] = user
     return user
+
+
+async def require_admin_record(
+    actor: CachedActor = Depends(require_admin),
+    db: AsyncSession = Depends(get_db),
+) -> AdminUser:
+    """The authenticated admin's ``AdminUser`` row, for routes that read or change it."""
+    result = await db.execute(
+        select(AdminUser).where(
+            AdminUser.id == actor.id,
+            AdminUser.is_active == True,  # noqa: E712
+        )
+    )
+    user = result.scalar_one_or_none()
+    if not user:
+        raise _unauthorized("User not found or inactive")
+    return user
@@ -0,0 +1,272 @@
+"""Shared response cache for the public read endpoints.
+
+A cached service is wrapped with ``@cached_response(route, tags=...)``. The
+cache key is the route name, the call's parameters (language included) and the
+current version of every tag the response depends on, e.g. ``faculty:ENG01`` or
+``menu:footer``. Mutation services call ``invalidate(*tags)`` after
+``db.commit()``, which bumps those versions — older entries are never read again
+and simply age out on their TTL.
+
+Versioning rather than deleting keys is deliberate: a request that read the
+database just before a commit and writes its (now stale) body just after the
+purge still lands under the old version, so it can never shadow the new data.
+
+Entries live in Redis so all uvicorn workers share them. Redis trouble never
+fails a request — the wrapped service is simply called, and the cache stays out
+of the way for a short back-off window instead of retrying on every hit.
+
+``LocalSnapshot`` is the in-process variant for tiny, hot payloads (the menus):
+each worker keeps the built data in memory and only asks Redis for the tag
+version, so a hit costs one GET instead of a GET plus a body transfer.
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import time
+from typing import Any, Awaitable, Callable, Iterable
+
+from fastapi import status
+from fastapi.responses import Response
+
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.core.redis_client import get_redis
+
+logger = get_logger("aztu.cache")
+
+_KEY_PREFIX = "cache:v1"
+_TAG_PREFIX = "cache:tag"
+_BACKOFF_SECONDS = 30.0
+
+_disabled_until = 0.0
+
+
+def _available() -> bool:
+    return settings.PUBLIC_CACHE_ENABLED and time.monotonic() >= _disabled_until
+
+
+def _back_off(exc: Exception) -> None:
+    global _disabled_until
+    _disabled_until = time.monotonic() + _BACKOFF_SECONDS
+    logger.warning("Response cache unavailable, bypassing for %ds: %s", _BACKOFF_SECONDS, exc)
+
+
+def _tag_key(tag: str) -> str:
+    return f"{_TAG_PREFIX}:{tag}"
+
+
+async def _tag_version(tag: str) -> str | None:
+    """Current version of ``tag``; ``None`` when Redis is not usable."""
+    if not _available():
+        return None
+    try:
+        redis = await get_redis()
+        return await redis.get(_tag_key(tag)) or "0"
+    except Exception as exc:
+        _back_off(exc)
+        return None
+
+
+async def invalidate(*tags: str) -> None:
+    """Drop every cached response that depends on any of ``tags``.
+
+    Call after ``db.commit()`` — invalidating before the commit would let a
+    concurrent read repopulate the cache from the old rows.
+    """
+    if not tags or not settings.PUBLIC_CACHE_ENABLED:
+        return
+    try:
+        redis = await get_redis()
+        async with redis.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                pipe.incr(_tag_key(tag))
+            await pipe.execute()
+    except Exception as exc:
+        # Not backed off: the next invalidation must still try. Entries missed
+        # here expire on PUBLIC_CACHE_TTL_SECONDS.
+        logger.warning("Cache invalidation failed for %s: %s", tags, exc)
+
+
+def cached_response(
+    route: str,
+    tags: Callable[[dict[str, Any]], Iterable[str]],
+    ttl: int | None = None,
+):
+    """Cache a public read service's 200 responses in Redis.
+
+    ``tags`` receives the call's parameters (everything but ``db``) and returns
+    the entity tags the response is built from.
+    """
+
+    def decorator(fn: Callable[..., Awaitable[Response]]):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            if not _available():
+                return await fn(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            params = {k: v for k, v in bound.arguments.items() if k != "db"}
+            tag_keys = [_tag_key(tag) for tag in tags(params)]
+
+            try:
+                redis = await get_redis()
+                versions = await redis.mget(tag_keys) if tag_keys else []
+                fingerprint = json.dumps(
+                    [params, versions], sort_keys=True, default=str
+                ).encode("utf-8")
+                key = f"{_KEY_PREFIX}:{route}:{hashlib.sha1(fingerprint).hexdigest()}"
+                body = await redis.get(key)
+            except Exception as exc:
+                _back_off(exc)
+                return await fn(*args, **kwargs)
+
+            if body is not None:
+                return Response(
+                    content=body,
+                    media_type="application/json",
+                    headers={"X-Cache": "HIT"},
+                )
+
+            response = await fn(*args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                try:
+                    await redis.set(
+                        key,
+                        response.body.decode("utf-8"),
+                        ex=ttl or settings.PUBLIC_CACHE_TTL_SECONDS,
+                    )
+                except Exception as exc:
+                    _back_off(exc)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+async def cached_count(db, stmt, tags: Iterable[str] = (), ttl: int | None = None) -> int:
+    """``stmt`` (a ``SELECT count(*)``) through the shared cache.
+
+    Paginated lists report a total on every page; paging through a filtered
+    view then costs one count per view instead of one per page. With ``tags``
+    the total is exact again as soon as a mutation invalidates them; without,
+    it may lag by up to ``ttl`` (COUNT_CACHE_TTL_SECONDS) — fine for totals
+    like the activity log's that only ever grow.
+    """
+    if not _available():
+        return (await db.execute(stmt)).scalar_one()
+
+    compiled = stmt.compile()
+    tag_keys = [_tag_key(tag) for tag in tags]
+    try:
+        redis = await get_redis()
+        versions = await redis.mget(tag_keys) if tag_keys else []
+        fingerprint = json.dumps(
+            [str(compiled), compiled.params, versions], sort_keys=True, default=str
+        ).encode("utf-8")
+        key = f"{_KEY_PREFIX}:count:{hashlib.sha1(fingerprint).hexdigest()}"
+        cached = await redis.get(key)
+    except Exception as exc:
+        _back_off(exc)
+        return (await db.execute(stmt)).scalar_one()
+
+    if cached is not None:
+        return int(cached)
+    total = (await db.execute(stmt)).scalar_one()
+    try:
+        await redis.set(key, total, ex=ttl or settings.COUNT_CACHE_TTL_SECONDS)
+    except Exception as exc:
+        _back_off(exc)
+    return total
+
+
+async def cached_value(
+    name: str,
+    tags: Iterable[str],
+    build: Callable[[], Awaitable[Any]],
+    ttl: int | None = None,
+) -> Any:
+    """``await build()`` through the shared cache, for JSON-serialisable values.
+
+    Keyed by ``name`` and the current version of every tag, like
+    ``cached_response``; ``ttl`` bounds how stale a missed invalidation leaves it.
+    """
+    if not _available():
+        return await build()
+
+    tag_keys = [_tag_key(tag) for tag in tags]
+    try:
+        redis = await get_redis()
+        versions = await redis.mget(tag_keys) if tag_keys else []
+        fingerprint = json.dumps(versions).encode("utf-8")
+        key = f"{_KEY_PREFIX}:value:{name}:{hashlib.sha1(fingerprint).hexdigest()}"
+        cached = await redis.get(key)
+    except Exception as exc:
+        _back_off(exc)
+        return await build()
+
+    if cached is not None:
+        return json.loads(cached)
+    value = await build()
+    try:
+        await redis.set(key, json.dumps(value), ex=ttl or settings.PUBLIC_CACHE_TTL_SECONDS)
+    except Exception as exc:
+        _back_off(exc)
+    return value
+
+
+class LocalSnapshot:
+    """Per-worker copy of a built payload, revalidated against a cache tag.
+
+    ``build(key, db)`` produces the payload for ``key`` (e.g. a language code).
+    An entry is reused while the tag version it was built under is still
+    current and it is younger than PUBLIC_CACHE_TTL_SECONDS; the age bound is
+    what keeps workers honest while Redis is unreachable. The version is read
+    before building, so an entry built from rows that a concurrent mutation
+    replaced is stamped with the old version and rebuilt on the next read.
+    """
+
+    def __init__(self, tag: str, build: Callable[[str, Any], Awaitable[Any]]):
+        self.tag = tag
+        self._build = build
+        self._entries: dict[str, tuple[str | None, float, Any]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def get(self, key: str, db) -> Any:
+        if not settings.PUBLIC_CACHE_ENABLED:
+            return await self._build(key, db)
+
+        version = await _tag_version(self.tag)
+        entry = self._entries.get(key)
+        if entry is not None and self._fresh(entry, version):
+            return entry[2]
+
+        # One build per key per worker; concurrent readers wait for it.
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            entry = self._entries.get(key)
+            if entry is not None and self._fresh(entry, version):
+                return entry[2]
+            return await self._store(key, version, db)
+
+    async def rebuild(self, keys: Iterable[str], db) -> None:
+        """Rebuild ``keys`` now — call after ``invalidate(self.tag)``."""
+        version = await _tag_version(self.tag)
+        for key in keys:
+            await self._store(key, version, db)
+
+    async def _store(self, key: str, version: str | None, db) -> Any:
+        data = await self._build(key, db)
+        self._entries[key] = (version, time.monotonic(), data)
+        return data
+
+    @staticmethod
+    def _fresh(entry: tuple[str | None, float, Any], version: str | None) -> bool:
+        built_under, built_at, _ = entry
+        if time.monotonic() - built_at >= settings.PUBLIC_CACHE_TTL_SECONDS:
+            return False
+        return built_under == version
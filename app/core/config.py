@@ -15,6 +15,19 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
     REDIS_PASSWORD: str | None = None
+    # One uvicorn worker holds this Redis lease and alone runs the boot-time
+    # sync and the scheduled jobs (app.core.leader); a dead leader's lease
+    # passes to another worker within this many seconds.
+    LEADER_LEASE_SECONDS: int = 30
+
+    # Public read cache (app.core.cache). Mutations invalidate by tag; the TTL
+    # only bounds how long a missed invalidation can serve stale data.
+    PUBLIC_CACHE_ENABLED: bool = True
+    PUBLIC_CACHE_TTL_SECONDS: int = 300
+    # Totals of paginated lists (app.core.cache.cached_count)
+    COUNT_CACHE_TTL_SECONDS: int = 60
+    # Admin dashboard counts and publishing trend (app.services.dashboard)
+    DASHBOARD_CACHE_TTL_SECONDS: int = 60
 
     # Elasticsearch
     ELASTICSEARCH_URL: str = "http://localhost:9200"
@@ -27,6 +40,11 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Authenticated admins are resolved from a Redis-shared actor cache
+    # (app.core.actor_cache) instead of two queries per request. The TTL bounds
+    # how long a worker trusts its in-memory copy between invalidation messages.
+    ACTOR_CACHE_ENABLED: bool = True
+    ACTOR_CACHE_TTL_SECONDS: int = 300
 
     # Admin seeding (used once on first startup if admin_users table is empty)
     ADMIN_SEED_USERNAME: str | None = None
@@ -34,6 +52,21 @@ class Settings(BaseSettings):
 
     # OpenAI
     OPEN_AI_KEY: str = ""
+    # Knowledge-base chunks retrieved into each chatbot prompt (app.services.chat_knowledge)
+    CHAT_KNOWLEDGE_TOP_K: int = 6
+    # Chat history window: the last N user/assistant turns are sent verbatim,
+    # capped at roughly this many tokens; older turns live on as a summary.
+    CHAT_HISTORY_TURNS: int = 6
+    CHAT_HISTORY_TOKEN_BUDGET: int = 1500
+    # Answers to opening questions, reused for the same (or a near-identical)
+    # question until the knowledge changes (app.services.chat_answer_cache)
+    CHAT_ANSWER_CACHE_ENABLED: bool = True
+    CHAT_ANSWER_CACHE_TTL_SECONDS: int = 21600
+    CHAT_ANSWER_CACHE_SIMILARITY: float = 0.9
+    CHAT_ANSWER_CACHE_RECENT: int = 500
+    # Chat statistics are read from a daily rollup rebuilt on this interval
+    # (app.services.chat_stats); "today" is live from Redis counters.
+    CHAT_STATS_REFRESH_MINUTES: int = 5
 
     # Scopus (article counters)
     SCOPUS_API_KEY: str = ""
@@ -47,6 +80,10 @@ class Settings(BaseSettings):
         "https://www.admin.aztu.edu.az"
     ]
     MAX_UPLOAD_SIZE_BYTES: int = 20 * 1024 * 1024  # 10 MB
+    # Resized WebP/AVIF copies of uploaded images (app.utils.image_variants)
+    IMAGE_VARIANTS_ENABLED: bool = True
+    IMAGE_VARIANT_WIDTHS: list[int] = [400, 800, 1600]
+    IMAGE_VARIANT_PROCESSES: int = 1
 
     # Security headers / CORS extras
     ALLOW_PRIVATE_NETWORK_ACCESS: bool = False
@@ -73,12 +110,19 @@ class Settings(BaseSettings):
     # IPv4 space is small enough to brute-force a known-salt digest back to an IP.
     VISIT_HASH_SALT: str = ""
     SITE_VISIT_RETENTION_DAYS: int = 400
+    # Page views are buffered in Redis and written to Postgres on this interval
+    # (app.services.analytics.flush_visit_buffer).
+    VISIT_FLUSH_INTERVAL_SECONDS: int = 30
 
     # RBAC
     # "audit"  — denials are logged and recorded, the request still proceeds
     # "enforce" — denials return 403
     PERMISSION_ENFORCEMENT_MODE: str = "audit"
     AUDIT_LOG_RETENTION_DAYS: int = 365
+    # Activity-log rows are queued per worker and bulk-inserted on this interval
+    # (app.core.audit_writer); the queue holds at most this many unwritten rows.
+    AUDIT_FLUSH_INTERVAL_MS: int = 250
+    AUDIT_QUEUE_MAX_ROWS: int = 10000
     # First-boot override: this username alone becomes super_admin, every other
     # role-less admin becomes viewer. Unset -> all role-less admins are promoted.
     RBAC_BOOTSTRAP_SUPERADMIN: str | None = None
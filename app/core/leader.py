@@ -0,0 +1,130 @@
+"""Leader election across uvicorn workers.
+
+The container runs ``uvicorn --workers 4`` and every worker runs the lifespan,
+so the boot-time sync (RBAC catalogue, admin seed, Elasticsearch indices, chat
+knowledge) and the APScheduler jobs (monthly scrape, nightly purges, visit
+flush) used to run four times over, concurrently. Now only the worker holding
+the Redis lease ``leader:app`` does them; the others go straight to serving.
+
+The lease lasts LEADER_LEASE_SECONDS and is renewed every third of that. A
+follower checks on the same cadence and takes over a lease its leader stopped
+renewing (a crashed or restarted worker), and the scheduler moves with it.
+A lease left by a killed process, or by the old instance of a rolling deploy,
+can outlive every new worker's boot, so whoever takes it over also runs the
+boot-time sync, once per process (``app.main._lead``).
+Shutdown releases the lease, so a successor does not have to wait it out.
+
+A worker that cannot reach Redis at boot leads, as every worker used to:
+doing the work twice is recoverable, never doing it is not. One that loses
+Redis while leading keeps leading; once Redis answers again, every worker
+but the lease holder steps down.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import secrets
+import socket
+from typing import Callable
+
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.core.redis_client import get_redis
+
+logger = get_logger("aztu.leader")
+
+LEADER_KEY = "leader:app"
+
+# Take the lease if it is free or already ours, and (re)start its clock.
+_CLAIM = """
+local holder = redis.call('GET', KEYS[1])
+if holder == ARGV[1] or not holder then
+    redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+    return 1
+end
+return 0
+"""
+_RELEASE = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+_identity = f"{socket.gethostname()}:{os.getpid()}:{secrets.token_hex(4)}"
+_leading = False
+_watcher: asyncio.Task | None = None
+
+
+def is_leader() -> bool:
+    return _leading
+
+
+async def _claim() -> bool:
+    redis = await get_redis()
+    lease_ms = int(settings.LEADER_LEASE_SECONDS * 1000)
+    return bool(await redis.eval(_CLAIM, 1, LEADER_KEY, _identity, lease_ms))
+
+
+async def elect_leader() -> bool:
+    """Claim the lease for this boot; whether this worker leads."""
+    global _leading
+    try:
+        _leading = await _claim()
+    except Exception as exc:
+        logger.warning("Leader election unavailable, leading in worker %s: %s", _identity, exc)
+        _leading = True
+        return True
+    logger.info("Worker %s is the %s", _identity, "leader" if _leading else "follower")
+    return _leading
+
+
+def _notify(callback: Callable[[], None], what: str) -> None:
+    try:
+        callback()
+    except Exception as exc:
+        logger.exception("Leader %s hook failed: %s", what, exc)
+
+
+async def _watch(on_elected: Callable[[], None], on_deposed: Callable[[], None]) -> None:
+    global _leading
+    while True:
+        await asyncio.sleep(settings.LEADER_LEASE_SECONDS / 3)
+        try:
+            claimed = await _claim()
+        except Exception as exc:
+            logger.warning("Leader lease check failed in worker %s: %s", _identity, exc)
+            continue
+        if claimed and not _leading:
+            _leading = True
+            logger.info("Worker %s took over as leader", _identity)
+            _notify(on_elected, "election")
+        elif not claimed and _leading:
+            _leading = False
+            logger.warning("Worker %s lost the leader lease, stepping down", _identity)
+            _notify(on_deposed, "deposition")
+
+
+async def start_leader_watch(on_elected: Callable[[], None], on_deposed: Callable[[], None]) -> None:
+    """Keep the lease (or contend for it); the hooks run on every change of role."""
+    global _watcher
+    _watcher = asyncio.create_task(_watch(on_elected, on_deposed), name="leader-watch")
+
+
+async def stop_leader_watch() -> None:
+    global _watcher, _leading
+    if _watcher is not None:
+        _watcher.cancel()
+        try:
+            await _watcher
+        except asyncio.CancelledError:
+            pass
+        _watcher = None
+    if _leading:
+        _leading = False
+        try:
+            redis = await get_redis()
+            await redis.eval(_RELEASE, 1, LEADER_KEY, _identity)
+        except Exception as exc:
+            logger.warning("Releasing the leader lease failed: %s", exc)
@@ -0,0 +1,40 @@
+import logging
+
+import httpx
+from openai import AsyncOpenAI
+
+from app.core.config import settings
+
+logger = logging.getLogger("aztu.openai")
+
+_openai_client: AsyncOpenAI | None = None
+
+
+def get_openai() -> AsyncOpenAI:
+    """Process-wide OpenAI client.
+
+    Every chat turn and history fold reuses the same pooled connections, so
+    only the first call per worker pays the TLS handshake to the API.
+    """
+    global _openai_client
+    if _openai_client is None:
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=50,
+                max_keepalive_connections=20,
+                keepalive_expiry=120,
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+        _openai_client = AsyncOpenAI(api_key=settings.OPEN_AI_KEY, http_client=http_client)
+    return _openai_client
+
+
+async def close_openai() -> None:
+    global _openai_client
+    if _openai_client is not None:
+        try:
+            await _openai_client.close()
+        except Exception as exc:
+            logger.warning("Error closing OpenAI client: %s", exc)
+        _openai_client = None
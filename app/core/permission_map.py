@@ -73,6 +73,7 @@ ROUTE_PERMISSIONS: Dict[Tuple[str, str], RouteRule] = {
         None, authenticated_only=True, audit_key="auth.password_changed"
     ),
     ("POST", "/api/chat/message"): RouteRule(None, public=True, no_audit=True),
+    ("POST", "/api/chat/message/stream"): RouteRule(None, public=True, no_audit=True),
     # Visitor tracking fires on every public page view: no auth (the site has
     # none) and no audit row, which would otherwise drown the activity log.
     ("POST", "/api/visits/track"): RouteRule(None, public=True, no_audit=True),
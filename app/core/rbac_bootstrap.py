@@ -25,6 +25,7 @@ from app.core.logger import get_logger
 from app.core.permissions import PERMISSION_CATALOGUE, SUPER_ADMIN_CODE, SYSTEM_ROLES
 from app.models.admin.admin_user import AdminUser
 from app.models.admin.role import Permission, Role, role_permissions
+from app.core.actor_cache import invalidate_all_actors
 from app.services.rbac import invalidate_role_cache
 
 logger = get_logger("aztu.rbac")
@@ -209,4 +210,5 @@ async def sync_rbac() -> None:
             raise
 
     invalidate_role_cache()
+    await invalidate_all_actors()
     logger.info("RBAC sync complete: %d permissions, %d system roles.", len(PERMISSION_CATALOGUE), len(SYSTEM_ROLES))
@@ -1,5 +1,8 @@
+from datetime import datetime, timezone
+
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
 from app.core.config import settings
 from app.core.logger import get_logger
@@ -12,7 +15,8 @@ scheduler = AsyncIOScheduler()
 def start_scheduler() -> None:
     from app.services.chatbot_scraper import scrape_all_sources
     from app.services.activity import purge_expired_activity
-    from app.services.analytics import purge_expired_site_visits
+    from app.services.analytics import flush_visit_buffer, purge_expired_site_visits
+    from app.services.chat_stats import refresh_chat_stats
 
     # Run on the 1st of every month at 03:00
     scheduler.add_job(
@@ -39,15 +43,40 @@ def start_scheduler() -> None:
         misfire_grace_time=3600,
     )
 
+    scheduler.add_job(
+        flush_visit_buffer,
+        trigger=IntervalTrigger(seconds=settings.VISIT_FLUSH_INTERVAL_SECONDS),
+        id="site_visit_buffer_flush",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+
+    # First run at start-up, so a fresh rollup table fills without waiting.
+    scheduler.add_job(
+        refresh_chat_stats,
+        trigger=IntervalTrigger(minutes=settings.CHAT_STATS_REFRESH_MINUTES),
+        id="chat_stats_rollup",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+        next_run_time=datetime.now(timezone.utc),
+    )
+
     scheduler.start()
     logger.info(
         "Scheduler started — knowledge scrape monthly on the 1st at 03:00, "
         "activity-log purge nightly at 03:30 (retention %d days), "
-        "site-visit purge nightly at 03:45 (retention %d days)",
+        "site-visit purge nightly at 03:45 (retention %d days), "
+        "visit buffer flush every %ds, chat stats rollup every %d min",
         settings.AUDIT_LOG_RETENTION_DAYS,
         settings.SITE_VISIT_RETENTION_DAYS,
+        settings.VISIT_FLUSH_INTERVAL_SECONDS,
+        settings.CHAT_STATS_REFRESH_MINUTES,
     )
 
 
 def stop_scheduler() -> None:
-    scheduler.shutdown(wait=False)
+    # Only the leader worker runs it (app.core.leader).
+    if scheduler.running:
+        scheduler.shutdown(wait=False)
@@ -0,0 +1,197 @@
+"""Static file serving for /static with long-lived caching.
+
+``save_upload`` names every file with 32 random hex characters and never writes
+to the same name twice, so those files (and their ``-<w>w`` image variants) are
+immutable: they are served with a one-year ``Cache-Control: immutable`` and an
+ETag of the file name, and Cloudflare and browsers never have to ask again.
+Anything else under static/ — the landing page, files uploaded under their
+original names before random naming — gets ``no-cache`` with an ETag of its
+content, so a re-request is a cheap 304 until the bytes actually change.
+
+Text assets can carry precompressed siblings (``<name>.br``, ``<name>.gz``),
+written by ``precompress`` at upload time or by
+``python -m app.scripts.precompress_static``; they are served as-is to clients
+that accept the encoding, so no worker compresses on the fly.
+
+Byte ranges and conditional requests are Starlette's ``FileResponse``; it hands
+the file to the server with ``http.response.pathsend`` (zero-copy) when the
+server supports it, and otherwise streams it in ``_CHUNK_SIZE`` reads.
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import re
+import stat
+from mimetypes import guess_type
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+try:
+    import brotli
+except ImportError:  # gzip siblings only
+    brotli = None
+
+logger = logging.getLogger("aztu.static")
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+# What save_upload generates: <32 hex>.<ext> and image variants <32 hex>-<w>w.<ext>.
+_IMMUTABLE_NAME = re.compile(r"^[0-9a-f]{32}(-\d+w)?\.[a-z0-9]+$")
+
+COMPRESSIBLE_TYPES = frozenset({
+    "text/html", "text/css", "text/plain", "text/csv", "text/xml",
+    "text/javascript", "application/javascript", "application/json",
+    "application/xml", "application/rtf", "text/rtf", "image/svg+xml",
+})
+# (Content-Encoding, sibling suffix), in order of preference.
+_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+# Larger than FileResponse's 64 KiB default: a slider video is tens of MB and
+# every read is a thread-pool round trip.
+_CHUNK_SIZE = 1024 * 1024
+_MAX_CACHED_ETAGS = 4096
+
+
+def media_type(path: str) -> str:
+    return guess_type(path)[0] or "text/plain"
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    accepted = set()
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        params = params.replace(" ", "")
+        if token and params not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            accepted.add(token.lower())
+    return accepted
+
+
+def precompress(path: str) -> None:
+    """Write ``.gz`` (and ``.br``, if brotli is installed) beside ``path``.
+
+    Siblings that would not be meaningfully smaller are not written. Blocking:
+    run it in a thread from async code.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    encoders = [(".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        encoders.insert(0, (".br", lambda data: brotli.compress(data, quality=9)))
+    for suffix, encode in encoders:
+        encoded = encode(raw)
+        if len(encoded) > len(raw) * 0.9:
+            continue
+        target = path + suffix
+        temp_path = os.path.join(os.path.dirname(target), f".{os.path.basename(target)}.part")
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(encoded)
+            os.replace(temp_path, target)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+
+def compressed_siblings(path: str) -> list[str]:
+    return [path + suffix for _, suffix in _ENCODINGS]
+
+
+class CachedStaticFiles(StaticFiles):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # full path -> (mtime_ns, size, etag) for files hashed by content
+        self._etags: dict[str, tuple[int, int, str]] = {}
+        # full path -> {encoding: (sibling path, stat)}, refreshed per lookup
+        self._siblings: dict[str, dict[str, tuple[str, os.stat_result]]] = {}
+
+    def lookup_path(self, path: str) -> tuple[str, os.stat_result | None]:
+        # Runs in a worker thread (StaticFiles.get_response), so the file
+        # reads and stats that decide the headers happen off the event loop.
+        full_path, stat_result = super().lookup_path(path)
+        if stat_result is not None and stat.S_ISREG(stat_result.st_mode):
+            if not _IMMUTABLE_NAME.match(os.path.basename(full_path)):
+                self._content_etag(full_path, stat_result)
+            if media_type(full_path) in COMPRESSIBLE_TYPES:
+                self._siblings[full_path] = self._find_siblings(full_path, stat_result)
+        return full_path, stat_result
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        full_path = str(full_path)
+        name = os.path.basename(full_path)
+
+        if _IMMUTABLE_NAME.match(name):
+            etag = f'"{name}"'
+            cache_control = IMMUTABLE_CACHE_CONTROL
+        else:
+            etag = self._content_etag(full_path, stat_result)
+            cache_control = REVALIDATE_CACHE_CONTROL
+        headers = {"cache-control": cache_control}
+
+        serve_path, serve_stat = full_path, stat_result
+        siblings = self._siblings.get(full_path)
+        if siblings is not None:
+            headers["vary"] = "Accept-Encoding"
+            accepted = _accepted_encodings(request_headers.get("accept-encoding", ""))
+            for encoding, _ in _ENCODINGS:
+                if encoding in accepted and encoding in siblings:
+                    serve_path, serve_stat = siblings[encoding]
+                    headers["content-encoding"] = encoding
+                    # Each representation needs its own validator.
+                    etag = f'{etag[:-1]}-{encoding}"'
+                    break
+        headers["etag"] = etag
+
+        response = FileResponse(
+            serve_path,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type(full_path),
+            stat_result=serve_stat,
+        )
+        response.chunk_size = _CHUNK_SIZE
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def _content_etag(self, full_path: str, stat_result: os.stat_result) -> str:
+        cached = self._etags.get(full_path)
+        if cached is not None and cached[:2] == (stat_result.st_mtime_ns, stat_result.st_size):
+            return cached[2]
+        digest = hashlib.sha1()
+        with open(full_path, "rb") as f:
+            while chunk := f.read(_CHUNK_SIZE):
+                digest.update(chunk)
+        etag = f'"{digest.hexdigest()[:32]}"'
+        if len(self._etags) >= _MAX_CACHED_ETAGS:
+            self._etags.clear()
+        self._etags[full_path] = (stat_result.st_mtime_ns, stat_result.st_size, etag)
+        return etag
+
+    @staticmethod
+    def _find_siblings(full_path: str, stat_result: os.stat_result) -> dict[str, tuple[str, os.stat_result]]:
+        found = {}
+        for encoding, suffix in _ENCODINGS:
+            try:
+                sibling_stat = os.stat(full_path + suffix)
+            except OSError:
+                continue
+            # A sibling older than the file it was made from is stale.
+            if sibling_stat.st_mtime_ns >= stat_result.st_mtime_ns:
+                found[encoding] = (full_path + suffix, sibling_stat)
+        return found
@@ -0,0 +1,71 @@
+"""Postgres text search over translated names and titles (pg_trgm + tsvector).
+
+Each searchable column carries two GIN indexes, declared on the model with
+``text_search_indexes`` and created by ``migrations_admin_search.sql``:
+
+* ``<prefix>_trgm`` — trigrams, behind ``ILIKE '%term%'`` and ``term <% column``
+  (word similarity, which forgives a typo or a missing Azerbaijani letter);
+* ``<prefix>_fts``  — ``to_tsvector('simple', column)``, behind whole-word
+  matches in any order.
+
+The ``simple`` configuration neither stems nor drops stop words: there is no
+Azerbaijani dictionary, and one config has to serve both languages. Queries must
+build the document with ``ts_document`` so they match the index expression.
+"""
+
+from sqlalchemy import Index, func, literal, literal_column, or_, text
+
+TS_CONFIG = "simple"
+# Rendered inline, not bound: the planner only uses an expression index when the
+# query's expression is the same constant the index was built with.
+_CONFIG = literal_column(f"'{TS_CONFIG}'::regconfig")
+
+
+def text_search_indexes(prefix: str, column: str) -> tuple[Index, Index]:
+    """The trigram and full-text indexes on ``column``, for ``__table_args__``."""
+    return (
+        Index(
+            f"{prefix}_trgm",
+            column,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        ),
+        Index(
+            f"{prefix}_fts",
+            text(f"to_tsvector('{TS_CONFIG}', {column})"),
+            postgresql_using="gin",
+        ),
+    )
+
+
+def like_pattern(value: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally (Postgres uses
+    backslash as the default ILIKE escape character)."""
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def ts_document(column):
+    return func.to_tsvector(_CONFIG, column)
+
+
+def ts_query(term: str):
+    return func.plainto_tsquery(_CONFIG, term)
+
+
+def text_matches(column, term: str):
+    """``column`` contains ``term``, shares its words, or nearly does — each
+    branch answerable from one of the two indexes."""
+    return or_(
+        column.ilike(like_pattern(term)),
+        ts_document(column).op("@@")(ts_query(term)),
+        literal(term).op("<%")(column),
+    )
+
+
+def text_rank(column, term: str):
+    """Relevance of ``column`` to ``term``: word similarity plus full-text rank."""
+    return func.word_similarity(term, column) + func.ts_rank(
+        ts_document(column), ts_query(term)
+    )
+
@@ -1,16 +1,13 @@
+import asyncio
 import os
-import time
-import logging
 from contextlib import asynccontextmanager
 
 from fastapi import Depends, FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import HTMLResponse, JSONResponse
-from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi.errors import RateLimitExceeded
 from slowapi import _rate_limit_exceeded_handler
-from slowapi.middleware import SlowAPIMiddleware
 
 from app.core.config import settings
 from app.core.logger import get_logger
@@ -22,6 +19,8 @@ from app.core.startup import seed_admin_user
 from app.middleware.security_headers import SecurityHeadersMiddleware
 from app.middleware.api_key import PublicApiKeyMiddleware
 from app.middleware.audit_log import AuditLogMiddleware
+from app.middleware.rate_limit import RateLimitMiddleware
+from app.middleware.request_logging import RequestLoggingMiddleware
 
 logger = get_logger("aztu.api")
 
@@ -55,31 +54,101 @@ from app.api.v1.router.activity import router as activity_router
 from app.api.v1.router.visits import router as visits_router
 from app.api.v1.router.stats import router as stats_router
 from app.core.scheduler import start_scheduler, stop_scheduler
+from app.core.leader import elect_leader, is_leader, start_leader_watch, stop_leader_watch
+from app.core.database import AsyncSessionLocal
 from app.core.elasticsearch import get_es, close_es
-from app.services.search import ensure_indices
+from app.core.openai_client import get_openai, close_openai
+from app.core.static_files import CachedStaticFiles
+from app.core.audit_writer import start_activity_writer, stop_activity_writer
+from app.core.actor_cache import start_actor_listener, stop_actor_listener
+from app.services.search import ensure_indices, start_indexing_queue, stop_indexing_queue
+from app.services.chat_knowledge import sync_chat_knowledge
+from app.services.analytics import flush_visit_buffer
+from app.utils.image_variants import shutdown_variant_pool
+
+
+_boot_synced = False
+_takeover: asyncio.Task | None = None
+
+
+async def _lead() -> None:
+    """Become the leader: the boot-time sync, once per process, then the
+    scheduled jobs.
+
+    Runs at boot in the worker that wins the lease, and again in any worker
+    that takes it over later — after a crash or a rolling deploy the old
+    lease can outlive every new worker's boot, and the new release's
+    permissions and indices must still be synced by someone.
+    """
+    global _boot_synced
+    if not _boot_synced:
+        # Order matters: roles must exist before the seeded admin can be given
+        # the super_admin role.
+        await sync_rbac()
+        await seed_admin_user()
+        try:
+            es = await get_es()
+            await ensure_indices(es)
+        except Exception as exc:
+            logger.warning("Elasticsearch unavailable on startup: %s", exc)
+        async with AsyncSessionLocal() as db:
+            await sync_chat_knowledge(db)
+        _boot_synced = True
+    # The lease may have moved on while the sync ran.
+    if is_leader():
+        start_scheduler()
+
+
+async def _take_over() -> None:
+    try:
+        await _lead()
+    except Exception:
+        # Retried on this worker's next takeover; the jobs run regardless.
+        logger.exception("Boot-time sync failed on leader takeover")
+        if is_leader():
+            start_scheduler()
+
+
+def _on_elected() -> None:
+    # Beside the watch, not inside it: the lease keeps being renewed while the
+    # sync runs.
+    global _takeover
+    if _takeover is None or _takeover.done():
+        _takeover = asyncio.create_task(_take_over(), name="leader-takeover")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Order matters: roles/permissions must exist before the map is verified against
-    # the catalogue and before the seeded admin can be given the super_admin role.
-    await sync_rbac()
     verify_permission_map(app)
-    await seed_admin_user()
     # Surfaced at boot rather than only when a visitor gets an unexplained
     # failure — a missing key makes the chatbot 401 in milliseconds, which is
     # indistinguishable from any other 500 at the widget.
     if not settings.OPEN_AI_KEY:
         logger.warning("OPEN_AI_KEY is not set — the chatbot will not answer.")
-    start_scheduler()
-    try:
-        es = await get_es()
-        await ensure_indices(es)
-    except Exception as exc:
-        logger.warning("Elasticsearch unavailable on startup: %s", exc)
+    else:
+        get_openai()
+    # Boot-time sync and the scheduled jobs run in one worker; the rest serve.
+    # The watch renews the lease from here on, however long the sync takes.
+    leader = await elect_leader()
+    await start_leader_watch(on_elected=_on_elected, on_deposed=stop_scheduler)
+    if leader:
+        await _lead()
+    await start_indexing_queue()
+    await start_activity_writer()
+    await start_actor_listener()
     yield
+    await stop_actor_listener()
+    if _takeover is not None and not _takeover.done():
+        _takeover.cancel()
+    # Stopped before the lease is released, so no successor overlaps it.
     stop_scheduler()
+    await stop_leader_watch()
+    await stop_indexing_queue()
+    await stop_activity_writer()
+    await flush_visit_buffer()
     await close_es()
+    await close_openai()
+    await shutdown_variant_pool()
 
 
 app = FastAPI(
@@ -101,7 +170,7 @@ app = FastAPI(
 # consistently across all uvicorn workers.
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-app.add_middleware(SlowAPIMiddleware)
+app.add_middleware(RateLimitMiddleware)
 
 # ── Security headers ───────────────────────────────────────────────────────────
 app.add_middleware(SecurityHeadersMiddleware)
@@ -116,7 +185,8 @@ app.add_middleware(PublicApiKeyMiddleware)
 # Registered before CORS so that CORS stays the outermost layer and this sits
 # inside it: the audit row is written after the route has run and after
 # scope["route"] is set, but the response still passes back out through CORS.
-# Writes on its own session — an audit failure can never roll back a mutation.
+# Rows are queued for a background writer — an audit failure can never roll
+# back a mutation.
 app.add_middleware(AuditLogMiddleware)
 
 # ── CORS ───────────────────────────────────────────────────────────────────────
@@ -129,26 +199,9 @@ app.add_middleware(
 )
 
 
-# ── Request logging middleware ─────────────────────────────────────────────────
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    start = time.monotonic()
-    # slowapi's SlowAPIMiddleware unconditionally reads request.state.view_rate_limit
-    # to inject headers; if the limiter check is skipped (exempt route, early error)
-    # the attribute is never set and Starlette raises AttributeError. Pre-seed it.
-    request.state.view_rate_limit = None
-    response = await call_next(request)
-    elapsed_ms = (time.monotonic() - start) * 1000
-    level = logging.ERROR if response.status_code >= 500 else logging.DEBUG
-    logger.log(
-        level,
-        "%s %s %d %.1fms",
-        request.method,
-        request.url.path,
-        response.status_code,
-        elapsed_ms,
-    )
-    return response
+# ── Request logging ────────────────────────────────────────────────────────────
+# Outermost, so the logged duration covers every other layer.
+app.add_middleware(RequestLoggingMiddleware)
 
 
 from fastapi.encoders import jsonable_encoder
@@ -196,7 +249,7 @@ async def global_exception_handler(request: Request, exc: Exception):
 
 # ── Static files (absolute path prevents working-directory issues) ─────────────
 _static_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "static"))
-app.mount("/static", StaticFiles(directory=_static_dir), name="static")
+app.mount("/static", CachedStaticFiles(directory=_static_dir), name="static")
 
 # ── Routers ────────────────────────────────────────────────────────────────────
 app.include_router(auth_router,          prefix="/api/auth",          tags=["Auth"])
@@ -1,8 +1,8 @@
 from urllib.parse import urlparse
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.core.config import settings
 
@@ -25,45 +25,60 @@ def _host_is_exempt(header_value: str | None) -> bool:
     return host_lower in {h.lower() for h in settings.PUBLIC_API_KEY_EXEMPT_HOSTS}
 
 
-class PublicApiKeyMiddleware(BaseHTTPMiddleware):
+class PublicApiKeyMiddleware:
     """
     Require X-API-Key on GET requests, unless the request originates from a
     whitelisted domain (aztu.edu.az). Non-GET endpoints are protected by the
     JWT `require_admin` dependency on each route and are not handled here.
+
+    Pure ASGI: a rejected request is answered here without ever reaching the
+    app, and an accepted one is passed on untouched.
     """
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        if request.method != "GET":
-            return await call_next(request)
-
-        path = request.url.path
-        if path in _EXEMPT_PATHS or path.startswith(_EXEMPT_PREFIXES):
-            return await call_next(request)
-
-        # Allow randomized docs paths if configured.
-        if settings.DOCS_TOKEN and (
-            path == f"/docs-{settings.DOCS_TOKEN}"
-            or path == f"/redoc-{settings.DOCS_TOKEN}"
-            or path == f"/openapi-{settings.DOCS_TOKEN}.json"
-        ):
-            return await call_next(request)
-
-        if _host_is_exempt(request.headers.get("origin")) or _host_is_exempt(
-            request.headers.get("referer")
-        ):
-            return await call_next(request)
-
-        if not settings.PUBLIC_API_KEY:
-            return JSONResponse(
-                status_code=503,
-                content={"status_code": 503, "detail": "Public API key not configured"},
-            )
-
-        provided = request.headers.get("x-api-key")
-        if not provided or provided != settings.PUBLIC_API_KEY:
-            return JSONResponse(
-                status_code=401,
-                content={"status_code": 401, "detail": "Missing or invalid API key"},
-            )
-
-        return await call_next(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        rejection = _check(scope)
+        if rejection is not None:
+            await rejection(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+def _check(scope: Scope) -> JSONResponse | None:
+    """The response rejecting this GET, or ``None`` to let it through."""
+    path = scope["path"]
+    if path in _EXEMPT_PATHS or path.startswith(_EXEMPT_PREFIXES):
+        return None
+
+    # Allow randomized docs paths if configured.
+    if settings.DOCS_TOKEN and (
+        path == f"/docs-{settings.DOCS_TOKEN}"
+        or path == f"/redoc-{settings.DOCS_TOKEN}"
+        or path == f"/openapi-{settings.DOCS_TOKEN}.json"
+    ):
+        return None
+
+    headers = Headers(scope=scope)
+    if _host_is_exempt(headers.get("origin")) or _host_is_exempt(headers.get("referer")):
+        return None
+
+    if not settings.PUBLIC_API_KEY:
+        return JSONResponse(
+            status_code=503,
+            content={"status_code": 503, "detail": "Public API key not configured"},
+        )
+
+    provided = headers.get("x-api-key")
+    if not provided or provided != settings.PUBLIC_API_KEY:
+        return JSONResponse(
+            status_code=401,
+            content={"status_code": 401, "detail": "Missing or invalid API key"},
+        )
+
+    return None
@@ -7,30 +7,26 @@ mutation.
 Two properties this middleware must never violate:
 
 1. **An audit failure can never break or roll back a successful mutation.** The row
-   is written on its own ``AsyncSessionLocal()``, never the request's session, and
-   the whole block is wrapped in ``except Exception``. The mutation has already been
-   committed and the response already produced by the time anything here runs.
+   is queued for ``app.core.audit_writer``, which writes it on its own sessions,
+   never the request's, and the whole block is wrapped in ``except Exception``. The
+   mutation has already been committed and the response already sent by the time
+   anything here runs.
 2. **The request body is never read here.** The only request-derived data is the
    per-route ``label_fields`` whitelist the dependency already copied, so a password
    cannot reach this table even if a future route rule asks for one.
 """
 
+import uuid
 from typing import Optional
 
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
 from starlette.requests import Request
-from starlette.responses import Response
-
-import uuid
-
-from starlette.responses import Response as PlainResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core import audit_payload
-from app.core.audit_labels import label_from_fields, resolve_target_label
 from app.core.auth_dependency import AUDIT_SCOPE_KEY, SECRET_FIELD_NAMES
-from app.core.database import AsyncSessionLocal
+from app.core.audit_writer import enqueue_activity
 from app.core.logger import get_logger
-from app.models.admin.activity_log import AdminActivityLog
 
 logger = get_logger("aztu.audit")
 
@@ -87,57 +83,87 @@ def _safe_meta(label_fields: Optional[dict]) -> Optional[dict]:
     return meta or None
 
 
-class AuditLogMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next) -> Response:
+class AuditLogMiddleware:
+    """Pure ASGI: response messages are passed on as they arrive.
+
+    JSON bodies are teed — the chunks sent to the client are kept by reference
+    and parsed only after the last one went out — and the row itself is handed
+    to the batched writer (app.core.audit_writer), so neither buffering nor a
+    DB round trip sits between the mutation and its response.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request = Request(scope)
         if _should_skip(request):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Correlates this log row with the application log and the caller's own
         # records. The column existed but nothing ever populated it.
         request_id = str(uuid.uuid4())
-        request.scope["aztu_request_id"] = request_id
-
-        response = await call_next(request)
+        scope["aztu_request_id"] = request_id
+
+        status_code = 500
+        chunks: Optional[list[bytes]] = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, chunks
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                # Only JSON is captured; anything else streams through untouched
+                # so a download is never held in memory.
+                content_type = (headers.get("content-type") or "").lower()
+                if any(ct in content_type for ct in CAPTURED_RESPONSE_TYPES):
+                    chunks = []
+            elif message["type"] == "http.response.body" and chunks is not None:
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
 
-        # `call_next` hands back a streaming response, so the body has to be
-        # drained to be logged — and then handed on as a fresh response, or the
-        # client receives nothing. Only JSON is drained; anything else is passed
-        # through untouched so downloads keep streaming.
         response_body = None
-        content_type = (response.headers.get("content-type") or "").lower()
-        if any(ct in content_type for ct in CAPTURED_RESPONSE_TYPES):
+        if chunks:
             try:
-                chunks = [chunk async for chunk in response.body_iterator]
-                raw = b"".join(chunks)
-                response_body = audit_payload.from_json_bytes(raw)
-                response = PlainResponse(
-                    content=raw,
-                    status_code=response.status_code,
-                    headers=dict(response.headers),
-                    media_type=response.media_type,
-                )
+                response_body = audit_payload.from_json_bytes(b"".join(chunks))
             except Exception:
-                logger.exception("Audit could not buffer the response body")
-
-        response.headers["X-Request-ID"] = request_id
+                logger.exception("Audit could not read the response body")
 
         try:
-            await self._record(request, response, response_body, request_id)
+            self._record(request, status_code, response_body, request_id)
         except Exception:
             logger.exception(
                 "Audit log write failed for %s %s", request.method, request.url.path
             )
-        return response
 
-    async def _record(
+        # In audit mode a "denied" mutation still went through, so only the
+        # status decides whether the dashboard's cached counts moved.
+        audit = scope.get(AUDIT_SCOPE_KEY)
+        if audit is not None and 200 <= status_code < 400:
+            # Imported here: the service pulls in every content model, which must
+            # not be mapped before app.main has imported them in order.
+            from app.services.dashboard import invalidate_dashboard
+
+            try:
+                await invalidate_dashboard(audit.get("domain"))
+            except Exception:
+                logger.exception("Dashboard cache invalidation failed")
+
+    def _record(
         self,
         request: Request,
-        response: Response,
+        status_code: int,
         response_body=None,
         request_id: Optional[str] = None,
     ) -> None:
         audit = request.scope.get(AUDIT_SCOPE_KEY)
-        status_code = response.status_code
         path = request.url.path
 
         is_failed_login = path == LOGIN_PATH and status_code == 401
@@ -169,8 +195,6 @@ class AuditLogMiddleware(BaseHTTPMiddleware):
             username = (audit.get("label_fields") or {}).get("username")
         username = (username or UNKNOWN_USERNAME)[:USERNAME_MAX_LENGTH]
 
-        target_type = audit.get("target_type")
-        target_id = audit.get("target_id")
         label_fields = audit.get("label_fields") or {}
 
         route = request.scope.get("route")
@@ -180,32 +204,26 @@ class AuditLogMiddleware(BaseHTTPMiddleware):
         if user_agent:
             user_agent = user_agent[:USER_AGENT_MAX_LENGTH]
 
-        async with AsyncSessionLocal() as db:
-            target_label = None
-            if not denied:
-                target_label = await resolve_target_label(db, target_type, target_id)
-            if target_label is None:
-                target_label = label_from_fields(_safe_meta(label_fields))
-
-            row = AdminActivityLog(
-                admin_user_id=audit.get("actor_id"),
-                admin_username=username,
-                action_key=action_key,
-                domain=audit.get("domain") or action_key.partition(".")[0],
-                method=request.method,
-                path=path,
-                route_template=route_template,
-                target_type=target_type,
-                target_id=target_id,
-                target_label=target_label,
-                status_code=status_code,
-                outcome=outcome,
-                ip=_client_ip(request),
-                user_agent=user_agent,
-                request_id=request_id,
-                request_body=audit.get("request_body"),
-                response_body=response_body,
-                meta=_safe_meta(label_fields),
-            )
-            db.add(row)
-            await db.commit()
+        enqueue_activity(
+            {
+                "admin_user_id": audit.get("actor_id"),
+                "admin_username": username,
+                "action_key": action_key,
+                "domain": audit.get("domain") or action_key.partition(".")[0],
+                "method": request.method,
+                "path": path,
+                "route_template": route_template,
+                "target_type": audit.get("target_type"),
+                "target_id": audit.get("target_id"),
+                "status_code": status_code,
+                "outcome": outcome,
+                "ip": _client_ip(request),
+                "user_agent": user_agent,
+                "request_id": request_id,
+                "request_body": audit.get("request_body"),
+                "response_body": response_body,
+                "meta": _safe_meta(label_fields),
+            },
+            resolve_label=not denied,
+            fallback_fields=_safe_meta(label_fields),
+        )
@@ -0,0 +1,55 @@
+"""Global rate limits (slowapi's ``default_limits``) as a pure ASGI middleware.
+
+Replaces ``SlowAPIMiddleware``, a ``BaseHTTPMiddleware``. slowapi's own
+``SlowAPIASGIMiddleware`` is not used either: it re-sends the
+``http.response.start`` message before every body chunk, which breaks any
+streamed response (the chat SSE endpoint, large static files). The checks
+themselves are slowapi's, so exemptions and per-route ``@limiter.limit``
+decorators behave exactly as before.
+"""
+
+from slowapi import Limiter
+from slowapi.middleware import _find_route_handler, _should_exempt, async_check_limits
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class RateLimitMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        app = scope["app"]
+        limiter: Limiter = app.state.limiter
+        if not limiter.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        handler = _find_route_handler(app.routes, scope)
+        if _should_exempt(limiter, handler):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive=receive)
+        error_response, inject_headers = await async_check_limits(limiter, request, handler, app)
+        if error_response is not None:
+            await error_response(scope, receive, send)
+            return
+        if not inject_headers:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                limiter._inject_asgi_headers(
+                    MutableHeaders(scope=message),
+                    getattr(request.state, "view_rate_limit", None),
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
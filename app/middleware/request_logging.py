@@ -0,0 +1,51 @@
+import logging
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logger import get_logger
+
+logger = get_logger("aztu.api")
+
+
+class RequestLoggingMiddleware:
+    """Logs method, path, status and duration of every request.
+
+    5xx responses are logged at ERROR, everything else at DEBUG.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.monotonic()
+        # slowapi's route decorators read request.state.view_rate_limit to
+        # inject headers; if the limiter check is skipped (exempt route, early
+        # error) the attribute is never set and Starlette raises
+        # AttributeError. Pre-seed it.
+        scope.setdefault("state", {})["view_rate_limit"] = None
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed_ms = (time.monotonic() - start) * 1000
+            level = logging.ERROR if status_code >= 500 else logging.DEBUG
+            logger.log(
+                level,
+                "%s %s %d %.1fms",
+                scope["method"],
+                scope["path"],
+                status_code,
+                elapsed_ms,
+            )
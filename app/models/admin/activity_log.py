@@ -3,6 +3,7 @@ from datetime import datetime, timezone
 from sqlalchemy import (
     Column,
     BigInteger,
+    Computed,
     Integer,
     String,
     Text,
@@ -11,9 +12,17 @@ from sqlalchemy import (
     Index,
 )
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred
 
 from app.core.database import Base
 
+# The fields the log's free-text filter searches, one per line so a term cannot
+# match across two of them. Kept by Postgres on every insert.
+SEARCH_TEXT_SQL = (
+    "admin_username || E'\\n' || action_key || E'\\n' || path"
+    " || E'\\n' || coalesce(target_label, '')"
+)
+
 
 class AdminActivityLog(Base):
     """One row per audited mutation.
@@ -61,12 +70,20 @@ class AdminActivityLog(Base):
         DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc)
     )
 
+    # Filter-only (trigram-indexed below); never loaded with the row.
+    search_text = deferred(Column(Text, Computed(SEARCH_TEXT_SQL, persisted=True)))
+
     # Names mirror migrations_all_models.sql exactly — that file, not this model,
     # is the schema of record.
     __table_args__ = (
         Index("ix_activity_created_at", created_at.desc()),
+        Index("ix_activity_created_id", created_at.desc(), id.desc()),
         Index("ix_activity_admin_created", admin_user_id, created_at.desc()),
         Index("ix_activity_action", action_key),
         Index("ix_activity_domain", domain),
         Index("ix_activity_target", target_type, target_id),
+        Index(
+            "ix_activity_search_trgm", search_text,
+            postgresql_using="gin", postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
     )
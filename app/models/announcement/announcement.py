@@ -5,7 +5,8 @@ from sqlalchemy import (
     DateTime,
     Date,
     func,
-    Boolean
+    Boolean,
+    Index
 )
 from app.core.database import Base
 from sqlalchemy.orm import relationship
@@ -20,4 +21,12 @@ class Announcement(Base):
     is_active = Column(Boolean, nullable=False, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    published_date = Column(Date, nullable=True)
\ No newline at end of file
+    published_date = Column(Date, nullable=True)
+
+    __table_args__ = (
+        # Keyset pagination (app.services.announcement._ANNOUNCEMENT_ORDER).
+        Index(
+            "ix_announcement_feed_order",
+            display_order, published_date.desc().nullslast(), id.desc(),
+        ),
+    )
@@ -7,9 +7,14 @@ from sqlalchemy import (
     String
 )
 from app.core.database import Base
+from app.core.text_search import text_search_indexes
 
 class AnnouncementTranslation(Base):
     __tablename__ = "announcement_translation"
+    __table_args__ = (
+        # Admin search (app.services.admin_search).
+        *text_search_indexes("ix_announcement_translation_title", "title"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     announcement_id = Column(Integer, nullable=False)
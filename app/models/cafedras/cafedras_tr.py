@@ -1,4 +1,5 @@
 from app.core.database import Base
+from app.core.text_search import text_search_indexes
 from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
 from sqlalchemy.orm import relationship
 
@@ -6,6 +7,8 @@ class CafedraTr(Base):
     __tablename__ = "cafedras_tr"
     __table_args__ = (
         UniqueConstraint("cafedra_code", "lang_code", name="uq_cafedras_tr_code_lang"),
+        # Admin search (app.services.admin_search).
+        *text_search_indexes("ix_cafedras_tr_name", "cafedra_name"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
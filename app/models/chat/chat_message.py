@@ -1,11 +1,22 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
 
 class ChatMessage(Base):
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        # Serves the chatbot's "newest N messages of a session" window.
+        Index("ix_chat_messages_session_created", "session_id", "created_at"),
+        # Per-day message counts of the stats rollup (app.services.chat_stats).
+        Index("ix_chat_messages_created", "created_at"),
+        # Transcript search in the admin session list (app.services.chat_admin).
+        Index(
+            "ix_chat_messages_content_trgm", "content",
+            postgresql_using="gin", postgresql_ops={"content": "gin_trgm_ops"},
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     session_id = Column(String(36), ForeignKey("chat_sessions.session_id", ondelete="CASCADE"), nullable=False, index=True)
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -12,5 +12,15 @@ class ChatSession(Base):
     ip_address = Column(String(45), nullable=False)
     started_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
     last_active_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    # Rolling summary of the turns that fell out of the prompt window, and the
+    # id of the newest message folded into it (app.services.chat).
+    summary = Column(Text, nullable=True)
+    summarized_through_id = Column(Integer, nullable=True)
 
     messages = relationship("ChatMessage", back_populates="session", order_by="ChatMessage.created_at")
+
+    __table_args__ = (
+        # Keyset pagination of the admin session list, one per sortable column.
+        Index("ix_chat_sessions_last_active_id", last_active_at.desc(), id.desc()),
+        Index("ix_chat_sessions_started_id", started_at.desc(), id.desc()),
+    )
@@ -0,0 +1,37 @@
+from sqlalchemy import CHAR, Column, Date, Index, Integer
+
+from app.core.database import Base
+
+
+class ChatStatsDaily(Base):
+    """Chatbot activity rolled up per UTC day (app.services.chat_stats).
+
+    sessions and unique_ips count the sessions started that day; messages count
+    the messages written that day; new_ips counts the visitors never seen on an
+    earlier day, so their sum is the all-time unique count.
+    """
+
+    __tablename__ = "chat_stats_daily"
+
+    day = Column(Date, primary_key=True)
+    sessions = Column(Integer, nullable=False, default=0, server_default="0")
+    messages = Column(Integer, nullable=False, default=0, server_default="0")
+    unique_ips = Column(Integer, nullable=False, default=0, server_default="0")
+    new_ips = Column(Integer, nullable=False, default=0, server_default="0")
+
+
+class ChatStatsVisitor(Base):
+    """One row per (day, visitor) — distinct visitors over any span of days.
+
+    visitor_hash is sha256(salt + client IP); the IP itself is not copied here.
+    """
+
+    __tablename__ = "chat_stats_visitors"
+
+    day = Column(Date, primary_key=True)
+    visitor_hash = Column(CHAR(64), primary_key=True)
+
+    __table_args__ = (
+        # "Seen before this day?" when counting new visitors.
+        Index("ix_chat_stats_visitors_hash_day", "visitor_hash", "day"),
+    )
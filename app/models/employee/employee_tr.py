@@ -1,4 +1,5 @@
 from app.core.database import Base
+from app.core.text_search import text_search_indexes
 from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
 from sqlalchemy.orm import relationship
 
@@ -7,6 +8,8 @@ class EmployeeTr(Base):
     __tablename__ = "employee_tr"
     __table_args__ = (
         UniqueConstraint("employee_code", "lang_code", name="uq_employee_tr_code_lang"),
+        # Admin search (app.services.admin_search).
+        *text_search_indexes("ix_employee_tr_full_name", "full_name"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
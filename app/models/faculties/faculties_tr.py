@@ -1,4 +1,5 @@
 from app.core.database import Base
+from app.core.text_search import text_search_indexes
 from sqlalchemy import Column, DateTime, Integer, String, Text, UniqueConstraint
 
 
@@ -6,6 +7,8 @@ class FacultyTr(Base):
     __tablename__ = "faculties_tr"
     __table_args__ = (
         UniqueConstraint("faculty_code", "lang_code", name="uq_faculties_tr_code_lang"),
+        # Admin search (app.services.admin_search).
+        *text_search_indexes("ix_faculties_tr_name", "faculty_name"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
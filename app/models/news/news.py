@@ -1,6 +1,6 @@
 from app.core.database import Base
 from sqlalchemy.orm import relationship
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, func, Boolean, JSON
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, func, Boolean, JSON, Index, text
 
 class News(Base):
     __tablename__ = "news"
@@ -16,3 +16,13 @@ class News(Base):
     cafedra_code = Column(String(50), nullable=True)
     created_at = Column(DateTime(timezone=True), nullable=False)
     updated_at = Column(DateTime(timezone=True))
+
+    __table_args__ = (
+        # Keyset pagination of the news lists (app.services.news._NEWS_ORDER).
+        Index("ix_news_feed_order", display_order, created_at.desc(), id.desc()),
+        Index(
+            "ix_news_public_feed_order",
+            display_order, created_at.desc(), id.desc(),
+            postgresql_where=text("is_active and show_in_all_news"),
+        ),
+    )
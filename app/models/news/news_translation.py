@@ -1,8 +1,13 @@
 from app.core.database import Base
+from app.core.text_search import text_search_indexes
 from sqlalchemy import Column, Integer, String, Text
 
 class NewsTranslation(Base):
     __tablename__ = "news_translation"
+    __table_args__ = (
+        # Admin search (app.services.admin_search).
+        *text_search_indexes("ix_news_translation_title", "title"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     news_id = Column(Integer, nullable=False)
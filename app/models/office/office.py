@@ -11,6 +11,7 @@ keyed by ``lang_code``.
 """
 
 from app.core.database import Base
+from app.core.text_search import text_search_indexes
 from sqlalchemy import (
     Boolean,
     Column,
@@ -88,6 +89,8 @@ class OfficeTr(Base):
     __tablename__ = "office_tr"
     __table_args__ = (
         UniqueConstraint("office_id", "lang_code", name="uq_office_tr_office_lang"),
+        # Admin search (app.services.admin_search).
+        *text_search_indexes("ix_office_tr_name", "name"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
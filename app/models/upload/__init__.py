@@ -0,0 +1,3 @@
+from app.models.upload.upload_blob import UploadBlob
+
+__all__ = ["UploadBlob"]
@@ -0,0 +1,23 @@
+from sqlalchemy import BigInteger, CHAR, Column, DateTime, Integer, String, func
+
+from app.core.database import Base
+
+
+class UploadBlob(Base):
+    """One stored upload, shared by every upload of the same bytes.
+
+    ``path`` is relative to app/static. ``ref_count`` is the number of
+    ``save_upload`` results still in use; ``safe_delete_file`` removes the
+    file once it reaches zero.
+    """
+
+    __tablename__ = "upload_blobs"
+
+    sha256 = Column(CHAR(64), primary_key=True)
+    # Part of the key: the text formats are typed by extension, so the same
+    # bytes uploaded as .csv and as .txt are served differently.
+    extension = Column(String(10), primary_key=True)
+    path = Column(String(512), nullable=False, unique=True)
+    size = Column(BigInteger, nullable=False)
+    ref_count = Column(Integer, nullable=False, default=1, server_default="1")
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -0,0 +1,80 @@
+"""Render responsive variants for images uploaded before the pipeline existed.
+
+Usage:
+    python -m app.scripts.generate_image_variants                   # every image under static/
+    python -m app.scripts.generate_image_variants --dir news        # one upload directory
+    python -m app.scripts.generate_image_variants --force           # re-render existing sets
+    python -m app.scripts.generate_image_variants --processes 4
+
+Images that already have a manifest are skipped unless --force is given, so
+the script can be rerun after an interrupted pass. Variants themselves are
+never treated as originals.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from app.core.config import settings
+from app.utils.file_upload import ALLOWED_IMAGE_MIMES, STATIC_BASE
+from app.utils.image_variants import manifest_path_for, pillow_available, render_variants
+
+logger = logging.getLogger("aztu.scripts.image_variants")
+
+_IMAGE_EXTENSIONS = {f".{ext}" for ext in ALLOWED_IMAGE_MIMES.values()} | {".jpeg"}
+_VARIANT_NAME = re.compile(r"-\d+w\.(webp|avif)$")
+
+
+def _originals(root: str, force: bool) -> list[str]:
+    paths = []
+    for directory, _, files in os.walk(root):
+        for name in files:
+            if name.startswith(".") or _VARIANT_NAME.search(name):
+                continue
+            if os.path.splitext(name)[1].lower() not in _IMAGE_EXTENSIONS:
+                continue
+            path = os.path.join(directory, name)
+            if force or not os.path.exists(manifest_path_for(path)):
+                paths.append(path)
+    return sorted(paths)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dir", help="upload directory below static/, e.g. news")
+    parser.add_argument("--force", action="store_true", help="re-render images that already have variants")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    if not pillow_available():
+        return 1
+
+    root = os.path.abspath(os.path.join(STATIC_BASE, args.dir or ""))
+    if os.path.commonpath([STATIC_BASE, root]) != STATIC_BASE or not os.path.isdir(root):
+        logger.error("Not an upload directory: %s", args.dir)
+        return 1
+
+    paths = _originals(root, args.force)
+    logger.info("Rendering variants for %d images under %s", len(paths), root)
+    widths = list(settings.IMAGE_VARIANT_WIDTHS)
+    failed = 0
+    with ProcessPoolExecutor(max_workers=max(1, args.processes)) as pool:
+        futures = {pool.submit(render_variants, path, widths): path for path in paths}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as exc:
+                failed += 1
+                logger.warning("Failed %s: %s", futures[future], exc)
+
+    logger.info("Done: %d rendered, %d failed", len(paths) - failed, failed)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
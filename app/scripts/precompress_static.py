@@ -0,0 +1,56 @@
+"""Write .br/.gz siblings for text files already under static/.
+
+Usage:
+    python -m app.scripts.precompress_static            # missing or stale siblings
+    python -m app.scripts.precompress_static --force    # rewrite them all
+
+New uploads are precompressed by ``save_upload``; this covers the landing page
+and files uploaded before that. A sibling older than its file is stale and is
+rewritten.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+
+from app.core.static_files import COMPRESSIBLE_TYPES, media_type, compressed_siblings, precompress
+from app.utils.file_upload import STATIC_BASE
+
+logger = logging.getLogger("aztu.scripts.precompress_static")
+
+
+def _needs_siblings(path: str) -> bool:
+    mtime = os.stat(path).st_mtime_ns
+    siblings = [p for p in compressed_siblings(path) if os.path.exists(p)]
+    return not siblings or any(os.stat(p).st_mtime_ns < mtime for p in siblings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--force", action="store_true", help="rewrite existing siblings")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    written = failed = 0
+    for directory, _, files in os.walk(STATIC_BASE):
+        for name in files:
+            path = os.path.join(directory, name)
+            if name.startswith(".") or media_type(path) not in COMPRESSIBLE_TYPES:
+                continue
+            if not args.force and not _needs_siblings(path):
+                continue
+            try:
+                precompress(path)
+                written += 1
+            except OSError as exc:
+                failed += 1
+                logger.warning("Failed %s: %s", path, exc)
+
+    logger.info("Done: %d precompressed, %d failed", written, failed)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,6 +4,22 @@ Usage:
     python -m app.scripts.reindex                  # rebuild all types
     python -m app.scripts.reindex --type news      # one type only
     python -m app.scripts.reindex --type news --limit 100
+    python -m app.scripts.reindex --bulk           # batched, concurrent pipeline
+    python -m app.scripts.reindex --swap           # --bulk into new indices, then
+                                                   # atomically repoint the aliases
+
+--bulk streams each type's rows in batches with their translations preloaded
+and ships them through ``async_streaming_bulk``; up to ``--concurrency`` types
+run at once, each in its own DB session. It writes into the live indices.
+
+--swap is the zero-downtime variant: every (type, language) pair is built into
+a fresh ``<index>_<timestamp>`` index while search keeps serving the old one.
+Only when every type succeeded are the per-type names (``index_name``) and the
+language search aliases (``alias_name``) moved over in one ``_aliases`` call;
+the previous indices are then deleted. On any failure the new indices are
+deleted and nothing is switched. Edits saved while a swap runs may miss the new
+index if their row was already read — the indexing queue writes through the
+alias, so re-save or rerun if that matters.
 """
 
 from __future__ import annotations
@@ -11,7 +27,10 @@ from __future__ import annotations
 import argparse
 import asyncio
 import logging
+from datetime import datetime, timezone
 
+from elasticsearch import NotFoundError
+from elasticsearch.helpers import async_streaming_bulk
 from sqlalchemy import select
 
 from app.core.database import AsyncSessionLocal
@@ -29,7 +48,14 @@ from app.services.search import (
     reindex_employee,
     reindex_research_institute,
 )
-from app.services.search.service import drop_indices
+from app.services.search.mappings import LANG_TO_ANALYZER, index_settings
+from app.services.search.service import (
+    SUPPORTED_LANGS,
+    alias_name,
+    drop_indices,
+    index_name,
+    iter_doc_batches,
+)
 
 logger = logging.getLogger("aztu.reindex")
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
@@ -100,6 +126,125 @@ async def reindex_type(es, db, doc_type: str, limit: int | None = None) -> int:
     return len(ids)
 
 
+# ── Bulk pipeline ────────────────────────────────────────────────────────────
+
+async def _bulk_actions_for(doc_type: str, db, batch_size: int, limit: int | None,
+                            targets: dict[str, str] | None, counter: list[int]):
+    """Stream ``_bulk`` actions for every row of ``doc_type``.
+
+    ``targets`` maps language -> fresh index to write into (swap mode); by
+    default the live per-type names are used.
+    """
+    async for batch in iter_doc_batches(db, doc_type, batch_size=batch_size, limit=limit):
+        for ident, docs in batch:
+            counter[0] += 1
+            for lang, doc in docs.items():
+                target = targets[lang] if targets else index_name(doc_type, lang)
+                if doc is not None:
+                    yield {"_op_type": "index", "_index": target, "_id": str(ident), "_source": doc}
+                elif not targets:
+                    # A live index may hold a stale doc; a fresh one cannot.
+                    yield {"_op_type": "delete", "_index": target, "_id": str(ident)}
+
+
+async def bulk_reindex_type(es, doc_type: str, batch_size: int, limit: int | None,
+                            targets: dict[str, str] | None = None) -> int:
+    counter = [0]
+    failed = 0
+    async with AsyncSessionLocal() as db:
+        async for ok, item in async_streaming_bulk(
+            es,
+            _bulk_actions_for(doc_type, db, batch_size, limit, targets, counter),
+            chunk_size=batch_size,
+            max_retries=3,
+            raise_on_error=False,
+            raise_on_exception=True,
+            yield_ok=False,
+        ):
+            if not ok:
+                (op, result), = item.items()
+                if op == "delete" and result.get("status") == 404:
+                    continue
+                failed += 1
+                logger.warning("%s %s failed: %s", op, result.get("_id"), result.get("error"))
+    if failed:
+        raise RuntimeError(f"{doc_type}: {failed} bulk actions failed")
+    logger.info("Bulk reindexed %s: %d rows", doc_type, counter[0])
+    return counter[0]
+
+
+async def _run_bulk(es, types, args, targets_by_type=None) -> int:
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def one(doc_type: str) -> int:
+        async with semaphore:
+            targets = targets_by_type[doc_type] if targets_by_type else None
+            return await bulk_reindex_type(es, doc_type, args.batch_size, args.limit, targets)
+
+    return sum(await asyncio.gather(*(one(t) for t in types)))
+
+
+# ── Zero-downtime swap ───────────────────────────────────────────────────────
+
+async def _backing_indices(es, name: str) -> list[str]:
+    """Concrete indices behind ``name`` (an alias or an index); [] if absent."""
+    try:
+        return list((await es.indices.get(index=name)).keys())
+    except NotFoundError:
+        return []
+
+
+async def swap_reindex(es, types, args) -> int:
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+    targets_by_type = {
+        doc_type: {lang: f"{index_name(doc_type, lang)}_{stamp}" for lang in SUPPORTED_LANGS}
+        for doc_type in types
+    }
+    created: list[str] = []
+    try:
+        for doc_type, targets in targets_by_type.items():
+            for lang, new_index in targets.items():
+                body = index_settings(LANG_TO_ANALYZER.get(lang, "standard"))
+                # No refreshes while loading; the swap below refreshes once.
+                body["settings"]["index"]["refresh_interval"] = "-1"
+                await es.indices.create(index=new_index, body=body)
+                created.append(new_index)
+
+        total = await _run_bulk(es, types, args, targets_by_type)
+
+        await es.indices.put_settings(index=",".join(created), settings={"refresh_interval": None})
+        await es.indices.refresh(index=",".join(created))
+
+        actions: list[dict] = []
+        retired: set[str] = set()
+        for doc_type, targets in targets_by_type.items():
+            for lang, new_index in targets.items():
+                name = index_name(doc_type, lang)
+                old = await _backing_indices(es, name)
+                for old_index in old:
+                    if old_index == name:
+                        # Pre-swap layout: the per-type name is a real index and
+                        # must go before it can become an alias.
+                        actions.append({"remove_index": {"index": old_index}})
+                    else:
+                        actions.append({"remove": {"index": old_index, "alias": name}})
+                        actions.append({"remove": {"index": old_index, "alias": alias_name(lang)}})
+                        retired.add(old_index)
+                actions.append({"add": {"index": new_index, "alias": name}})
+                actions.append({"add": {"index": new_index, "alias": alias_name(lang)}})
+        await es.indices.update_aliases(actions=actions)
+        logger.info("Swapped aliases to %s indices", stamp)
+    except BaseException:
+        if created:
+            logger.warning("Swap aborted — deleting %d new indices", len(created))
+            await es.indices.delete(index=",".join(created), ignore_unavailable=True)
+        raise
+
+    if retired:
+        await es.indices.delete(index=",".join(sorted(retired)), ignore_unavailable=True)
+    return total
+
+
 async def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--type", dest="doc_type", choices=list(DOC_TYPES),
@@ -108,21 +253,37 @@ async def main() -> None:
                         help="Cap rows per type (debug)")
     parser.add_argument("--no-drop", action="store_true",
                         help="Skip deleting existing indices before rebuild")
+    parser.add_argument("--bulk", action="store_true",
+                        help="Use the batched streaming_bulk pipeline")
+    parser.add_argument("--swap", action="store_true",
+                        help="Bulk-build fresh indices and atomically swap aliases (implies --bulk, never drops)")
+    parser.add_argument("--batch-size", type=int, default=500,
+                        help="Rows per DB batch and documents per _bulk chunk (bulk modes)")
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="Doc types reindexed in parallel (bulk modes)")
     args = parser.parse_args()
 
     types = (args.doc_type,) if args.doc_type else DOC_TYPES
 
     es = await get_es()
     try:
+        if args.swap:
+            total = await swap_reindex(es, types, args)
+            logger.info("Reindex complete — %d documents indexed", total)
+            return
+
         if not args.no_drop:
             logger.info("Dropping indices for: %s", ", ".join(types))
             await drop_indices(es, doc_types=types)
         await ensure_indices(es)
 
-        async with AsyncSessionLocal() as db:
-            total = 0
-            for doc_type in types:
-                total += await reindex_type(es, db, doc_type, args.limit)
+        if args.bulk:
+            total = await _run_bulk(es, types, args)
+        else:
+            async with AsyncSessionLocal() as db:
+                total = 0
+                for doc_type in types:
+                    total += await reindex_type(es, db, doc_type, args.limit)
         try:
             await es.indices.refresh(index="_all")
         except Exception:
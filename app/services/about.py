@@ -24,6 +24,7 @@ from sqlalchemy.orm import selectinload
 
 from app.api.v1.schema.about import UpdateAboutPage
 from app.core.logger import get_logger
+from app.core.cache import cached_response, invalidate
 from app.models.about.about import (
     AboutBlock,
     AboutBlockTr,
@@ -533,6 +534,7 @@ async def get_page_admin(page_key: str, db: AsyncSession):
         return _error(500, "Failed to load about page.")
 
 
+@cached_response("about:page", tags=lambda p: [f"about:{p['page_key']}"])
 async def get_page_public(page_key: str, lang: str, db: AsyncSession):
     try:
         page = await _load_page(db, page_key)
@@ -552,6 +554,10 @@ async def increment_document_view(document_id: int, db: AsyncSession):
     A single ``UPDATE ... RETURNING`` — no read-modify-write — so concurrent
     views from different visitors never lose a count. Public and unauthenticated:
     it fires on every download-card open on the website.
+
+    Deliberately does not invalidate the cached public page: a view must not
+    evict the whole page, so the count shown there may lag by up to
+    PUBLIC_CACHE_TTL_SECONDS. The returned value is always current.
     """
     try:
         new_count = (
@@ -1067,6 +1073,7 @@ async def update_page(page_key: str, request: UpdateAboutPage, db: AsyncSession)
             await _replace_images(db, page.id, data["images"], now)
 
         await db.commit()
+        await invalidate(f"about:{page_key}")
         return JSONResponse(content={"status_code": 200, "message": "About page updated."})
     except Exception:
         await db.rollback()
@@ -1086,6 +1093,7 @@ async def publish_page(page_key: str, is_active: bool, db: AsyncSession):
         page.is_active = is_active
         page.updated_at = _now()
         await db.commit()
+        await invalidate(f"about:{page_key}")
 
         return JSONResponse(
             content={
@@ -1119,6 +1127,7 @@ async def upload_document(page_key: str, file: UploadFile, db: AsyncSession):
         page.document_url = path
         page.updated_at = _now()
         await db.commit()
+        await invalidate(f"about:{page_key}")
 
         # Only clean up a file we stored; a previously pasted URL is not ours.
         if previous and not previous.startswith(("http://", "https://")):
@@ -9,22 +9,31 @@ from typing import Optional
 
 from fastapi import status
 from fastapi.responses import JSONResponse
-from sqlalchemy import delete, func, or_, select
+from sqlalchemy import delete, func, select
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.audit_labels import action_label, render_message
 from app.core.audit_payload import classify_client
+from app.core.cache import cached_count
 from app.core.logger import get_logger
+from app.core.text_search import like_pattern
 from app.models.admin.activity_log import AdminActivityLog
 from app.models.admin.admin_user import AdminUser
 from app.core.permissions import DOMAIN_LABELS, DOMAIN_ORDER
+from app.utils.pagination import InvalidCursor, Keyset, SortKey
 
 logger = get_logger(__name__)
 
 DEFAULT_PAGE_SIZE = 25
 MAX_PAGE_SIZE = 100
 
+# Newest first; served by ix_activity_created_id for cursor pages.
+_ACTIVITY_ORDER = Keyset(
+    SortKey(AdminActivityLog.created_at, descending=True),
+    SortKey(AdminActivityLog.id, descending=True),
+)
+
 
 def _error(message: str, code: int) -> JSONResponse:
     return JSONResponse(content={"status_code": code, "message": message}, status_code=code)
@@ -89,7 +98,14 @@ async def list_activity(
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
     q: Optional[str] = None,
+    cursor: Optional[str] = None,
 ) -> JSONResponse:
+    """One page of the log, by ``page`` or — when ``cursor`` is given, empty
+    for the first page — after the previous page's ``next_cursor``.
+
+    ``total`` comes from the count cache and may trail new entries by up to
+    COUNT_CACHE_TTL_SECONDS.
+    """
     page = max(1, page)
     page_size = max(1, min(page_size, MAX_PAGE_SIZE))
 
@@ -115,31 +131,47 @@ async def list_activity(
     term = (q or "").strip()
     if term:
         # The message is not stored, so free text searches the fields it is built
-        # from plus the resolved record name.
-        pattern = f"%{term}%"
-        filters.append(
-            or_(
-                AdminActivityLog.admin_username.ilike(pattern),
-                AdminActivityLog.target_label.ilike(pattern),
-                AdminActivityLog.action_key.ilike(pattern),
-                AdminActivityLog.path.ilike(pattern),
-            )
-        )
+        # from plus the resolved record name — concatenated in the generated
+        # search_text column, so one trigram index scan answers it.
+        filters.append(AdminActivityLog.search_text.ilike(like_pattern(term)))
 
     count_stmt = select(func.count()).select_from(AdminActivityLog)
     if filters:
         count_stmt = count_stmt.where(*filters)
-    total = (await db.execute(count_stmt)).scalar_one()
+    total = await cached_count(db, count_stmt)
 
     stmt = select(AdminActivityLog)
     if filters:
         stmt = stmt.where(*filters)
-    stmt = (
-        stmt.order_by(AdminActivityLog.created_at.desc(), AdminActivityLog.id.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-    )
+    stmt = stmt.order_by(*_ACTIVITY_ORDER.order_by())
+
+    if cursor is not None:
+        try:
+            if cursor:
+                stmt = stmt.where(_ACTIVITY_ORDER.after(cursor))
+        except InvalidCursor as exc:
+            return _error(str(exc), status.HTTP_400_BAD_REQUEST)
+        rows = (await db.execute(stmt.limit(page_size + 1))).scalars().all()
+        rows, next_cursor = _ACTIVITY_ORDER.page(rows, page_size)
+        return JSONResponse(
+            content={
+                "status_code": status.HTTP_200_OK,
+                "data": {
+                    "items": [_row_payload(row) for row in rows],
+                    "total": total,
+                    "page_size": page_size,
+                    "has_more": next_cursor is not None,
+                    "next_cursor": next_cursor,
+                },
+            },
+            status_code=status.HTTP_200_OK,
+        )
+
+    # One extra row answers has_more exactly, whatever the cached total says.
+    stmt = stmt.offset((page - 1) * page_size).limit(page_size + 1)
     rows = (await db.execute(stmt)).scalars().all()
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
 
     return JSONResponse(
         content={
@@ -149,7 +181,7 @@ async def list_activity(
                 "total": total,
                 "page": page,
                 "page_size": page_size,
-                "has_more": (page - 1) * page_size + len(rows) < total,
+                "has_more": has_more,
             },
         },
         status_code=status.HTTP_200_OK,
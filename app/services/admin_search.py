@@ -1,43 +1,140 @@
 """Admin dashboard search — queries the DB directly (no Elasticsearch).
 
-Searches news and announcements by title across all languages in one call so
-the admin can find either kind of content from a single search box. Unlike the
-public ES-backed search, this includes inactive items and links to the admin
-pages.
+Searches news, announcements, faculties, cafedras, employees and offices by
+title or name across all languages in one call, so the admin can find any of
+them from a single search box. Unlike the public ES-backed search, this
+includes inactive items and links to the admin pages.
+
+One statement answers the whole search: per type, the matching translations
+are ranked (``app.core.text_search`` — trigram and full-text GIN indexes from
+``migrations_admin_search.sql``) and cut to ``limit`` hits, and the types are
+joined with ``UNION ALL``. Each hit carries its title in the requested language
+(falling back to az, then any), so no second round trip loads translations.
 """
 
-from typing import Optional
+from dataclasses import dataclass
+from typing import Any
 
 from fastapi import Depends, status
 from fastapi.responses import JSONResponse
-from sqlalchemy import select
+from sqlalchemy import Boolean, String, Text, cast, desc, func, literal, null, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logger import get_logger
 from app.core.session import get_db
-from app.models.news.news import News
-from app.models.news.news_translation import NewsTranslation
+from app.core.text_search import text_matches, text_rank
 from app.models.announcement.announcement import Announcement
 from app.models.announcement.announcement_translation import AnnouncementTranslation
+from app.models.cafedras.cafedras import Cafedra
+from app.models.cafedras.cafedras_tr import CafedraTr
+from app.models.employee.employee import Employee
+from app.models.employee.employee_tr import EmployeeTr
+from app.models.faculties.faculties import Faculty
+from app.models.faculties.faculties_tr import FacultyTr
+from app.models.news.news import News
+from app.models.news.news_translation import NewsTranslation
+from app.models.office.office import Office, OfficeTr
 
 logger = get_logger(__name__)
 
 
-def _like_pattern(value: str) -> str:
-    """Escape LIKE wildcards so user input is matched literally (Postgres uses
-    backslash as the default ILIKE escape character)."""
-    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-    return f"%{escaped}%"
+@dataclass(frozen=True)
+class _Target:
+    """One searchable type: its translation table and the row it belongs to."""
+
+    type: str
+    group: str
+    text: Any
+    tr_key: Any
+    lang: Any
+    key: Any
+    is_active: Any = None
+    image: Any = None
+    numeric_id: bool = False
+
+
+_TARGETS = (
+    _Target(
+        "news", "news", NewsTranslation.title, NewsTranslation.news_id,
+        NewsTranslation.lang_code, News.news_id,
+        is_active=News.is_active, numeric_id=True,
+    ),
+    _Target(
+        "announcement", "announcements", AnnouncementTranslation.title,
+        AnnouncementTranslation.announcement_id, AnnouncementTranslation.lang_code,
+        Announcement.announcement_id,
+        is_active=Announcement.is_active, image=Announcement.image, numeric_id=True,
+    ),
+    _Target(
+        "faculty", "faculties", FacultyTr.faculty_name, FacultyTr.faculty_code,
+        FacultyTr.lang_code, Faculty.faculty_code,
+    ),
+    _Target(
+        "cafedra", "cafedras", CafedraTr.cafedra_name, CafedraTr.cafedra_code,
+        CafedraTr.lang_code, Cafedra.cafedra_code,
+    ),
+    _Target(
+        "employee", "employees", EmployeeTr.full_name, EmployeeTr.employee_code,
+        EmployeeTr.lang_code, Employee.employee_code, image=Employee.profile_image,
+    ),
+    _Target(
+        "office", "offices", OfficeTr.name, OfficeTr.office_id,
+        OfficeTr.lang_code, Office.id,
+        is_active=Office.is_active, numeric_id=True,
+    ),
+)
+
+
+def _hits(target: _Target, term: str, lang: str, limit: int):
+    """The ``limit`` best matches of one type, with display title and metadata."""
+    rank = func.max(text_rank(target.text, term))
+    ranked = (
+        select(target.tr_key.label("key"), rank.label("rank"))
+        .where(text_matches(target.text, term))
+        .group_by(target.tr_key)
+        .order_by(rank.desc(), target.tr_key)
+        .limit(limit)
+        .subquery()
+    )
+    title = (
+        select(target.text)
+        .where(target.tr_key == ranked.c.key)
+        .order_by((target.lang == lang).desc(), (target.lang == "az").desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    model = target.key.class_
+    # Every branch of the UNION needs the same columns; types without an
+    # active flag or an image contribute typed NULLs.
+    is_active = target.is_active if target.is_active is not None else null()
+    image = target.image if target.image is not None else null()
+    return (
+        select(
+            cast(literal(target.type), String).label("type"),
+            cast(ranked.c.key, String).label("key"),
+            ranked.c.rank,
+            title.label("title"),
+            cast(is_active, Boolean).label("is_active"),
+            cast(image, Text).label("image"),
+            model.created_at.label("created_at"),
+        )
+        .select_from(ranked)
+        .join(model, target.key == ranked.c.key)
+    )
 
 
-def _pick_title(translations: dict, lang: str) -> Optional[str]:
-    tr = (
-        translations.get(lang)
-        or translations.get("az")
-        or translations.get("en")
-        or next(iter(translations.values()), None)
-    )
-    return tr.title if tr else None
+def _payload(row, target: _Target) -> dict:
+    hit: dict[str, Any] = {
+        "type": target.type,
+        "id": int(row.key) if target.numeric_id else row.key,
+        "title": row.title,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+    }
+    if target.is_active is not None:
+        hit["is_active"] = row.is_active
+    if target.image is not None:
+        hit["image"] = row.image
+    return hit
 
 
 async def admin_search(
@@ -47,88 +144,27 @@ async def admin_search(
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        pattern = _like_pattern(q.strip())
-
-        # ── News ────────────────────────────────────────────────────────────
-        # Select only scalar columns — selecting the full News entity would put
-        # its `json` column (sdg_numbers) into SELECT DISTINCT, which Postgres
-        # rejects ("no equality operator for type json").
-        news_rows = (await db.execute(
-            select(News.news_id, News.is_active, News.created_at)
-            .join(NewsTranslation, NewsTranslation.news_id == News.news_id)
-            .where(NewsTranslation.title.ilike(pattern))
-            .distinct()
-            .order_by(News.created_at.desc())
-            .limit(limit)
-        )).all()
-
-        news_results = []
-        if news_rows:
-            news_ids = [r.news_id for r in news_rows]
-            tr_by_news: dict[int, dict] = {}
-            for tr in (await db.execute(
-                select(NewsTranslation).where(NewsTranslation.news_id.in_(news_ids))
-            )).scalars().all():
-                tr_by_news.setdefault(tr.news_id, {})[tr.lang_code] = tr
-
-            for r in news_rows:
-                news_results.append({
-                    "type": "news",
-                    "id": r.news_id,
-                    "title": _pick_title(tr_by_news.get(r.news_id, {}), lang),
-                    "is_active": r.is_active,
-                    "created_at": r.created_at.isoformat() if r.created_at else None,
-                })
-
-        # ── Announcements ───────────────────────────────────────────────────
-        ann_rows = (await db.execute(
-            select(
-                Announcement.announcement_id,
-                Announcement.is_active,
-                Announcement.image,
-                Announcement.created_at,
-            )
-            .join(
-                AnnouncementTranslation,
-                AnnouncementTranslation.announcement_id == Announcement.announcement_id,
-            )
-            .where(AnnouncementTranslation.title.ilike(pattern))
-            .distinct()
-            .order_by(Announcement.created_at.desc())
-            .limit(limit)
-        )).all()
-
-        ann_results = []
-        if ann_rows:
-            ann_ids = [r.announcement_id for r in ann_rows]
-            tr_by_ann: dict[int, dict] = {}
-            for tr in (await db.execute(
-                select(AnnouncementTranslation).where(
-                    AnnouncementTranslation.announcement_id.in_(ann_ids)
-                )
-            )).scalars().all():
-                tr_by_ann.setdefault(tr.announcement_id, {})[tr.lang_code] = tr
-
-            for r in ann_rows:
-                ann_results.append({
-                    "type": "announcement",
-                    "id": r.announcement_id,
-                    "title": _pick_title(tr_by_ann.get(r.announcement_id, {}), lang),
-                    "is_active": r.is_active,
-                    "image": r.image,
-                    "created_at": r.created_at.isoformat() if r.created_at else None,
-                })
-
-        results = news_results + ann_results
-        results.sort(key=lambda r: r["created_at"] or "", reverse=True)
+        term = q.strip()
+        statement = union_all(
+            *(_hits(target, term, lang, limit) for target in _TARGETS)
+        ).order_by(desc("rank"), "type")
+        rows = (await db.execute(statement)).all()
+
+        by_type = {target.type: target for target in _TARGETS}
+        groups: dict[str, list] = {target.group: [] for target in _TARGETS}
+        results = []
+        for row in rows:
+            target = by_type[row.type]
+            hit = _payload(row, target)
+            groups[target.group].append(hit)
+            results.append(hit)
 
         return JSONResponse(
             content={
                 "status_code": 200,
                 "query": q,
                 "results": results,
-                "news": news_results,
-                "announcements": ann_results,
+                **groups,
                 "total": len(results),
             }
         )
@@ -15,6 +15,7 @@ from fastapi.responses import JSONResponse
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.actor_cache import invalidate_actor
 from app.core.logger import get_logger
 from app.core.security import hash_password
 from app.models.admin.admin_user import AdminUser
@@ -165,6 +166,7 @@ async def create_admin_user(db: AsyncSession, payload):
 async def update_admin_user(db: AsyncSession, user_id: int, payload, actor: AdminUser):
     try:
         user = await _user_or_violation(db, user_id)
+        previous_username = user.username
 
         if payload.is_active is not None and bool(payload.is_active) != bool(user.is_active):
             assert_not_self(actor, user_id)
@@ -197,6 +199,7 @@ async def update_admin_user(db: AsyncSession, user_id: int, payload, actor: Admi
         await db.flush()
         await assert_super_admin_floor(db)
         await db.commit()
+        await invalidate_actor(previous_username, user.username)
 
         return _ok("İstifadəçi yeniləndi.")
     except RbacViolation as exc:
@@ -247,6 +250,7 @@ async def assign_role(db: AsyncSession, user_id: int, payload, actor: AdminUser)
         await db.flush()
         await assert_super_admin_floor(db)
         await db.commit()
+        await invalidate_actor(user.username)
 
         logger.info("Role %s assigned to admin user %s by %s", payload.role_id, user.username, actor.username)
         return _ok("İstifadəçinin rolu yeniləndi.")
@@ -293,6 +297,7 @@ async def set_active(db: AsyncSession, user_id: int, active: bool, actor: AdminU
         await db.flush()
         await assert_super_admin_floor(db)
         await db.commit()
+        await invalidate_actor(user.username)
 
         return _ok("İstifadəçi aktivləşdirildi." if active else "İstifadəçi deaktiv edildi.")
     except RbacViolation as exc:
@@ -314,6 +319,7 @@ async def delete_admin_user(db: AsyncSession, user_id: int, actor: AdminUser):
         await db.flush()
         await assert_super_admin_floor(db)
         await db.commit()
+        await invalidate_actor(username)
 
         logger.info("Admin user %s deleted by %s", username, actor.username)
         return _ok("İstifadəçi silindi.")
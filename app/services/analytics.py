@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.logger import get_logger
+from app.core.redis_client import get_redis
 from app.models.analytics.site_visit import SiteVisitDaily, SiteVisitUnique
 
 logger = get_logger("aztu.analytics")
@@ -25,6 +26,15 @@ _BOT_MARKERS: tuple[str, ...] = (
 
 _UA_MAX = 512
 
+# Write-behind buffer: a page view is one pipelined Redis round trip (INCR the
+# day's views, SADD the visitor hash), and flush_visit_buffer() moves the
+# totals into site_visit_daily / site_visit_unique on a timer. Every worker
+# runs the flush; the buffers are drained with atomic GETDEL / SPOP, so
+# concurrent flushes split the work rather than double-count it.
+_VIEWS_PREFIX = "visits:views:"
+_UNIQUES_PREFIX = "visits:uniques:"
+_UNIQUES_BATCH = 5000
+
 
 def is_bot(user_agent: str | None) -> bool:
     if not user_agent:
@@ -57,8 +67,38 @@ def visitor_hash(ip: str, user_agent: str, day: date) -> str:
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
 
+async def _write_visits(db: AsyncSession, day: date, views: int, digests: list[str]) -> None:
+    if views:
+        await db.execute(
+            pg_insert(SiteVisitDaily)
+            .values(day=day, views=views)
+            .on_conflict_do_update(
+                index_elements=[SiteVisitDaily.day],
+                set_={"views": SiteVisitDaily.views + views},
+            )
+        )
+    if digests:
+        await db.execute(
+            pg_insert(SiteVisitUnique)
+            .values([{"day": day, "visitor_hash": digest} for digest in digests])
+            .on_conflict_do_nothing(index_elements=["day", "visitor_hash"])
+        )
+
+
+async def _buffer_visit(day: date, digest: str) -> None:
+    redis = await get_redis()
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.incr(f"{_VIEWS_PREFIX}{day.isoformat()}")
+        pipe.sadd(f"{_UNIQUES_PREFIX}{day.isoformat()}", digest)
+        await pipe.execute()
+
+
 async def record_visit(request, path: str, db: AsyncSession) -> JSONResponse:
-    """Count one page view. Never raises — a tracking failure must not break a page."""
+    """Count one page view. Never raises — a tracking failure must not break a page.
+
+    The view goes into the Redis buffer; only when Redis is unreachable is it
+    written straight to the database as before.
+    """
     try:
         user_agent = request.headers.get("User-Agent", "")
         if is_bot(user_agent):
@@ -70,20 +110,12 @@ async def record_visit(request, path: str, db: AsyncSession) -> JSONResponse:
         today = datetime.now(timezone.utc).date()
         digest = visitor_hash(client_ip(request), user_agent, today)
 
-        await db.execute(
-            pg_insert(SiteVisitDaily)
-            .values(day=today, views=1)
-            .on_conflict_do_update(
-                index_elements=[SiteVisitDaily.day],
-                set_={"views": SiteVisitDaily.views + 1},
-            )
-        )
-        await db.execute(
-            pg_insert(SiteVisitUnique)
-            .values(day=today, visitor_hash=digest)
-            .on_conflict_do_nothing(index_elements=["day", "visitor_hash"])
-        )
-        await db.commit()
+        try:
+            await _buffer_visit(today, digest)
+        except Exception as exc:
+            logger.warning("Visit buffer unavailable, writing directly: %s", exc)
+            await _write_visits(db, today, 1, [digest])
+            await db.commit()
     except Exception:
         # Swallowed on purpose: the public site fires this on every page view.
         logger.exception("Visit tracking failed for path=%s", (path or "")[:200])
@@ -102,6 +134,64 @@ async def record_visit(request, path: str, db: AsyncSession) -> JSONResponse:
     )
 
 
+async def _buffered_days(redis) -> set[str]:
+    days: set[str] = set()
+    for prefix in (_VIEWS_PREFIX, _UNIQUES_PREFIX):
+        async for key in redis.scan_iter(match=f"{prefix}*", count=100):
+            days.add(key[len(prefix):])
+    return days
+
+
+async def _flush_day(redis, day_iso: str) -> int:
+    """Move one day's buffered views and visitor hashes into Postgres.
+
+    What was taken from Redis is put back if the database write fails.
+    """
+    from app.core.database import AsyncSessionLocal
+
+    views_key = f"{_VIEWS_PREFIX}{day_iso}"
+    uniques_key = f"{_UNIQUES_PREFIX}{day_iso}"
+    day = date.fromisoformat(day_iso)
+
+    views = int(await redis.getdel(views_key) or 0)
+    flushed = 0
+    while True:
+        digests = await redis.spop(uniques_key, _UNIQUES_BATCH) or []
+        if not views and not digests:
+            return flushed
+        try:
+            async with AsyncSessionLocal() as db:
+                await _write_visits(db, day, views, digests)
+                await db.commit()
+        except Exception:
+            async with redis.pipeline(transaction=False) as pipe:
+                if views:
+                    pipe.incrby(views_key, views)
+                if digests:
+                    pipe.sadd(uniques_key, *digests)
+                await pipe.execute()
+            raise
+        flushed += views
+        views = 0
+        if len(digests) < _UNIQUES_BATCH:
+            return flushed
+
+
+async def flush_visit_buffer() -> None:
+    """Scheduled write-behind flush. Never raises; a failed day retries next run."""
+    try:
+        redis = await get_redis()
+        days = await _buffered_days(redis)
+    except Exception as exc:
+        logger.warning("Visit buffer flush skipped: %s", exc)
+        return
+    for day_iso in sorted(days):
+        try:
+            await _flush_day(redis, day_iso)
+        except Exception:
+            logger.exception("Visit buffer flush failed for %s", day_iso)
+
+
 async def purge_expired_site_visits() -> int:
     """Nightly retention sweep. Runs on its own session, outside any request.
 
@@ -4,6 +4,8 @@ from datetime import datetime, timezone
 from sqlalchemy import select, func
 from app.core.session import get_db
 from app.core.logger import get_logger
+from app.core.cache import cached_count, invalidate
+from app.utils.pagination import InvalidCursor, Keyset, SortKey
 
 logger = get_logger(__name__)
 from app.api.v1.schema.project import *
@@ -11,6 +13,7 @@ from fastapi.responses import JSONResponse
 from app.utils.language import get_language
 from app.api.v1.schema.announcement import *
 from app.utils.file_upload import save_upload, safe_delete_file, ALLOWED_IMAGE_MIMES, ALLOWED_DOC_MIMES
+from app.utils.image_variants import variant_urls
 from app.utils.html_sanitizer import sanitize_html
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends, status, Query, File, Form, UploadFile
@@ -20,6 +23,15 @@ from app.models.announcement.announcement_translation import AnnouncementTransla
 from app.services.search import on_announcement_change, on_announcement_delete
 
 
+# List order for both feeds; `id` makes it total for cursor pages (served by
+# ix_announcement_feed_order).
+_ANNOUNCEMENT_ORDER = Keyset(
+    SortKey(Announcement.display_order),
+    SortKey(Announcement.published_date, descending=True, nulls_last=True),
+    SortKey(Announcement.id, descending=True),
+)
+
+
 def announcement_id_generator() -> int:
     return secrets.randbelow(900000) + 100000
 
@@ -78,6 +90,7 @@ async def create_announcement(
         db.add(AnnouncementTranslation(announcement_id=announcement_id, lang_code="az", title=az_title, html_content=az_html_content))
         db.add(AnnouncementTranslation(announcement_id=announcement_id, lang_code="en", title=en_title, html_content=en_html_content))
         await db.commit()
+        await invalidate("announcement")
         await on_announcement_change(db, announcement_id)
 
         return JSONResponse(
@@ -194,6 +207,7 @@ async def update_announcement(
             _resequence_display_order(all_rows, a, display_order)
 
         await db.commit()
+        await invalidate("announcement")
         await on_announcement_change(db, announcement_id)
 
         if old_image:
@@ -215,18 +229,30 @@ async def update_announcement(
         )
 
 
+async def _fetch_page(query, start: int, end: int, cursor: Optional[str], db: AsyncSession):
+    """One page of ``query`` by offset, or after ``cursor`` when one is given
+    (an empty cursor is the first page). Returns the rows and the next cursor."""
+    query = query.order_by(*_ANNOUNCEMENT_ORDER.order_by())
+    if cursor is None:
+        rows = (await db.execute(query.offset(start).limit(end - start))).scalars().all()
+        return rows, None
+    if cursor:
+        query = query.where(_ANNOUNCEMENT_ORDER.after(cursor))
+    rows = (await db.execute(query.limit(end - start + 1))).scalars().all()
+    return _ANNOUNCEMENT_ORDER.page(rows, end - start)
+
+
 async def get_announcements_admin(
     start: int = Query(0, ge=0, description="Start index"),
     end: int = Query(4, gt=0, le=100, description="End index (max 100)"),
     lang: str = Depends(get_language),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = None,
 ):
     try:
-        total = (await db.execute(select(func.count()).select_from(Announcement))).scalar() or 0
+        total = await cached_count(db, select(func.count()).select_from(Announcement), tags=["announcement"])
 
-        announcements = (await db.execute(
-            select(Announcement).order_by(Announcement.display_order.asc(), Announcement.published_date.desc().nullslast()).offset(start).limit(end - start)
-        )).scalars().all()
+        announcements, next_cursor = await _fetch_page(select(Announcement), start, end, cursor, db)
 
         if not announcements:
             return JSONResponse(content={"status_code": 204, "message": "No content."}, status_code=status.HTTP_204_NO_CONTENT)
@@ -249,9 +275,13 @@ async def get_announcements_admin(
                 "published_date": a.published_date.isoformat() if a.published_date else None,
             })
 
-        return JSONResponse(
-            content={"status_code": 200, "message": "Announcements fetched successfully.", "announcements": announcement_arr, "total": total}
-        )
+        content = {"status_code": 200, "message": "Announcements fetched successfully.", "announcements": announcement_arr, "total": total}
+        if cursor is not None:
+            content["next_cursor"] = next_cursor
+        return JSONResponse(content=content)
+
+    except InvalidCursor as exc:
+        return JSONResponse(content={"status_code": 400, "message": str(exc)}, status_code=status.HTTP_400_BAD_REQUEST)
 
     except Exception:
         logger.exception("Failed to fetch admin announcements")
@@ -265,17 +295,14 @@ async def get_announcements_user(
     start: int = Query(0, ge=0, description="Start index"),
     end: int = Query(4, gt=0, le=100, description="End index (max 100)"),
     lang: str = Depends(get_language),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = None,
 ):
     try:
-        total = (await db.execute(select(func.count()).select_from(Announcement))).scalar() or 0
-
-        announcements = (await db.execute(
-            select(Announcement)
-            .where(Announcement.is_active == True)  # noqa: E712
-            .order_by(Announcement.display_order.asc(), Announcement.published_date.desc().nullslast())
-            .offset(start).limit(end - start)
-        )).scalars().all()
+        announcements, next_cursor = await _fetch_page(
+            select(Announcement).where(Announcement.is_active == True),  # noqa: E712
+            start, end, cursor, db,
+        )
 
         if not announcements:
             return JSONResponse(content={"status_code": 204, "message": "No content."}, status_code=status.HTTP_204_NO_CONTENT)
@@ -298,9 +325,13 @@ async def get_announcements_user(
                 "published_date": a.published_date.isoformat() if a.published_date else None,
             })
 
-        return JSONResponse(
-            content={"status_code": 200, "message": "Announcements fetched successfully.", "announcements": announcement_arr}
-        )
+        content = {"status_code": 200, "message": "Announcements fetched successfully.", "announcements": announcement_arr}
+        if cursor is not None:
+            content["next_cursor"] = next_cursor
+        return JSONResponse(content=content)
+
+    except InvalidCursor as exc:
+        return JSONResponse(content={"status_code": 400, "message": str(exc)}, status_code=status.HTTP_400_BAD_REQUEST)
 
     except Exception:
         logger.exception("Failed to fetch user announcements")
@@ -335,6 +366,7 @@ async def get_announcement(
                 "title": tr.title if tr else None,
                 "html_content": tr.html_content if tr else None,
                 "image": a.image,
+                "image_variants": variant_urls(a.image),
                 "display_order": a.display_order,
                 "is_active": a.is_active,
                 "created_at": a.created_at.isoformat() if a.created_at else None,
@@ -360,6 +392,7 @@ async def deactivate_announcement(
             return JSONResponse(content={"status_code": 404, "message": "Announcement not found."}, status_code=status.HTTP_404_NOT_FOUND)
         a.is_active = False
         await db.commit()
+        await invalidate("announcement")
         await on_announcement_change(db, announcement_id)
         return JSONResponse(content={"status_code": 200, "message": "Announcement deactivated successfully."})
     except Exception:
@@ -377,6 +410,7 @@ async def activate_announcement(
             return JSONResponse(content={"status_code": 404, "message": "Announcement not found."}, status_code=status.HTTP_404_NOT_FOUND)
         a.is_active = True
         await db.commit()
+        await invalidate("announcement")
         await on_announcement_change(db, announcement_id)
         return JSONResponse(content={"status_code": 200, "message": "Announcement activated successfully."})
     except Exception:
@@ -419,6 +453,7 @@ async def reorder_announcement(
         _resequence_display_order(all_rows, target, request.new_order)
 
         await db.commit()
+        await invalidate("announcement")
         return JSONResponse(content={"status_code": 200, "message": "Announcement reordered successfully"})
 
     except Exception:
@@ -453,6 +488,7 @@ async def delete_announcement(
 
         await db.delete(a)
         await db.commit()
+        await invalidate("announcement")
         await on_announcement_delete(announcement_id)
 
         if image_path:
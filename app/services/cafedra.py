@@ -6,6 +6,7 @@ from fastapi import Depends, File, HTTPException, UploadFile, status
 from fastapi.responses import JSONResponse
 from sqlalchemy import delete as sqlalchemy_delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.api.v1.schema.cafedra import (
     CreateCafedra,
@@ -33,6 +34,7 @@ from app.api.v1.schema.cafedra import (
 from app.utils.file_upload import ALLOWED_IMAGE_MIMES, safe_delete_file, save_upload
 from app.services.search import on_cafedra_change, on_cafedra_delete
 from app.core.logger import get_logger
+from app.core.cache import cached_response, invalidate
 from app.core.session import get_db
 from app.models.faculties.faculties import Faculty
 from app.models.cafedras.cafedras import Cafedra
@@ -145,30 +147,26 @@ async def _create_translated_section(
     return created
 
 
-async def _serialize_translated_section(
-    parent_cls: Type[Any],
-    tr_cls: Type[Any],
-    parent_id_name: str,
-    cafedra_code: str,
+def _tr_for(translations: list[Any], lang_code: str) -> Any:
+    return next((tr for tr in translations if tr.lang_code == lang_code), None)
+
+
+def _serialize_translated_section(
+    parents: list[Any],
     lang_code: str,
-    db: AsyncSession,
     *,
     extra_keys: tuple[str, ...] = (),
     emit_html_content: bool = False,
 ):
+    """Serialize an already-loaded section (parents with `translations` eager-loaded)."""
     items = []
-    parents_query = await db.execute(
-        select(parent_cls).where(parent_cls.cafedra_code == cafedra_code).order_by(parent_cls.display_order.asc())
+    # display_order is nullable on some sections (directions of action); NULLs
+    # sort last, as the ORDER BY this replaced did.
+    ordered = sorted(
+        parents, key=lambda p: (p.display_order is None, p.display_order or 0, p.id)
     )
-    parents = parents_query.scalars().all()
-    for parent in parents:
-        tr_query = await db.execute(
-            select(tr_cls).where(
-                getattr(tr_cls, parent_id_name) == parent.id,
-                tr_cls.lang_code == lang_code,
-            )
-        )
-        tr = tr_query.scalar_one_or_none()
+    for parent in ordered:
+        tr = _tr_for(parent.translations, lang_code)
         item_dict = {
             "id": parent.id,
             "title": tr.title if tr else None,
@@ -252,65 +250,37 @@ async def _create_laboratory_items(
                 ))
 
 
-async def _serialize_laboratory(
-    lab: CafedraLaboratory,
-    lang_code: str,
-    db: AsyncSession,
-) -> dict:
-    tr_q = await db.execute(
-        select(CafedraLaboratoryTr).where(
-            CafedraLaboratoryTr.laboratory_id == lab.id,
-            CafedraLaboratoryTr.lang_code == lang_code,
-        )
-    )
-    tr = tr_q.scalar_one_or_none()
+_LABORATORY_LOADERS = (
+    selectinload(CafedraLaboratory.translations),
+    selectinload(CafedraLaboratory.objectives).selectinload(CafedraLaboratoryObjective.translations),
+    selectinload(CafedraLaboratory.equipments).selectinload(CafedraLaboratoryEquipment.translations),
+    selectinload(CafedraLaboratory.gallery_images),
+)
+
+
+def _serialize_laboratory(lab: CafedraLaboratory, lang_code: str) -> dict:
+    """Serialize a laboratory loaded with `_LABORATORY_LOADERS`."""
+    tr = _tr_for(lab.translations, lang_code)
 
-    obj_q = await db.execute(
-        select(CafedraLaboratoryObjective)
-        .where(CafedraLaboratoryObjective.laboratory_id == lab.id)
-        .order_by(CafedraLaboratoryObjective.display_order.asc())
-    )
     objectives = []
-    for obj in obj_q.scalars().all():
-        obj_tr_q = await db.execute(
-            select(CafedraLaboratoryObjectiveTr).where(
-                CafedraLaboratoryObjectiveTr.objective_id == obj.id,
-                CafedraLaboratoryObjectiveTr.lang_code == lang_code,
-            )
-        )
-        obj_tr = obj_tr_q.scalar_one_or_none()
+    for obj in sorted(lab.objectives, key=lambda o: (o.display_order, o.id)):
+        obj_tr = _tr_for(obj.translations, lang_code)
         objectives.append({
             "id": obj.id,
             "title": obj_tr.title if obj_tr else None,
         })
 
-    eq_q = await db.execute(
-        select(CafedraLaboratoryEquipment)
-        .where(CafedraLaboratoryEquipment.laboratory_id == lab.id)
-        .order_by(CafedraLaboratoryEquipment.display_order.asc())
-    )
     equipments = []
-    for eq in eq_q.scalars().all():
-        eq_tr_q = await db.execute(
-            select(CafedraLaboratoryEquipmentTr).where(
-                CafedraLaboratoryEquipmentTr.equipment_id == eq.id,
-                CafedraLaboratoryEquipmentTr.lang_code == lang_code,
-            )
-        )
-        eq_tr = eq_tr_q.scalar_one_or_none()
+    for eq in sorted(lab.equipments, key=lambda e: (e.display_order, e.id)):
+        eq_tr = _tr_for(eq.translations, lang_code)
         equipments.append({
             "id": eq.id,
             "name": eq_tr.name if eq_tr else None,
         })
 
-    gallery_q = await db.execute(
-        select(CafedraLaboratoryGalleryImage)
-        .where(CafedraLaboratoryGalleryImage.laboratory_id == lab.id)
-        .order_by(CafedraLaboratoryGalleryImage.display_order.asc())
-    )
     gallery_images = [
         {"id": img.id, "image_url": img.image_url}
-        for img in gallery_q.scalars().all()
+        for img in sorted(lab.gallery_images, key=lambda i: (i.display_order, i.id))
     ]
 
     return {
@@ -329,6 +299,13 @@ async def _serialize_laboratory(
     }
 
 
+def _serialize_laboratories(labs: list[CafedraLaboratory], lang_code: str) -> list[dict]:
+    return [
+        _serialize_laboratory(lab, lang_code)
+        for lab in sorted(labs, key=lambda l: (l.display_order, l.id))
+    ]
+
+
 async def _serialize_laboratories_for_cafedra(
     cafedra_code: str,
     lang_code: str,
@@ -337,10 +314,9 @@ async def _serialize_laboratories_for_cafedra(
     labs_q = await db.execute(
         select(CafedraLaboratory)
         .where(CafedraLaboratory.cafedra_code == cafedra_code)
-        .order_by(CafedraLaboratory.display_order.asc())
+        .options(*_LABORATORY_LOADERS)
     )
-    labs = labs_q.scalars().all()
-    return [await _serialize_laboratory(lab, lang_code, db) for lab in labs]
+    return _serialize_laboratories(labs_q.scalars().all(), lang_code)
 
 
 async def _upsert_publication_tr(
@@ -408,32 +384,23 @@ async def _create_publications(
     return created
 
 
-async def _serialize_publications(
-    cafedra_code: str,
-    lang_code: str,
-    db: AsyncSession,
-) -> tuple[list[dict], list[dict]]:
-    publications_q = await db.execute(
-        select(CafedraScientificPublication)
-        .where(CafedraScientificPublication.cafedra_code == cafedra_code)
-        .order_by(
-            CafedraScientificPublication.year.desc().nullslast(),
-            CafedraScientificPublication.display_order.asc(),
-        )
+def _by_year_desc(rows: list[Any]) -> list[Any]:
+    """Newest year first, undated rows last, then display_order — the ORDER BY the list views used."""
+    return sorted(
+        rows,
+        key=lambda r: (r.year is None, -(r.year or 0), r.display_order, r.id),
     )
-    publications = publications_q.scalars().all()
 
+
+def _serialize_publications(
+    publications: list[CafedraScientificPublication],
+    lang_code: str,
+) -> tuple[list[dict], list[dict]]:
     items: list[dict] = []
     buckets: dict[Any, dict] = {}
     years: list[dict] = []
-    for publication in publications:
-        tr_q = await db.execute(
-            select(CafedraScientificPublicationTr).where(
-                CafedraScientificPublicationTr.publication_id == publication.id,
-                CafedraScientificPublicationTr.lang_code == lang_code,
-            )
-        )
-        tr = tr_q.scalar_one_or_none()
+    for publication in _by_year_desc(publications):
+        tr = _tr_for(publication.translations, lang_code)
         year = publication.year
         bucket = buckets.get(year)
         if bucket is None:
@@ -518,32 +485,15 @@ async def _create_patents(
     return created
 
 
-async def _serialize_patents(
-    cafedra_code: str,
+def _serialize_patents(
+    patents: list[CafedraPatent],
     lang_code: str,
-    db: AsyncSession,
 ) -> tuple[list[dict], list[dict]]:
-    patents_q = await db.execute(
-        select(CafedraPatent)
-        .where(CafedraPatent.cafedra_code == cafedra_code)
-        .order_by(
-            CafedraPatent.year.desc().nullslast(),
-            CafedraPatent.display_order.asc(),
-        )
-    )
-    patents = patents_q.scalars().all()
-
     items: list[dict] = []
     buckets: dict[Any, dict] = {}
     years: list[dict] = []
-    for patent in patents:
-        tr_q = await db.execute(
-            select(CafedraPatentTr).where(
-                CafedraPatentTr.patent_id == patent.id,
-                CafedraPatentTr.lang_code == lang_code,
-            )
-        )
-        tr = tr_q.scalar_one_or_none()
+    for patent in _by_year_desc(patents):
+        tr = _tr_for(patent.translations, lang_code)
         year = patent.year
         bucket = buckets.get(year)
         if bucket is None:
@@ -775,29 +725,11 @@ async def _delete_person(parent_cls: Type[Any], person_id: int, db: AsyncSession
     return cafedra_code, profile_image
 
 
-async def _fetch_people_with_tr(
-    parent_cls: Type[Any],
-    tr_cls: Type[Any],
-    person_id_field: str,
-    cafedra_code: str,
-    lang_code: str,
-    db: AsyncSession,
-):
-    query = await db.execute(
-        select(parent_cls).where(parent_cls.cafedra_code == cafedra_code)
-    )
-    people = query.scalars().all()
-    result = []
-    for person in people:
-        tr_query = await db.execute(
-            select(tr_cls).where(
-                getattr(tr_cls, person_id_field) == person.id,
-                tr_cls.lang_code == lang_code,
-            )
-        )
-        tr = tr_query.scalar_one_or_none()
-        result.append((person, tr))
-    return result
+def _people_with_tr(people: list[Any], lang_code: str) -> list[tuple[Any, Any]]:
+    return [
+        (person, _tr_for(person.translations, lang_code))
+        for person in sorted(people, key=lambda p: p.id)
+    ]
 
 
 def _director_has_content(director_data: Any) -> bool:
@@ -1060,46 +992,28 @@ async def _upsert_director(cafedra_code: str, director_data: Any, now: datetime,
     return director
 
 
-async def _serialize_director(director: CafedraDirector, lang_code: str, db: AsyncSession):
+def _serialize_director(director: CafedraDirector, lang_code: str):
     if not director:
         return None
 
-    tr_query = await db.execute(
-        select(CafedraDirectorTr).where(
-            CafedraDirectorTr.director_id == director.id,
-            CafedraDirectorTr.lang_code == lang_code,
-        )
-    )
-    tr = tr_query.scalar_one_or_none()
-
-    working_hours_query = await db.execute(select(CafedraDirectorWorkingHour).where(CafedraDirectorWorkingHour.director_id == director.id))
-    scientific_events_query = await db.execute(select(CafedraDirectorScientificEvent).where(CafedraDirectorScientificEvent.director_id == director.id))
-    educations_query = await db.execute(select(CafedraDirectorEducation).where(CafedraDirectorEducation.director_id == director.id))
+    tr = _tr_for(director.translations, lang_code)
 
     working_hours = []
-    for hour in working_hours_query.scalars().all():
-        wh_tr_q = await db.execute(select(CafedraDirectorWorkingHourTr).where(CafedraDirectorWorkingHourTr.working_hour_id == hour.id, CafedraDirectorWorkingHourTr.lang_code == lang_code))
-        wh_tr = wh_tr_q.scalar_one_or_none()
+    for hour in sorted(director.working_hours, key=lambda h: h.id):
+        wh_tr = _tr_for(hour.translations, lang_code)
         working_hours.append({"day": wh_tr.day if wh_tr else None, "time_range": hour.time_range})
 
     scientific_events = []
-    for event in scientific_events_query.scalars().all():
-        ev_tr_q = await db.execute(
-            select(CafedraDirectorScientificEventTr).where(
-                CafedraDirectorScientificEventTr.scientific_event_id == event.id,
-                CafedraDirectorScientificEventTr.lang_code == lang_code,
-            )
-        )
-        ev_tr = ev_tr_q.scalar_one_or_none()
+    for event in sorted(director.scientific_events, key=lambda e: e.id):
+        ev_tr = _tr_for(event.translations, lang_code)
         scientific_events.append({
             "event_title": ev_tr.event_title if ev_tr else None,
             "event_description": ev_tr.event_description if ev_tr else None,
         })
 
     educations = []
-    for edu in educations_query.scalars().all():
-        edu_tr_q = await db.execute(select(CafedraDirectorEducationTr).where(CafedraDirectorEducationTr.education_id == edu.id, CafedraDirectorEducationTr.lang_code == lang_code))
-        edu_tr = edu_tr_q.scalar_one_or_none()
+    for edu in sorted(director.educations, key=lambda e: e.id):
+        edu_tr = _tr_for(edu.translations, lang_code)
         educations.append({"degree": edu_tr.degree if edu_tr else None, "university": edu_tr.university if edu_tr else None, "start_year": edu.start_year, "end_year": edu.end_year})
 
     return {
@@ -1120,6 +1034,51 @@ async def _serialize_director(director: CafedraDirector, lang_code: str, db: Asy
     }
 
 
+# ── Detail graph loading ─────────────────────────────────────────────────────────
+#
+# Every relationship below is fetched with one ``SELECT ... WHERE fk IN (...)``,
+# so a cafedra with 200 publications costs the same number of round trips as one
+# with 2. Callers pick only the parts of the graph their endpoint renders.
+
+_CAFEDRA_LOADERS = {
+    "director": selectinload(Cafedra.director).options(
+        selectinload(CafedraDirector.translations),
+        selectinload(CafedraDirector.working_hours).selectinload(CafedraDirectorWorkingHour.translations),
+        selectinload(CafedraDirector.scientific_events).selectinload(CafedraDirectorScientificEvent.translations),
+        selectinload(CafedraDirector.educations).selectinload(CafedraDirectorEducation.translations),
+    ),
+    "laboratories": selectinload(Cafedra.laboratories).options(*_LABORATORY_LOADERS),
+    "research_works": selectinload(Cafedra.research_works).selectinload(CafedraResearchWork.translations),
+    "partner_companies": selectinload(Cafedra.partner_companies).selectinload(CafedraPartnerCompany.translations),
+    "objectives": selectinload(Cafedra.objectives).selectinload(CafedraObjective.translations),
+    "duties": selectinload(Cafedra.duties).selectinload(CafedraDuty.translations),
+    "projects": selectinload(Cafedra.projects).selectinload(CafedraProject.translations),
+    "directions_of_action": selectinload(Cafedra.directions_of_action).selectinload(CafedraDirectionOfAction.translations),
+    "deputy_directors": selectinload(Cafedra.deputy_directors).selectinload(CafedraDeputyDirector.translations),
+    "scientific_council": selectinload(Cafedra.scientific_council).selectinload(CafedraCouncilMember.translations),
+    "workers": selectinload(Cafedra.workers).selectinload(CafedraWorker.translations),
+    "scientific_publications": selectinload(Cafedra.scientific_publications).selectinload(CafedraScientificPublication.translations),
+    "patents": selectinload(Cafedra.patents).selectinload(CafedraPatent.translations),
+}
+
+_DETAIL_PARTS = (
+    "director", "laboratories", "research_works", "partner_companies", "objectives", "duties",
+    "projects", "directions_of_action", "deputy_directors", "scientific_council", "workers",
+)
+_SCIENTIFIC_ACTIVITY_PARTS = (
+    "research_works", "projects", "partner_companies", "laboratories", "scientific_publications", "patents",
+)
+
+
+async def _load_cafedra_graph(cafedra_code: str, parts: tuple[str, ...], db: AsyncSession) -> Cafedra | None:
+    result = await db.execute(
+        select(Cafedra)
+        .where(Cafedra.cafedra_code == cafedra_code)
+        .options(selectinload(Cafedra.translations), *(_CAFEDRA_LOADERS[part] for part in parts))
+    )
+    return result.scalar_one_or_none()
+
+
 async def create_cafedra(
     request: CreateCafedra,
     db: AsyncSession = Depends(get_db),
@@ -1193,6 +1152,7 @@ async def create_cafedra(
             await _create_people(CafedraWorker, CafedraWorkerTr, "worker_id", request.workers, cafedra_code, now, db)
 
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}", f"faculty:{request.faculty_code}")
         await db.refresh(cafedra)
         await on_cafedra_change(db, cafedra.cafedra_code)
 
@@ -1268,38 +1228,22 @@ async def get_cafedras(
         return JSONResponse(content={"status_code": 500, "error": "Internal server error"}, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@cached_response("cafedra:detail", tags=lambda p: [f"cafedra:{p['cafedra_code']}"])
 async def get_cafedra(
     cafedra_code: str,
     lang_code: str = Depends(get_language),
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        cafedra_query = await db.execute(select(Cafedra).where(Cafedra.cafedra_code == cafedra_code))
-        cafedra = cafedra_query.scalar_one_or_none()
+        cafedra = await _load_cafedra_graph(cafedra_code, _DETAIL_PARTS, db)
 
         if not cafedra:
             return JSONResponse(content={"status_code": 404, "message": "Cafedra not found."}, status_code=status.HTTP_404_NOT_FOUND)
 
-        tr_query = await db.execute(select(CafedraTr).where(CafedraTr.cafedra_code == cafedra_code, CafedraTr.lang_code == lang_code))
-        tr = tr_query.scalar_one_or_none()
-
-        director_query = await db.execute(select(CafedraDirector).where(CafedraDirector.cafedra_code == cafedra_code))
-        director = director_query.scalar_one_or_none()
-
-        deputy_directors_with_tr = await _fetch_people_with_tr(
-            CafedraDeputyDirector, CafedraDeputyDirectorTr, "deputy_director_id", cafedra_code, lang_code, db
-        )
-        council_with_tr = await _fetch_people_with_tr(
-            CafedraCouncilMember, CafedraCouncilMemberTr, "council_member_id", cafedra_code, lang_code, db
-        )
-        workers_with_tr = await _fetch_people_with_tr(
-            CafedraWorker, CafedraWorkerTr, "worker_id", cafedra_code, lang_code, db
-        )
-
-        deputy_count_q = await db.execute(
-            select(func.count()).select_from(CafedraDeputyDirector).where(CafedraDeputyDirector.cafedra_code == cafedra_code)
-        )
-        deputy_count = deputy_count_q.scalar() or 0
+        tr = _tr_for(cafedra.translations, lang_code)
+        deputy_directors_with_tr = _people_with_tr(cafedra.deputy_directors, lang_code)
+        council_with_tr = _people_with_tr(cafedra.scientific_council, lang_code)
+        workers_with_tr = _people_with_tr(cafedra.workers, lang_code)
 
         cafedra_obj = {
             "id": cafedra.id,
@@ -1315,27 +1259,15 @@ async def get_cafedra(
             "projects_patents_count": cafedra.projects_patents_count,
             "industrial_collaborations_count": cafedra.industrial_collaborations_count,
             "sdgs": cafedra.sdgs,
-            "deputy_director_count": deputy_count,
-            "director": await _serialize_director(director, lang_code, db) if director else None,
-            "laboratories": await _serialize_laboratories_for_cafedra(cafedra_code, lang_code, db),
-            "research_works": await _serialize_translated_section(
-                CafedraResearchWork, CafedraResearchWorkTr, "research_work_id", cafedra_code, lang_code, db,
-            ),
-            "partner_companies": await _serialize_translated_section(
-                CafedraPartnerCompany, CafedraPartnerCompanyTr, "partner_company_id", cafedra_code, lang_code, db,
-            ),
-            "objectives": await _serialize_translated_section(
-                CafedraObjective, CafedraObjectiveTr, "objective_id", cafedra_code, lang_code, db,
-            ),
-            "duties": await _serialize_translated_section(
-                CafedraDuty, CafedraDutyTr, "duty_id", cafedra_code, lang_code, db,
-            ),
-            "projects": await _serialize_translated_section(
-                CafedraProject, CafedraProjectTr, "project_id", cafedra_code, lang_code, db,
-            ),
-            "directions_of_action": await _serialize_translated_section(
-                CafedraDirectionOfAction, CafedraDirectionOfActionTr, "direction_of_action_id", cafedra_code, lang_code, db,
-            ),
+            "deputy_director_count": len(cafedra.deputy_directors),
+            "director": _serialize_director(cafedra.director, lang_code) if cafedra.director else None,
+            "laboratories": _serialize_laboratories(cafedra.laboratories, lang_code),
+            "research_works": _serialize_translated_section(cafedra.research_works, lang_code),
+            "partner_companies": _serialize_translated_section(cafedra.partner_companies, lang_code),
+            "objectives": _serialize_translated_section(cafedra.objectives, lang_code),
+            "duties": _serialize_translated_section(cafedra.duties, lang_code),
+            "projects": _serialize_translated_section(cafedra.projects, lang_code),
+            "directions_of_action": _serialize_translated_section(cafedra.directions_of_action, lang_code),
             "deputy_directors": [
                 {
                     "id": person.id,
@@ -1483,6 +1415,7 @@ async def update_cafedra(
 
         cafedra.updated_at = now
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}", f"faculty:{cafedra.faculty_code}")
         await on_cafedra_change(db, cafedra_code)
 
         return JSONResponse(content={"status_code": 200, "message": "Cafedra updated successfully."}, status_code=status.HTTP_200_OK)
@@ -1495,12 +1428,14 @@ async def update_cafedra(
 async def delete_cafedra(cafedra_code: str, db: AsyncSession = Depends(get_db)):
     try:
         cafedra_query = await db.execute(select(Cafedra).where(Cafedra.cafedra_code == cafedra_code))
-        if not cafedra_query.scalar_one_or_none():
+        cafedra = cafedra_query.scalar_one_or_none()
+        if not cafedra:
             return JSONResponse(content={"status_code": 404, "message": "Cafedra not found."}, status_code=status.HTTP_404_NOT_FOUND)
 
         await db.execute(sqlalchemy_delete(CafedraTr).where(CafedraTr.cafedra_code == cafedra_code))
         await db.execute(sqlalchemy_delete(Cafedra).where(Cafedra.cafedra_code == cafedra_code))
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}", f"faculty:{cafedra.faculty_code}")
         await on_cafedra_delete(cafedra_code)
         return JSONResponse(content={"status_code": 200, "message": "Cafedra deleted successfully."}, status_code=status.HTTP_200_OK)
     except Exception as e:
@@ -1519,6 +1454,7 @@ async def upload_cafedra_director_image(cafedra_code: str, image: UploadFile, db
         director.profile_image = new_path
         director.updated_at = datetime.now(timezone.utc)
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         if old_path: safe_delete_file(old_path)
         return JSONResponse(content={"status_code": 200, "message": "Director profile image uploaded successfully.", "data": {"profile_image": new_path}}, status_code=status.HTTP_200_OK)
     except HTTPException:
@@ -1542,6 +1478,7 @@ async def upload_cafedra_deputy_director_image(deputy_director_id: int, image: U
         deputy_director.profile_image = new_path
         deputy_director.updated_at = datetime.now(timezone.utc)
         await db.commit()
+        await invalidate(f"cafedra:{deputy_director.cafedra_code}")
         if old_path: safe_delete_file(old_path)
         return JSONResponse(content={"status_code": 200, "message": "Deputy director profile image uploaded successfully.", "data": {"profile_image": new_path}}, status_code=status.HTTP_200_OK)
     except HTTPException:
@@ -1563,6 +1500,7 @@ async def upload_cafedra_worker_image(worker_id: int, image: UploadFile, db: Asy
         worker.profile_image = new_path
         worker.updated_at = datetime.now(timezone.utc)
         await db.commit()
+        await invalidate(f"cafedra:{worker.cafedra_code}")
         if old_path: safe_delete_file(old_path)
         return JSONResponse(content={"status_code": 200, "message": "Worker profile image uploaded successfully.", "data": {"profile_image": new_path}}, status_code=status.HTTP_200_OK)
     except HTTPException:
@@ -1666,6 +1604,7 @@ async def create_laboratory(
                 ))
 
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         return JSONResponse(content={"status_code": 201, "message": "Laboratory created successfully.", "data": {"id": lab.id}}, status_code=status.HTTP_201_CREATED)
     except Exception as e:
         logger.exception("500 Internal Server Error")
@@ -1684,10 +1623,12 @@ async def get_all_laboratories(
         total_q = await db.execute(select(func.count()).select_from(query.subquery()))
         total = total_q.scalar() or 0
 
-        labs_q = await db.execute(query.order_by(CafedraLaboratory.id.asc()).offset(start).limit(end - start))
+        labs_q = await db.execute(
+            query.options(*_LABORATORY_LOADERS).order_by(CafedraLaboratory.id.asc()).offset(start).limit(end - start)
+        )
         labs = labs_q.scalars().all()
 
-        labs_arr = [await _serialize_laboratory(lab, lang, db) for lab in labs]
+        labs_arr = [_serialize_laboratory(lab, lang) for lab in labs]
 
         return JSONResponse(content={"status_code": 200, "laboratories": labs_arr, "total": total}, status_code=status.HTTP_200_OK)
     except Exception as e:
@@ -1701,12 +1642,14 @@ async def get_laboratory(
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        lab_q = await db.execute(select(CafedraLaboratory).where(CafedraLaboratory.id == laboratory_id))
+        lab_q = await db.execute(
+            select(CafedraLaboratory).where(CafedraLaboratory.id == laboratory_id).options(*_LABORATORY_LOADERS)
+        )
         lab = lab_q.scalar_one_or_none()
         if not lab:
             return JSONResponse(content={"status_code": 404, "message": "Laboratory not found."}, status_code=status.HTTP_404_NOT_FOUND)
 
-        laboratory = await _serialize_laboratory(lab, lang, db)
+        laboratory = _serialize_laboratory(lab, lang)
         return JSONResponse(content={"status_code": 200, "laboratory": laboratory}, status_code=status.HTTP_200_OK)
     except Exception as e:
         logger.exception("500 Internal Server Error")
@@ -1736,6 +1679,7 @@ async def upload_laboratory_image(laboratory_id: int, image: UploadFile, db: Asy
         lab.image_url = new_path
         lab.updated_at = datetime.now(timezone.utc)
         await db.commit()
+        await invalidate(f"cafedra:{lab.cafedra_code}")
         if old_path: safe_delete_file(old_path)
         return JSONResponse(content={"status_code": 200, "message": "Laboratory image uploaded successfully.", "data": {"image_url": new_path}}, status_code=status.HTTP_200_OK)
     except Exception as e:
@@ -1769,6 +1713,7 @@ async def upload_laboratory_gallery_image(laboratory_id: int, image: UploadFile,
         )
         db.add(gallery_img)
         await db.commit()
+        await invalidate(f"cafedra:{lab.cafedra_code}")
         await db.refresh(gallery_img)
 
         return JSONResponse(
@@ -1791,8 +1736,11 @@ async def delete_laboratory_gallery_image(gallery_image_id: int, db: AsyncSessio
             return JSONResponse(content={"status_code": 404, "message": "Gallery image not found."}, status_code=status.HTTP_404_NOT_FOUND)
 
         old_path = img.image_url
+        lab_query = await db.execute(select(CafedraLaboratory.cafedra_code).where(CafedraLaboratory.id == img.laboratory_id))
+        cafedra_code = lab_query.scalar_one()
         await db.delete(img)
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         if old_path:
             safe_delete_file(old_path)
 
@@ -1818,6 +1766,7 @@ async def create_worker(cafedra_code: str, request: Worker, db: AsyncSession):
         now = datetime.now(timezone.utc)
         worker = await _create_single_person(CafedraWorker, CafedraWorkerTr, "worker_id", cafedra_code, request, now, db)
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 201, "message": "Worker added successfully.", "data": {"id": worker.id}}, status_code=status.HTTP_201_CREATED)
     except Exception:
@@ -1833,6 +1782,7 @@ async def update_worker(worker_id: int, request: UpdateWorker, db: AsyncSession)
             return JSONResponse(content={"status_code": 404, "message": "Worker not found."}, status_code=status.HTTP_404_NOT_FOUND)
         cafedra_code = person.cafedra_code
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 200, "message": "Worker updated successfully.", "data": {"id": worker_id}}, status_code=status.HTTP_200_OK)
     except Exception:
@@ -1847,6 +1797,7 @@ async def delete_worker(worker_id: int, db: AsyncSession):
         if cafedra_code is None:
             return JSONResponse(content={"status_code": 404, "message": "Worker not found."}, status_code=status.HTTP_404_NOT_FOUND)
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         if profile_image:
             safe_delete_file(profile_image)
         await on_cafedra_change(db, cafedra_code)
@@ -1864,6 +1815,7 @@ async def create_deputy_director(cafedra_code: str, request: DeputyDirector, db:
         now = datetime.now(timezone.utc)
         deputy = await _create_single_person(CafedraDeputyDirector, CafedraDeputyDirectorTr, "deputy_director_id", cafedra_code, request, now, db)
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 201, "message": "Deputy director added successfully.", "data": {"id": deputy.id}}, status_code=status.HTTP_201_CREATED)
     except Exception:
@@ -1879,6 +1831,7 @@ async def update_deputy_director(deputy_director_id: int, request: UpdateDeputyD
             return JSONResponse(content={"status_code": 404, "message": "Deputy director not found."}, status_code=status.HTTP_404_NOT_FOUND)
         cafedra_code = person.cafedra_code
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 200, "message": "Deputy director updated successfully.", "data": {"id": deputy_director_id}}, status_code=status.HTTP_200_OK)
     except Exception:
@@ -1893,6 +1846,7 @@ async def delete_deputy_director(deputy_director_id: int, db: AsyncSession):
         if cafedra_code is None:
             return JSONResponse(content={"status_code": 404, "message": "Deputy director not found."}, status_code=status.HTTP_404_NOT_FOUND)
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         if profile_image:
             safe_delete_file(profile_image)
         await on_cafedra_change(db, cafedra_code)
@@ -1910,6 +1864,7 @@ async def create_council_member(cafedra_code: str, request: ScientificCouncilMem
         now = datetime.now(timezone.utc)
         member = await _create_single_person(CafedraCouncilMember, CafedraCouncilMemberTr, "council_member_id", cafedra_code, request, now, db)
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 201, "message": "Council member added successfully.", "data": {"id": member.id}}, status_code=status.HTTP_201_CREATED)
     except Exception:
@@ -1925,6 +1880,7 @@ async def update_council_member(member_id: int, request: UpdateCouncilMember, db
             return JSONResponse(content={"status_code": 404, "message": "Council member not found."}, status_code=status.HTTP_404_NOT_FOUND)
         cafedra_code = person.cafedra_code
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 200, "message": "Council member updated successfully.", "data": {"id": member_id}}, status_code=status.HTTP_200_OK)
     except Exception:
@@ -1939,6 +1895,7 @@ async def delete_council_member(member_id: int, db: AsyncSession):
         if cafedra_code is None:
             return JSONResponse(content={"status_code": 404, "message": "Council member not found."}, status_code=status.HTTP_404_NOT_FOUND)
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 200, "message": "Council member deleted successfully."}, status_code=status.HTTP_200_OK)
     except Exception:
@@ -2039,6 +1996,7 @@ async def update_laboratory(laboratory_id: int, request: UpdateLaboratory, db: A
                     ))
 
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 200, "message": "Laboratory updated successfully.", "data": {"id": laboratory_id}}, status_code=status.HTTP_200_OK)
     except Exception:
@@ -2063,6 +2021,7 @@ async def delete_laboratory(laboratory_id: int, db: AsyncSession):
 
         await db.execute(sqlalchemy_delete(CafedraLaboratory).where(CafedraLaboratory.id == laboratory_id))
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
 
         if main_image:
             safe_delete_file(main_image)
@@ -2086,16 +2045,11 @@ def _has_data(intro_html: str | None, items: list[dict]) -> bool:
 
 async def get_cafedra_scientific_activity(cafedra_code: str, lang_code: str, db: AsyncSession):
     try:
-        if not await _verify_cafedra(cafedra_code, db):
+        cafedra = await _load_cafedra_graph(cafedra_code, _SCIENTIFIC_ACTIVITY_PARTS, db)
+        if not cafedra:
             return JSONResponse(content={"status_code": 404, "message": "Cafedra not found."}, status_code=status.HTTP_404_NOT_FOUND)
 
-        tr_query = await db.execute(
-            select(CafedraTr).where(
-                CafedraTr.cafedra_code == cafedra_code,
-                CafedraTr.lang_code == lang_code,
-            )
-        )
-        tr = tr_query.scalar_one_or_none()
+        tr = _tr_for(cafedra.translations, lang_code)
 
         research_areas_intro = tr.research_areas_intro if tr else None
         projects_grants_intro = tr.projects_grants_intro if tr else None
@@ -2104,21 +2058,18 @@ async def get_cafedra_scientific_activity(cafedra_code: str, lang_code: str, db:
         industry_cooperation_intro = tr.industry_cooperation_intro if tr else None
         international_cooperation_intro = tr.international_cooperation_intro if tr else None
 
-        research_areas = await _serialize_translated_section(
-            CafedraResearchWork, CafedraResearchWorkTr, "research_work_id", cafedra_code, lang_code, db,
-            emit_html_content=True,
+        research_areas = _serialize_translated_section(
+            cafedra.research_works, lang_code, emit_html_content=True,
         )
-        projects = await _serialize_translated_section(
-            CafedraProject, CafedraProjectTr, "project_id", cafedra_code, lang_code, db,
-            extra_keys=("url",),
+        projects = _serialize_translated_section(
+            cafedra.projects, lang_code, extra_keys=("url",),
         )
-        partner_companies = await _serialize_translated_section(
-            CafedraPartnerCompany, CafedraPartnerCompanyTr, "partner_company_id", cafedra_code, lang_code, db,
-            extra_keys=("logo_url", "website_url"),
+        partner_companies = _serialize_translated_section(
+            cafedra.partner_companies, lang_code, extra_keys=("logo_url", "website_url"),
         )
-        laboratories = await _serialize_laboratories_for_cafedra(cafedra_code, lang_code, db)
-        publications, publication_years = await _serialize_publications(cafedra_code, lang_code, db)
-        patents, patent_years = await _serialize_patents(cafedra_code, lang_code, db)
+        laboratories = _serialize_laboratories(cafedra.laboratories, lang_code)
+        publications, publication_years = _serialize_publications(cafedra.scientific_publications, lang_code)
+        patents, patent_years = _serialize_patents(cafedra.patents, lang_code)
 
         sections = {
             "research_areas": {
@@ -2221,6 +2172,7 @@ async def update_scientific_intros(cafedra_code: str, request: UpdateScientificI
             tr.updated_at = now
 
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 200, "message": "Scientific activity intros updated successfully."}, status_code=status.HTTP_200_OK)
     except Exception:
@@ -2333,6 +2285,7 @@ async def create_research_area(cafedra_code: str, request: RichTextSectionItem,
             body_field="html_content",
         )
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 201, "message": "Research area added successfully.", "data": {"id": item.id}}, status_code=status.HTTP_201_CREATED)
     except Exception:
@@ -2351,6 +2304,7 @@ async def update_research_area(item_id: int, request: UpdateRichTextSectionItem,
             return JSONResponse(content={"status_code": 404, "message": "Research area not found."}, status_code=status.HTTP_404_NOT_FOUND)
         cafedra_code = item.cafedra_code
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 200, "message": "Research area updated successfully.", "data": {"id": item_id}}, status_code=status.HTTP_200_OK)
     except Exception:
@@ -2365,6 +2319,7 @@ async def delete_research_area(item_id: int, db: AsyncSession):
         if cafedra_code is None:
             return JSONResponse(content={"status_code": 404, "message": "Research area not found."}, status_code=status.HTTP_404_NOT_FOUND)
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 200, "message": "Research area deleted successfully."}, status_code=status.HTTP_200_OK)
     except Exception:
@@ -2382,6 +2337,7 @@ async def create_project(cafedra_code: str, request: ProjectGrantItem, db: Async
             parent_fields=("url",),
         )
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 201, "message": "Project added successfully.", "data": {"id": item.id}}, status_code=status.HTTP_201_CREATED)
     except Exception:
@@ -2400,6 +2356,7 @@ async def update_project(item_id: int, request: UpdateProjectGrantItem, db: Asyn
             return JSONResponse(content={"status_code": 404, "message": "Project not found."}, status_code=status.HTTP_404_NOT_FOUND)
         cafedra_code = item.cafedra_code
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 200, "message": "Project updated successfully.", "data": {"id": item_id}}, status_code=status.HTTP_200_OK)
     except Exception:
@@ -2414,6 +2371,7 @@ async def delete_project(item_id: int, db: AsyncSession):
         if cafedra_code is None:
             return JSONResponse(content={"status_code": 404, "message": "Project not found."}, status_code=status.HTTP_404_NOT_FOUND)
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 200, "message": "Project deleted successfully."}, status_code=status.HTTP_200_OK)
     except Exception:
@@ -2431,6 +2389,7 @@ async def create_partner_company(cafedra_code: str, request: PartnerCompanyItem,
             parent_fields=("website_url",),
         )
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 201, "message": "Partner company added successfully.", "data": {"id": item.id}}, status_code=status.HTTP_201_CREATED)
     except Exception:
@@ -2449,6 +2408,7 @@ async def update_partner_company(item_id: int, request: UpdatePartnerCompanyItem
             return JSONResponse(content={"status_code": 404, "message": "Partner company not found."}, status_code=status.HTTP_404_NOT_FOUND)
         cafedra_code = item.cafedra_code
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 200, "message": "Partner company updated successfully.", "data": {"id": item_id}}, status_code=status.HTTP_200_OK)
     except Exception:
@@ -2463,6 +2423,7 @@ async def delete_partner_company(item_id: int, db: AsyncSession):
         if cafedra_code is None:
             return JSONResponse(content={"status_code": 404, "message": "Partner company not found."}, status_code=status.HTTP_404_NOT_FOUND)
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         if logo_url:
             safe_delete_file(logo_url)
         await on_cafedra_change(db, cafedra_code)
@@ -2485,6 +2446,7 @@ async def upload_partner_company_logo(item_id: int, image: UploadFile, db: Async
         company.updated_at = datetime.now(timezone.utc)
         cafedra_code = company.cafedra_code
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         if old_path:
             safe_delete_file(old_path)
         await on_cafedra_change(db, cafedra_code)
@@ -2511,6 +2473,7 @@ async def create_publication(cafedra_code: str, request: PublicationItem, db: As
         start_order = (max_order_q.scalar() or 0) + 1
         created = await _create_publications(cafedra_code, [request], now, db, start_order)
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 201, "message": "Publication added successfully.", "data": {"id": created[0].id}}, status_code=status.HTTP_201_CREATED)
     except Exception:
@@ -2551,6 +2514,7 @@ async def update_publication(item_id: int, request: UpdatePublicationItem, db: A
 
         cafedra_code = publication.cafedra_code
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 200, "message": "Publication updated successfully.", "data": {"id": item_id}}, status_code=status.HTTP_200_OK)
     except Exception:
@@ -2565,6 +2529,7 @@ async def delete_publication(item_id: int, db: AsyncSession):
         if cafedra_code is None:
             return JSONResponse(content={"status_code": 404, "message": "Publication not found."}, status_code=status.HTTP_404_NOT_FOUND)
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 200, "message": "Publication deleted successfully."}, status_code=status.HTTP_200_OK)
     except Exception:
@@ -2595,6 +2560,7 @@ async def reorder_publications(cafedra_code: str, ids: list[int], db: AsyncSessi
             publication.updated_at = now
 
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 200, "message": "Publications reordered successfully."}, status_code=status.HTTP_200_OK)
     except Exception:
@@ -2616,6 +2582,7 @@ async def create_patent(cafedra_code: str, request: PatentItem, db: AsyncSession
         start_order = (max_order_q.scalar() or 0) + 1
         created = await _create_patents(cafedra_code, [request], now, db, start_order)
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 201, "message": "Patent added successfully.", "data": {"id": created[0].id}}, status_code=status.HTTP_201_CREATED)
     except Exception:
@@ -2652,6 +2619,7 @@ async def update_patent(item_id: int, request: UpdatePatentItem, db: AsyncSessio
 
         cafedra_code = patent.cafedra_code
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 200, "message": "Patent updated successfully.", "data": {"id": item_id}}, status_code=status.HTTP_200_OK)
     except Exception:
@@ -2666,6 +2634,7 @@ async def delete_patent(item_id: int, db: AsyncSession):
         if cafedra_code is None:
             return JSONResponse(content={"status_code": 404, "message": "Patent not found."}, status_code=status.HTTP_404_NOT_FOUND)
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 200, "message": "Patent deleted successfully."}, status_code=status.HTTP_200_OK)
     except Exception:
@@ -2694,6 +2663,7 @@ async def reorder_patents(cafedra_code: str, ids: list[int], db: AsyncSession):
             patent.updated_at = now
 
         await db.commit()
+        await invalidate(f"cafedra:{cafedra_code}")
         await on_cafedra_change(db, cafedra_code)
         return JSONResponse(content={"status_code": 200, "message": "Patents reordered successfully."}, status_code=status.HTTP_200_OK)
     except Exception:
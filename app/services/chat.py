@@ -1,21 +1,28 @@
+import asyncio
+import json
 import logging
 import uuid
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 
-from openai import AsyncOpenAI, OpenAIError
-from sqlalchemy import select, text
+from openai import OpenAIError
+from sqlalchemy import func, select, text, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.openai_client import get_openai
 from app.models.chat.chat_session import ChatSession
 from app.models.chat.chat_message import ChatMessage
+from app.services.chat_answer_cache import lookup_answer, store_answer
+from app.services.chat_knowledge import retrieve_knowledge
+from app.services.chat_stats import record_chat_activity
 
 _SYSTEM_PROMPT = """You are the official AI assistant of Azerbaijan Technical University (AzTU).
 Your sole purpose is to answer questions strictly using the AZTU KNOWLEDGE BASE
-provided below. Do not rely on your own training data for AzTU facts.
+excerpts provided below. Do not rely on your own training data for AzTU facts.
 
 STRICT OPERATING RULES:
 1. ONLY answer questions directly related to Azerbaijan Technical University.
@@ -38,20 +45,6 @@ _FALLBACK_REPLY = (
     "Bağışlayın, hazırda cavab verə bilmirəm. Zəhmət olmasa bir azdan yenidən cəhd edin."
 )
 
-_KB_PATH = Path(__file__).resolve().parents[2] / "aztu_knowledge_base.md"
-
-
-def _load_static_knowledge() -> str:
-    if _KB_PATH.exists():
-        return _KB_PATH.read_text(encoding="utf-8")
-    return ""
-
-
-# Parsed once per process (i.e. per deploy). Restart the service to pick up
-# changes to aztu_knowledge_base.md.
-_STATIC_KNOWLEDGE: str = _load_static_knowledge()
-
-
 async def _insert_session(
     db: AsyncSession, session_id: str, ip_address: str
 ) -> ChatSession:
@@ -94,12 +87,154 @@ async def _insert_session(
     return session
 
 
-async def get_chat_reply(
+# ── History window ───────────────────────────────────────────────────────────
+#
+# Only the newest CHAT_HISTORY_TURNS turns (within CHAT_HISTORY_TOKEN_BUDGET)
+# are sent verbatim; the rows are read newest-first with a LIMIT on the
+# (session_id, created_at) index. Turns that fall out of the window are folded
+# into ChatSession.summary by a background task, after the reply is sent.
+
+# Rough chars-per-token for Azerbaijani/English text; only used for budgeting.
+_CHARS_PER_TOKEN = 4
+# Oldest unsummarized messages folded in one summarization call. Anything older
+# than that (long sessions from before the window existed) is simply dropped.
+_MAX_FOLD_MESSAGES = 40
+_SUMMARY_MAX_CHARS = 800
+
+_SUMMARY_PROMPT = (
+    "You maintain a running summary of a visitor's conversation with the AzTU "
+    "university assistant. Merge the previous summary with the new messages. "
+    "Keep what the visitor asked about and any names, programmes, dates or "
+    "numbers that were discussed; drop greetings and refusals. Write in the "
+    f"visitor's language, at most {_SUMMARY_MAX_CHARS} characters."
+)
+
+_background_tasks: set[asyncio.Task] = set()
+
+
+async def _load_history_window(
+    db: AsyncSession, session: ChatSession
+) -> tuple[list[ChatMessage], bool]:
+    """Messages to send verbatim, oldest first, and whether older unsummarized
+    messages exist outside the window."""
+    limit = settings.CHAT_HISTORY_TURNS * 2
+    result = await db.execute(
+        select(ChatMessage)
+        .where(
+            ChatMessage.session_id == session.session_id,
+            ChatMessage.id > (session.summarized_through_id or 0),
+        )
+        .order_by(ChatMessage.created_at.desc(), ChatMessage.id.desc())
+        .limit(limit + 1)
+    )
+    newest_first = result.scalars().all()
+
+    budget = settings.CHAT_HISTORY_TOKEN_BUDGET * _CHARS_PER_TOKEN
+    window: list[ChatMessage] = []
+    for msg in newest_first[:limit]:
+        budget -= len(msg.content)
+        if budget < 0 and window:
+            break
+        window.append(msg)
+    window.reverse()
+    # Start on a user turn so the model never sees an orphaned answer.
+    while window and window[0].role != "user":
+        window.pop(0)
+    return window, len(newest_first) > len(window)
+
+
+def _spawn(coro) -> None:
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)  # keep a reference until it finishes
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def _fold_history(session_id: str) -> None:
+    """Fold the messages older than the current window into the summary.
+
+    Runs in its own DB session. The update is conditional on
+    summarized_through_id being unchanged, so two overlapping folds for one
+    session cannot both apply.
+    """
+    if not settings.OPEN_AI_KEY:
+        return
+    try:
+        async with AsyncSessionLocal() as db:
+            session = (await db.execute(
+                select(ChatSession).where(ChatSession.session_id == session_id)
+            )).scalar_one_or_none()
+            if session is None:
+                return
+            window, overflow = await _load_history_window(db, session)
+            if not overflow or not window:
+                return
+            previous_through = session.summarized_through_id
+            older = (await db.execute(
+                select(ChatMessage)
+                .where(
+                    ChatMessage.session_id == session_id,
+                    ChatMessage.id > (previous_through or 0),
+                    ChatMessage.id < window[0].id,
+                )
+                .order_by(ChatMessage.created_at.desc(), ChatMessage.id.desc())
+                .limit(_MAX_FOLD_MESSAGES)
+            )).scalars().all()
+            if not older:
+                return
+            older = list(reversed(older))
+
+            transcript = "\n".join(f"{m.role}: {m.content}" for m in older)
+            response = await get_openai().chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": _SUMMARY_PROMPT},
+                    {"role": "user", "content": (
+                        f"Previous summary:\n{session.summary or '(none)'}\n\n"
+                        f"New messages:\n{transcript}"
+                    )},
+                ],
+                max_tokens=300,
+                temperature=0.2,
+            )
+            summary = (response.choices[0].message.content or "").strip()
+            if not summary:
+                return
+
+            await db.execute(
+                update(ChatSession)
+                .where(
+                    ChatSession.session_id == session_id,
+                    func.coalesce(ChatSession.summarized_through_id, 0) == (previous_through or 0),
+                )
+                .values(summary=summary[:_SUMMARY_MAX_CHARS], summarized_through_id=max(m.id for m in older))
+            )
+            await db.commit()
+    except OpenAIError as exc:
+        logger.warning("Chat history summary failed (%s): %s", type(exc).__name__, exc)
+    except Exception:
+        logger.exception("Chat history summary failed for session %s", session_id)
+
+
+@dataclass
+class _Turn:
+    session: ChatSession
+    # Opening question: no history, so the answer depends on the question alone
+    # and may come from (or go into) the answer cache.
+    cacheable: bool
+    # The session was created by this turn (counted in app.services.chat_stats).
+    new_session: bool = False
+    cached_reply: Optional[str] = None
+    messages: list[dict] = field(default_factory=list)
+
+
+async def _prepare_turn(
     message: str,
     session_id: Optional[str],
     ip_address: str,
     db: AsyncSession,
-) -> tuple[str, str]:
+) -> _Turn:
+    """Resolve the visitor's session and either find a cached answer or build
+    the model input for ``message``."""
     # ── Resolve or create session ────────────────────────────────────────────
     session: Optional[ChatSession] = None
 
@@ -114,52 +249,90 @@ async def get_chat_reply(
         if session is not None and session.ip_address != ip_address:
             session = None
 
-    if session is None:
+    new_session = session is None
+    if new_session:
         session_id = str(uuid.uuid4())
         session = await _insert_session(db, session_id, ip_address)
 
-    # ── Load conversation history ────────────────────────────────────────────
-    result = await db.execute(
-        select(ChatMessage)
-        .where(ChatMessage.session_id == session.session_id)
-        .order_by(ChatMessage.created_at)
+    # ── Load the conversation window ─────────────────────────────────────────
+    history, overflow = await _load_history_window(db, session)
+    if overflow:
+        _spawn(_fold_history(session.session_id))
+
+    turn = _Turn(
+        session=session,
+        cacheable=not history and not session.summary,
+        new_session=new_session,
     )
-    history = result.scalars().all()
+    if turn.cacheable:
+        turn.cached_reply = await lookup_answer(message)
+        if turn.cached_reply is not None:
+            return turn
 
-    # ── Build system prompt with verified knowledge ──────────────────────────
+    # ── Build system prompt with the relevant knowledge only ─────────────────
+    # The knowledge base is chunked and indexed (app.services.chat_knowledge);
+    # only the chunks that match this question go into the prompt.
+    previous_question = next(
+        (msg.content for msg in reversed(history) if msg.role == "user"), None
+    )
+    excerpts = await retrieve_knowledge(message, previous_question)
     system_content = _SYSTEM_PROMPT
-    if _STATIC_KNOWLEDGE:
+    if excerpts:
         system_content += (
             "\n\nAZTU KNOWLEDGE BASE (yeganə icazə verilən məlumat mənbəyi):\n"
-            f"{_STATIC_KNOWLEDGE}"
+            + "\n\n---\n\n".join(excerpts)
         )
 
     messages = [{"role": "system", "content": system_content}]
+    if session.summary:
+        messages.append({
+            "role": "system",
+            "content": f"Summary of the earlier part of this conversation:\n{session.summary}",
+        })
     for msg in history:
         messages.append({"role": msg.role, "content": msg.content})
     messages.append({"role": "user", "content": message})
+    turn.messages = messages
+    return turn
 
-    # ── Call OpenAI ──────────────────────────────────────────────────────────
+
+def _log_missing_key() -> None:
     # A model failure must not surface as a bare 500 with no detail: that is
     # exactly how a missing OPEN_AI_KEY went unnoticed, since a 401 comes back in
     # milliseconds and looks like any other server error from the widget's side.
     # The visitor gets a plain "try again" and the cause is logged once, loudly.
-    if not settings.OPEN_AI_KEY:
-        logger.error(
-            "OPEN_AI_KEY is not configured — the chatbot cannot answer. "
-            "Set it in the environment and restart."
-        )
+    logger.error(
+        "OPEN_AI_KEY is not configured — the chatbot cannot answer. "
+        "Set it in the environment and restart."
+    )
+
+
+_COMPLETION_PARAMS = {"model": "gpt-4o", "max_tokens": 400, "temperature": 0.3}
+
+
+async def get_chat_reply(
+    message: str,
+    session_id: Optional[str],
+    ip_address: str,
+    db: AsyncSession,
+) -> tuple[str, str]:
+    turn = await _prepare_turn(message, session_id, ip_address, db)
+    session = turn.session
+
+    # ── Call OpenAI ──────────────────────────────────────────────────────────
+    if turn.cached_reply is not None:
+        reply = turn.cached_reply
+    elif not settings.OPEN_AI_KEY:
+        _log_missing_key()
         reply = _FALLBACK_REPLY
     else:
         try:
-            client = AsyncOpenAI(api_key=settings.OPEN_AI_KEY, timeout=30.0)
-            response = await client.chat.completions.create(
-                model="gpt-4o",
-                messages=messages,
-                max_tokens=400,
-                temperature=0.3,
+            response = await get_openai().chat.completions.create(
+                messages=turn.messages, **_COMPLETION_PARAMS
             )
             reply = response.choices[0].message.content or _FALLBACK_REPLY
+            if turn.cacheable and reply != _FALLBACK_REPLY:
+                await store_answer(message, reply)
         except OpenAIError as exc:
             # Auth, quota, rate limit and timeouts all land here. The class name
             # is what distinguishes "key is wrong" from "we are out of credit".
@@ -174,5 +347,93 @@ async def get_chat_reply(
     db.add(ChatMessage(session_id=session.session_id, role="assistant", content=reply))
     session.last_active_at = datetime.now(timezone.utc)
     await db.commit()
+    await record_chat_activity(
+        session_ip=ip_address if turn.new_session else None, messages=2
+    )
 
     return reply, session.session_id
+
+
+# ── Streaming ────────────────────────────────────────────────────────────────
+#
+# Same turn as get_chat_reply, but the reply is forwarded as Server-Sent Events
+# while the model produces it:
+#
+#   event: session  data: {"session_id": "..."}
+#   event: delta    data: {"text": "..."}        (repeated)
+#   event: done     data: {"reply": "...", "session_id": "..."}
+#
+# The request's DB session is not used once streaming starts — it is released
+# with the request, not with the response — so the turn is written afterwards
+# on a session of its own.
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _persist_turn(session_id: str, message: str, reply: str) -> None:
+    try:
+        async with AsyncSessionLocal() as db:
+            db.add(ChatMessage(session_id=session_id, role="user", content=message))
+            db.add(ChatMessage(session_id=session_id, role="assistant", content=reply))
+            await db.execute(
+                update(ChatSession)
+                .where(ChatSession.session_id == session_id)
+                .values(last_active_at=datetime.now(timezone.utc))
+            )
+            await db.commit()
+    except Exception:
+        logger.exception("Could not save streamed chat turn for session %s", session_id)
+        return
+    await record_chat_activity(messages=2)
+
+
+async def stream_chat_reply(
+    message: str,
+    session_id: Optional[str],
+    ip_address: str,
+    db: AsyncSession,
+) -> AsyncIterator[str]:
+    """Prepare the turn and return the SSE event stream for its reply."""
+    turn = await _prepare_turn(message, session_id, ip_address, db)
+    # A new session must exist before the stream's own DB session saves into it.
+    await db.commit()
+    if turn.new_session:
+        await record_chat_activity(session_ip=ip_address)
+    return _stream_reply(turn, message)
+
+
+async def _stream_reply(turn: _Turn, message: str) -> AsyncIterator[str]:
+    session_id = turn.session.session_id
+    parts: list[str] = []
+    try:
+        yield _sse("session", {"session_id": session_id})
+        if turn.cached_reply is not None:
+            parts.append(turn.cached_reply)
+            yield _sse("delta", {"text": turn.cached_reply})
+        elif not settings.OPEN_AI_KEY:
+            _log_missing_key()
+        else:
+            try:
+                stream = await get_openai().chat.completions.create(
+                    messages=turn.messages, stream=True, **_COMPLETION_PARAMS
+                )
+                async for chunk in stream:
+                    text_delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if text_delta:
+                        parts.append(text_delta)
+                        yield _sse("delta", {"text": text_delta})
+                if turn.cacheable and parts:
+                    await store_answer(message, "".join(parts))
+            except OpenAIError as exc:
+                logger.error("OpenAI call failed (%s): %s", type(exc).__name__, exc)
+            except Exception:
+                logger.exception("Unexpected failure streaming a chat reply")
+        if not parts:
+            parts.append(_FALLBACK_REPLY)
+            yield _sse("delta", {"text": _FALLBACK_REPLY})
+        yield _sse("done", {"reply": "".join(parts), "session_id": session_id})
+    finally:
+        # Also reached when the visitor disconnects mid-answer: whatever was
+        # generated so far is kept, like a reply that was cut short.
+        _spawn(_persist_turn(session_id, message, "".join(parts) or _FALLBACK_REPLY))
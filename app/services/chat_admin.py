@@ -7,27 +7,28 @@ copy. The IP is never written to the activity log — see permission_map, where
 these routes are ``no_audit``-free reads carrying no target label.
 """
 
-from datetime import datetime, time, timedelta, timezone
+from datetime import datetime, time, timezone
 from typing import Optional
 
 from fastapi import status
 from fastapi.responses import JSONResponse
 from sqlalchemy import delete as sqlalchemy_delete
-from sqlalchemy import distinct, exists, func, select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cached_count
+from app.core.text_search import like_pattern
 from app.models.chat.chat_message import ChatMessage
 from app.models.chat.chat_session import ChatSession
+from app.services.chat_answer_cache import answer_cache_stats
+from app.services.chat_stats import load_chat_stats
+from app.utils.pagination import InvalidCursor, Keyset, SortKey
 
 DEFAULT_PAGE_SIZE = 25
 MAX_PAGE_SIZE = 100
 TRANSCRIPT_PAGE_SIZE = 50
 PREVIEW_LENGTH = 160
 
-DAILY_BUCKETS = 30
-WEEKLY_BUCKETS = 12
-MONTHLY_BUCKETS = 12
-
 SORTABLE = {
     "last_active_at": ChatSession.last_active_at,
     "started_at": ChatSession.started_at,
@@ -93,7 +94,10 @@ async def list_chat_sessions(
     q: Optional[str] = None,
     sort_by: str = "last_active_at",
     sort_dir: str = "desc",
+    cursor: Optional[str] = None,
 ) -> JSONResponse:
+    """One page of sessions, by ``page`` or — when ``cursor`` is given, empty
+    for the first page — after the previous page's ``next_cursor``."""
     page = max(1, page)
     page_size = max(1, min(page_size, MAX_PAGE_SIZE))
 
@@ -110,12 +114,13 @@ async def list_chat_sessions(
 
     term = (q or "").strip()
     if term:
-        pattern = f"%{term}%"
+        # Uncorrelated, so the matching messages are found once through
+        # ix_chat_messages_content_trgm and semi-joined, rather than probed
+        # session by session.
         filters.append(
-            exists(
-                select(ChatMessage.id).where(
-                    ChatMessage.session_id == ChatSession.session_id,
-                    ChatMessage.content.ilike(pattern),
+            ChatSession.session_id.in_(
+                select(ChatMessage.session_id).where(
+                    ChatMessage.content.ilike(like_pattern(term))
                 )
             )
         )
@@ -123,7 +128,7 @@ async def list_chat_sessions(
     count_stmt = select(func.count()).select_from(ChatSession)
     if filters:
         count_stmt = count_stmt.where(*filters)
-    total = (await db.execute(count_stmt)).scalar_one()
+    total = await cached_count(db, count_stmt)
 
     message_count = (
         select(func.count(ChatMessage.id))
@@ -144,6 +149,7 @@ async def list_chat_sessions(
     )
 
     stmt = select(
+        ChatSession.id,
         ChatSession.session_id,
         ChatSession.ip_address,
         ChatSession.started_at,
@@ -155,13 +161,31 @@ async def list_chat_sessions(
         stmt = stmt.where(*filters)
 
     column = SORTABLE.get(sort_by, ChatSession.last_active_at)
-    ordering = column.asc() if sort_dir == "asc" else column.desc()
-    stmt = (
-        stmt.order_by(ordering, ChatSession.id.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
+    # The id tie-breaker follows the sort direction, so both directions are
+    # served by the (sort column DESC, id DESC) indexes — ascending by scanning
+    # them backwards — and the cursor stays a single row-value comparison.
+    descending = sort_dir != "asc"
+    keyset = Keyset(
+        SortKey(column, descending=descending),
+        SortKey(ChatSession.id, descending=descending),
     )
-    rows = (await db.execute(stmt)).all()
+    stmt = stmt.order_by(*keyset.order_by())
+
+    next_cursor = None
+    if cursor is not None:
+        try:
+            if cursor:
+                stmt = stmt.where(keyset.after(cursor))
+        except InvalidCursor as exc:
+            return _error(str(exc), status.HTTP_400_BAD_REQUEST)
+        rows, next_cursor = keyset.page((await db.execute(stmt.limit(page_size + 1))).all(), page_size)
+        has_more = next_cursor is not None
+    else:
+        # One extra row answers has_more exactly, whatever the cached total says.
+        stmt = stmt.offset((page - 1) * page_size).limit(page_size + 1)
+        rows = (await db.execute(stmt)).all()
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
 
     items = [
         {
@@ -175,156 +199,24 @@ async def list_chat_sessions(
         for row in rows
     ]
 
-    return _ok(
-        {
-            "items": items,
-            "total": total,
-            "page": page,
-            "page_size": page_size,
-            "has_more": (page - 1) * page_size + len(rows) < total,
-        }
-    )
-
-
-def _bucket(column, granularity: str):
-    """date_trunc in UTC, so buckets do not drift with the server TimeZone setting."""
-    return func.date_trunc(granularity, func.timezone("UTC", column))
-
-
-async def _bucket_series(db: AsyncSession, granularity: str, cutoff: datetime) -> list:
-    session_bucket = _bucket(ChatSession.started_at, granularity)
-    session_rows = (
-        await db.execute(
-            select(
-                session_bucket.label("bucket"),
-                func.count(ChatSession.id).label("sessions"),
-                func.count(distinct(ChatSession.ip_address)).label("unique_ips"),
-            )
-            .where(ChatSession.started_at >= cutoff)
-            .group_by(session_bucket)
-        )
-    ).all()
-
-    message_bucket = _bucket(ChatMessage.created_at, granularity)
-    message_rows = (
-        await db.execute(
-            select(
-                message_bucket.label("bucket"),
-                func.count(ChatMessage.id).label("messages"),
-            )
-            .where(ChatMessage.created_at >= cutoff)
-            .group_by(message_bucket)
-        )
-    ).all()
-
-    merged: dict = {}
-    for row in session_rows:
-        merged[row.bucket] = {
-            "bucket": row.bucket.date().isoformat(),
-            "sessions": row.sessions,
-            "unique_ips": row.unique_ips,
-            "messages": 0,
-        }
-    for row in message_rows:
-        entry = merged.get(row.bucket)
-        if entry is None:
-            entry = merged[row.bucket] = {
-                "bucket": row.bucket.date().isoformat(),
-                "sessions": 0,
-                "unique_ips": 0,
-                "messages": 0,
-            }
-        entry["messages"] = row.messages
-
-    return [merged[key] for key in sorted(merged)]
+    data = {"items": items, "total": total, "page_size": page_size, "has_more": has_more}
+    if cursor is not None:
+        data["next_cursor"] = next_cursor
+    else:
+        data["page"] = page
+    return _ok(data)
 
 
 async def get_chat_stats(db: AsyncSession) -> JSONResponse:
+    """Read from the daily rollup (app.services.chat_stats), not the raw tables."""
     now = datetime.now(timezone.utc)
-    today_start = datetime.combine(now.date(), time.min, tzinfo=timezone.utc)
-    day7 = now - timedelta(days=7)
-    day30 = now - timedelta(days=30)
-
-    session_totals = (
-        await db.execute(
-            select(
-                func.count(ChatSession.id)
-                .filter(ChatSession.started_at >= today_start)
-                .label("today"),
-                func.count(ChatSession.id)
-                .filter(ChatSession.started_at >= day7)
-                .label("last_7_days"),
-                func.count(ChatSession.id).label("last_30_days"),
-                func.count(distinct(ChatSession.ip_address))
-                .filter(ChatSession.started_at >= today_start)
-                .label("ips_today"),
-                func.count(distinct(ChatSession.ip_address))
-                .filter(ChatSession.started_at >= day7)
-                .label("ips_last_7_days"),
-                func.count(distinct(ChatSession.ip_address)).label("ips_last_30_days"),
-            ).where(ChatSession.started_at >= day30)
-        )
-    ).one()
-
-    message_totals = (
-        await db.execute(
-            select(
-                func.count(ChatMessage.id)
-                .filter(ChatMessage.created_at >= today_start)
-                .label("today"),
-                func.count(ChatMessage.id)
-                .filter(ChatMessage.created_at >= day7)
-                .label("last_7_days"),
-                func.count(ChatMessage.id).label("last_30_days"),
-            ).where(ChatMessage.created_at >= day30)
-        )
-    ).one()
-
-    all_time = (
-        await db.execute(
-            select(
-                select(func.count(ChatSession.id)).scalar_subquery().label("sessions"),
-                select(func.count(ChatMessage.id)).scalar_subquery().label("messages"),
-                select(func.count(distinct(ChatSession.ip_address)))
-                .scalar_subquery()
-                .label("unique_ips"),
-            )
-        )
-    ).one()
-
-    daily = await _bucket_series(db, "day", now - timedelta(days=DAILY_BUCKETS))
-    weekly = await _bucket_series(db, "week", now - timedelta(weeks=WEEKLY_BUCKETS))
-    monthly = await _bucket_series(db, "month", now - timedelta(days=MONTHLY_BUCKETS * 31))
-
+    stats = await load_chat_stats(db, now.date())
     return _ok(
         {
             "generated_at": _iso(now),
-            "totals": {
-                "today": {
-                    "sessions": session_totals.today,
-                    "messages": message_totals.today,
-                    "unique_ips": session_totals.ips_today,
-                },
-                "last_7_days": {
-                    "sessions": session_totals.last_7_days,
-                    "messages": message_totals.last_7_days,
-                    "unique_ips": session_totals.ips_last_7_days,
-                },
-                "last_30_days": {
-                    "sessions": session_totals.last_30_days,
-                    "messages": message_totals.last_30_days,
-                    "unique_ips": session_totals.ips_last_30_days,
-                },
-                "all_time": {
-                    "sessions": all_time.sessions,
-                    "messages": all_time.messages,
-                    "unique_ips": all_time.unique_ips,
-                },
-            },
-            "daily": daily,
-            "weekly": weekly,
-            "monthly": monthly,
-            "series": daily,
+            **stats,
+            "series": stats["daily"],
+            "answer_cache": await answer_cache_stats(),
         }
     )
 
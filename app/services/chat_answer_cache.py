@@ -0,0 +1,148 @@
+"""Answer cache for repeated chatbot questions.
+
+Most visitors open the widget and ask one of the same few questions
+(admission dates, the faculty list, a phone number). Opening questions — turns
+with no conversation history, whose answer depends on nothing but the question
+and the knowledge base — are answered from Redis when the same question, after
+normalization, was answered before:
+
+  * exact: lower-cased, Azerbaijani letters folded to ASCII, punctuation and
+    extra whitespace dropped — "Qəbul nə vaxt başlayır?" and
+    "qebul ne vaxt baslayir" share one entry;
+  * similar: otherwise the recently answered questions are compared with
+    ``difflib`` and the closest one is used if it scores at least
+    CHAT_ANSWER_CACHE_SIMILARITY and mentions the same numbers.
+
+Every key carries the knowledge generation; ``invalidate_answers()`` bumps it
+whenever the knowledge base file or a scraped source changes, so no answer
+outlives the facts it was generated from. Entries also expire on
+CHAT_ANSWER_CACHE_TTL_SECONDS. Redis trouble never fails a turn: the lookup
+misses and the model is asked.
+"""
+
+import difflib
+import hashlib
+import logging
+import re
+
+from app.core.config import settings
+from app.core.redis_client import get_redis
+
+logger = logging.getLogger("aztu.chat.answers")
+
+_GENERATION_KEY = "chat:answers:generation"
+_STATS_KEY = "chat:answers:stats"
+# Questions longer than this are never cached; they are not the repeated kind.
+_MAX_QUESTION_CHARS = 300
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+_NUMBER = re.compile(r"\d+")
+_FOLD = str.maketrans("əıöüğşç", "eiougsc")
+
+
+def normalize_question(question: str) -> str:
+    return " ".join(_WORD.findall(question.lower().translate(_FOLD)))
+
+
+def _entry_key(generation: str, normalized: str) -> str:
+    digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+    return f"chat:answers:{generation}:{digest}"
+
+
+def _recent_key(generation: str) -> str:
+    return f"chat:answers:{generation}:recent"
+
+
+def _similar(a: str, b: str) -> float:
+    # "2024" and "2025" differ by one character but ask different questions.
+    if _NUMBER.findall(a) != _NUMBER.findall(b):
+        return 0.0
+    matcher = difflib.SequenceMatcher(None, a, b)
+    if matcher.quick_ratio() < settings.CHAT_ANSWER_CACHE_SIMILARITY:
+        return 0.0
+    return matcher.ratio()
+
+
+async def lookup_answer(question: str) -> str | None:
+    """Cached reply for ``question``, or ``None``. Never raises."""
+    if not settings.CHAT_ANSWER_CACHE_ENABLED or len(question) > _MAX_QUESTION_CHARS:
+        return None
+    normalized = normalize_question(question)
+    if not normalized:
+        return None
+    try:
+        redis = await get_redis()
+        generation = await redis.get(_GENERATION_KEY) or "0"
+        reply = await redis.get(_entry_key(generation, normalized))
+        outcome = "exact_hits"
+        if reply is None:
+            recent = await redis.lrange(
+                _recent_key(generation), 0, settings.CHAT_ANSWER_CACHE_RECENT - 1
+            )
+            score, closest = max(
+                ((_similar(normalized, other), other) for other in recent),
+                default=(0.0, None),
+            )
+            if closest is not None and score >= settings.CHAT_ANSWER_CACHE_SIMILARITY:
+                reply = await redis.get(_entry_key(generation, closest))
+            outcome = "similar_hits" if reply is not None else "misses"
+        await redis.hincrby(_STATS_KEY, outcome, 1)
+        return reply
+    except Exception as exc:
+        logger.warning("Answer cache lookup failed: %s", exc)
+        return None
+
+
+async def store_answer(question: str, reply: str) -> None:
+    """Remember ``reply`` for ``question``. Never raises."""
+    if not settings.CHAT_ANSWER_CACHE_ENABLED or len(question) > _MAX_QUESTION_CHARS:
+        return
+    normalized = normalize_question(question)
+    if not normalized:
+        return
+    try:
+        redis = await get_redis()
+        generation = await redis.get(_GENERATION_KEY) or "0"
+        ttl = settings.CHAT_ANSWER_CACHE_TTL_SECONDS
+        created = await redis.set(_entry_key(generation, normalized), reply, ex=ttl, nx=True)
+        if created:
+            recent = _recent_key(generation)
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.lpush(recent, normalized)
+                pipe.ltrim(recent, 0, settings.CHAT_ANSWER_CACHE_RECENT - 1)
+                pipe.expire(recent, ttl)
+                await pipe.execute()
+    except Exception as exc:
+        logger.warning("Answer cache store failed: %s", exc)
+
+
+async def invalidate_answers() -> None:
+    """Retire every cached answer — call when the chatbot's knowledge changes.
+
+    Older generations are never read again and age out on their TTL.
+    """
+    try:
+        redis = await get_redis()
+        await redis.incr(_GENERATION_KEY)
+    except Exception as exc:
+        logger.warning("Answer cache invalidation failed: %s", exc)
+
+
+async def answer_cache_stats() -> dict:
+    """Hit/miss counters since the counters were first written."""
+    stats = {"exact_hits": 0, "similar_hits": 0, "misses": 0}
+    try:
+        redis = await get_redis()
+        raw = await redis.hgetall(_STATS_KEY)
+        for field in stats:
+            stats[field] = int(raw.get(field) or 0)
+    except Exception as exc:
+        logger.warning("Answer cache stats unavailable: %s", exc)
+        return {**stats, "hit_rate": None, "available": False}
+    lookups = sum(stats.values())
+    hits = stats["exact_hits"] + stats["similar_hits"]
+    return {
+        **stats,
+        "hit_rate": round(hits / lookups, 4) if lookups else None,
+        "available": True,
+    }
@@ -0,0 +1,340 @@
+"""Chunked chatbot knowledge in an Elasticsearch BM25 index.
+
+The chatbot used to append the whole of ``aztu_knowledge_base.md`` to every
+system prompt. Instead, the file and the scraped ``ChatbotKnowledge`` rows are
+split into heading-scoped chunks and indexed here; each question only pulls
+the top ``CHAT_KNOWLEDGE_TOP_K`` matches into the prompt.
+
+Chunk ids are deterministic (``kb:<n>``, ``web:<source_id>:<n>``) and every
+chunk carries the content hash it was cut from, so a re-sync overwrites in
+place and then drops whatever belongs to an older version — safe to run from
+several workers at once.
+
+When to re-sync:
+  * the KB file — checked at startup (it ships with the code, so a change means
+    a deploy); skipped when the indexed hash already matches;
+  * a scraped row — right after ``scrape_source`` commits it, and all active
+    rows again at startup;
+  * a deleted source — ``delete_source_chunks``.
+
+Whenever a sync actually changes what is indexed, the chatbot's cached answers
+are retired as well (app.services.chat_answer_cache). Re-scraping a page whose
+text is unchanged rewrites nothing and keeps them.
+
+If Elasticsearch is unreachable, retrieval falls back to a simple term-overlap
+ranking over the KB file's chunks kept in memory, so the chatbot degrades
+rather than answering without any context.
+"""
+
+import hashlib
+import logging
+import re
+from pathlib import Path
+
+from elasticsearch import AsyncElasticsearch
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.config import settings
+from app.core.elasticsearch import get_es
+from app.models.chat.chatbot_knowledge import ChatbotKnowledge
+from app.services.chat_answer_cache import invalidate_answers
+
+logger = logging.getLogger("aztu.chat.knowledge")
+
+KB_PATH = Path(__file__).resolve().parents[2] / "aztu_knowledge_base.md"
+
+# ~300 tokens: big enough to keep a section's facts together, small enough
+# that six of them cost a fraction of the old 76 KB prompt.
+_MAX_CHUNK_CHARS = 1200
+
+_HEADING = re.compile(r"^(#{1,3})\s+(.*)$")
+_WORD = re.compile(r"\w+", re.UNICODE)
+# What the index's asciifolding does for Azerbaijani, for the local fallback.
+_FOLD = str.maketrans("əıöüğşç", "eiougsc")
+
+
+def knowledge_index() -> str:
+    return f"{settings.SEARCH_INDEX_PREFIX}_chat_knowledge"
+
+
+_INDEX_BODY = {
+    "settings": {
+        "index": {"number_of_shards": 1, "number_of_replicas": 0},
+        "analysis": {
+            "analyzer": {
+                # Visitors often type Azerbaijani without diacritics ("rektor
+                # kimdir", "tehsil"); folding lets "təhsil" match "tehsil".
+                "kb_text": {
+                    "type": "custom",
+                    "tokenizer": "standard",
+                    "filter": ["lowercase", "kb_fold"],
+                }
+            },
+            "filter": {"kb_fold": {"type": "asciifolding", "preserve_original": True}},
+        },
+    },
+    "mappings": {
+        "properties": {
+            "kind": {"type": "keyword"},          # "kb" | "web"
+            "source_id": {"type": "integer"},
+            "version": {"type": "keyword"},
+            "heading": {"type": "text", "analyzer": "kb_text"},
+            "text": {"type": "text", "analyzer": "kb_text"},
+        }
+    },
+}
+
+
+# ── Chunking ─────────────────────────────────────────────────────────────────
+
+def _pack(blocks: list[str], max_chars: int = _MAX_CHUNK_CHARS) -> list[str]:
+    """Greedily join ``blocks`` into pieces of at most ``max_chars``."""
+    pieces: list[str] = []
+    current = ""
+    for block in blocks:
+        while len(block) > max_chars:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(block[:max_chars])
+            block = block[max_chars:]
+        if current and len(current) + 1 + len(block) > max_chars:
+            pieces.append(current)
+            current = ""
+        current = f"{current}\n{block}" if current else block
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def chunk_markdown(text: str) -> list[dict]:
+    """Split the KB markdown into ``{"heading", "text"}`` chunks.
+
+    Chunks never cross a ``#``/``##``/``###`` heading; long sections are
+    packed by paragraph. The heading path is kept with every chunk so a piece
+    of a long section still says what it is about.
+    """
+    chunks: list[dict] = []
+    path: list[str] = []
+    paragraphs: list[str] = []
+    current: list[str] = []
+
+    def flush_paragraph() -> None:
+        if current:
+            paragraphs.append("\n".join(current))
+            current.clear()
+
+    def flush_section() -> None:
+        flush_paragraph()
+        heading = " › ".join(path)
+        for piece in _pack(paragraphs):
+            chunks.append({"heading": heading, "text": piece})
+        paragraphs.clear()
+
+    for raw in text.splitlines():
+        line = raw.rstrip()
+        match = _HEADING.match(line)
+        if match:
+            flush_section()
+            level = len(match.group(1))
+            # The single "#" is the document title — the same for every chunk.
+            del path[max(level - 2, 0):]
+            if level > 1:
+                path.append(match.group(2).strip())
+        elif not line.strip() or line.strip() == "---":
+            flush_paragraph()
+        else:
+            current.append(line)
+    flush_section()
+    return chunks
+
+
+def chunk_plain(text: str, heading: str) -> list[dict]:
+    """Chunk scraped page text (one fact per line, no markup)."""
+    lines = [line for line in text.splitlines() if line.strip()]
+    return [{"heading": heading, "text": piece} for piece in _pack(lines)]
+
+
+def _version(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _load_kb() -> str:
+    return KB_PATH.read_text(encoding="utf-8") if KB_PATH.exists() else ""
+
+
+# In-memory copy for the degraded (no ES) path.
+_KB_CHUNKS: list[dict] = chunk_markdown(_load_kb())
+
+
+# ── Indexing ─────────────────────────────────────────────────────────────────
+
+async def _ensure_index(es: AsyncElasticsearch) -> None:
+    if not await es.indices.exists(index=knowledge_index()):
+        await es.indices.create(index=knowledge_index(), body=_INDEX_BODY)
+        logger.info("Created ES index %s", knowledge_index())
+
+
+async def _replace_chunks(
+    es: AsyncElasticsearch, scope: dict, id_prefix: str, version: str, chunks: list[dict],
+) -> None:
+    """Write ``chunks`` under ``scope`` and delete that scope's older versions."""
+    operations: list[dict] = []
+    for n, chunk in enumerate(chunks):
+        operations.append({"index": {"_index": knowledge_index(), "_id": f"{id_prefix}:{n}"}})
+        operations.append({**scope, "version": version, **chunk})
+    if operations:
+        response = await es.bulk(operations=operations, refresh=True)
+        if response.get("errors"):
+            raise RuntimeError(f"bulk indexing of {id_prefix} chunks reported errors")
+    await es.delete_by_query(
+        index=knowledge_index(),
+        query={
+            "bool": {
+                "filter": [{"term": {k: v}} for k, v in scope.items()],
+                "must_not": [{"term": {"version": version}}],
+            }
+        },
+        refresh=True,
+        conflicts="proceed",
+    )
+
+
+async def _is_current(es: AsyncElasticsearch, scope: dict, version: str) -> bool:
+    """Whether ``scope`` is already indexed at ``version``."""
+    filters = [{"term": {k: v}} for k, v in scope.items()]
+    hits = await es.search(
+        index=knowledge_index(),
+        size=1,
+        query={"bool": {"filter": [*filters, {"term": {"version": version}}]}},
+    )
+    return bool(hits["hits"]["hits"])
+
+
+async def sync_static_knowledge(es: AsyncElasticsearch) -> None:
+    text = _load_kb()
+    version = _version(text)
+    if await _is_current(es, {"kind": "kb"}, version):
+        return
+    chunks = chunk_markdown(text)
+    await _replace_chunks(es, {"kind": "kb"}, "kb", version, chunks)
+    await invalidate_answers()
+    logger.info("Indexed knowledge base file: %d chunks (version %s)", len(chunks), version)
+
+
+async def index_source_knowledge(source_id: int, label: str, content: str) -> None:
+    """(Re)index one scraped source. Never raises."""
+    try:
+        es = await get_es()
+        await _ensure_index(es)
+        scope = {"kind": "web", "source_id": source_id}
+        version = _version(f"{label}\n{content}")
+        if await _is_current(es, scope, version):
+            return
+        chunks = chunk_plain(content, label)
+        await _replace_chunks(es, scope, f"web:{source_id}", version, chunks)
+        await invalidate_answers()
+    except Exception as exc:
+        logger.warning("Indexing knowledge source %s failed: %s", source_id, exc)
+
+
+async def delete_source_chunks(source_id: int) -> None:
+    """Drop a deleted source's chunks. Never raises."""
+    try:
+        es = await get_es()
+        await es.delete_by_query(
+            index=knowledge_index(),
+            query={"term": {"source_id": source_id}},
+            refresh=True,
+            conflicts="proceed",
+            ignore_unavailable=True,
+        )
+        await invalidate_answers()
+    except Exception as exc:
+        logger.warning("Deleting knowledge chunks for source %s failed: %s", source_id, exc)
+
+
+async def sync_chat_knowledge(db: AsyncSession) -> None:
+    """Startup sync: KB file if changed, every active scraped row, and removal
+    of chunks whose source no longer exists. Never raises."""
+    try:
+        es = await get_es()
+        await _ensure_index(es)
+        await sync_static_knowledge(es)
+
+        rows = (await db.execute(
+            select(ChatbotKnowledge)
+            .options(selectinload(ChatbotKnowledge.source))
+            .where(ChatbotKnowledge.is_active == True)
+        )).scalars().all()
+        for row in rows:
+            label = (row.source.label or row.source.url) if row.source else "AzTU"
+            await index_source_knowledge(row.source_id, label, row.content)
+
+        removed = await es.delete_by_query(
+            index=knowledge_index(),
+            query={"bool": {
+                "filter": [{"term": {"kind": "web"}}],
+                "must_not": [{"terms": {"source_id": [row.source_id for row in rows]}}],
+            }},
+            refresh=True,
+            conflicts="proceed",
+        )
+        if removed.get("deleted"):
+            await invalidate_answers()
+    except Exception as exc:
+        logger.warning("Chat knowledge sync failed: %s", exc)
+
+
+# ── Retrieval ────────────────────────────────────────────────────────────────
+
+def _format(chunk: dict) -> str:
+    return f"[{chunk['heading']}]\n{chunk['text']}" if chunk.get("heading") else chunk["text"]
+
+
+def _terms(text: str) -> set[str]:
+    return set(_WORD.findall(text.lower().translate(_FOLD)))
+
+
+def _local_top_k(question: str, k: int) -> list[str]:
+    terms = {t for t in _terms(question) if len(t) > 2}
+    if not terms:
+        return []
+    scored = []
+    for chunk in _KB_CHUNKS:
+        words = _terms(f"{chunk['heading']} {chunk['text']}")
+        score = len(terms & words)
+        if score:
+            scored.append((score, chunk))
+    scored.sort(key=lambda pair: pair[0], reverse=True)
+    return [_format(chunk) for _, chunk in scored[:k]]
+
+
+async def retrieve_knowledge(question: str, previous_question: str | None = None) -> list[str]:
+    """Top-k knowledge chunks for ``question``, formatted for the prompt.
+
+    ``previous_question`` is matched with a lower weight so follow-ups like
+    "and his phone number?" still find the section the conversation is about.
+    """
+    k = settings.CHAT_KNOWLEDGE_TOP_K
+    should = [{
+        "multi_match": {"query": question, "fields": ["heading^2", "text"], "fuzziness": "AUTO"},
+    }]
+    if previous_question:
+        should.append({
+            "multi_match": {"query": previous_question, "fields": ["heading^2", "text"], "boost": 0.3},
+        })
+    try:
+        es = await get_es()
+        response = await es.search(
+            index=knowledge_index(),
+            size=k,
+            query={"bool": {"should": should, "minimum_should_match": 1}},
+            source_includes=["heading", "text"],
+        )
+        return [_format(hit["_source"]) for hit in response["hits"]["hits"]]
+    except Exception as exc:
+        logger.warning("Knowledge retrieval failed, using local ranking: %s", exc)
+        return _local_top_k(question, k)
@@ -0,0 +1,310 @@
+"""Daily rollup of chatbot activity for the admin statistics.
+
+``get_chat_stats`` used to count every session and message ever written, all-time
+distinct IPs included, each time the dashboard opened. Now:
+
+* ``refresh_chat_stats`` (scheduled every CHAT_STATS_REFRESH_MINUTES) rolls the
+  raw tables up into ``chat_stats_daily`` and ``chat_stats_visitors``. Days before
+  yesterday are final; each run re-rolls only yesterday and today, and the first
+  run backfills everything.
+* ``record_chat_activity`` bumps today's counters in Redis as sessions and
+  messages are written, so "today" stays live between refreshes. Each of today's
+  figures is the larger of the counter and the rollup, which covers counts a
+  Redis outage lost.
+
+``load_chat_stats`` reads the series and totals from the rollup alone. Distinct
+visitors over several days come from ``chat_stats_visitors`` and trail by at most
+one refresh. Visitors are counted by sha256(VISIT_HASH_SALT + IP), as the site
+analytics do. Deleting a conversation does not lower a day that is already final.
+"""
+
+import hashlib
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import Date, DateTime, cast, delete, exists, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.logger import get_logger
+from app.core.redis_client import get_redis
+from app.models.chat.chat_message import ChatMessage
+from app.models.chat.chat_session import ChatSession
+from app.models.chat.chat_stats import ChatStatsDaily, ChatStatsVisitor
+
+logger = get_logger("aztu.chat.stats")
+
+DAILY_BUCKETS = 30
+WEEKLY_BUCKETS = 12
+MONTHLY_BUCKETS = 12
+
+_LIVE_PREFIX = "chat:stats:"
+# Today's counters only matter until tomorrow's refresh has rolled today up.
+_LIVE_TTL_SECONDS = 2 * 24 * 3600
+_FIELDS = ("sessions", "messages", "unique_ips")
+
+
+def visitor_hash(ip_address: str) -> str:
+    return hashlib.sha256(f"{settings.VISIT_HASH_SALT}|{ip_address}".encode("utf-8")).hexdigest()
+
+
+def _visitor_hash_sql(column):
+    """SQL twin of :func:`visitor_hash`."""
+    salted = literal(f"{settings.VISIT_HASH_SALT}|") + column
+    return func.encode(func.sha256(func.convert_to(salted, "UTF8")), "hex")
+
+
+def _utc_day(column):
+    return cast(func.timezone("UTC", column), Date)
+
+
+def _live_keys(day: date) -> tuple[str, str]:
+    prefix = f"{_LIVE_PREFIX}{day.isoformat()}"
+    return prefix, f"{prefix}:visitors"
+
+
+# ── Live counters ───────────────────────────────────────────────────────────
+
+async def record_chat_activity(*, session_ip: Optional[str] = None, messages: int = 0) -> None:
+    """Count a new session (by its visitor IP) and/or written messages into
+    today's counters. Call after the commit. Never raises."""
+    counts_key, visitors_key = _live_keys(datetime.now(timezone.utc).date())
+    try:
+        redis = await get_redis()
+        async with redis.pipeline(transaction=False) as pipe:
+            if session_ip is not None:
+                pipe.hincrby(counts_key, "sessions", 1)
+                pipe.sadd(visitors_key, visitor_hash(session_ip))
+                pipe.expire(visitors_key, _LIVE_TTL_SECONDS)
+            if messages:
+                pipe.hincrby(counts_key, "messages", messages)
+            pipe.expire(counts_key, _LIVE_TTL_SECONDS)
+            await pipe.execute()
+    except Exception as exc:
+        logger.warning("Chat stats counters unavailable: %s", exc)
+
+
+async def _live_today(day: date) -> Optional[dict]:
+    counts_key, visitors_key = _live_keys(day)
+    try:
+        redis = await get_redis()
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.hgetall(counts_key)
+            pipe.scard(visitors_key)
+            counts, visitors = await pipe.execute()
+    except Exception as exc:
+        logger.warning("Chat stats counters unavailable: %s", exc)
+        return None
+    return {
+        "sessions": int(counts.get("sessions", 0)),
+        "messages": int(counts.get("messages", 0)),
+        "unique_ips": int(visitors),
+    }
+
+
+# ── Rollup ──────────────────────────────────────────────────────────────────
+
+async def _roll_up(db: AsyncSession, today: date) -> Optional[date]:
+    """Rebuild the rollup from yesterday (or the first session) on; the first day rebuilt."""
+    last = (await db.execute(select(func.max(ChatStatsDaily.day)))).scalar_one()
+    if last is None:
+        first = (await db.execute(select(func.min(ChatSession.started_at)))).scalar_one()
+        if first is None:
+            return None
+        start = first.astimezone(timezone.utc).date()
+    else:
+        start = min(last, today) - timedelta(days=1)
+    since = datetime.combine(start, time.min, tzinfo=timezone.utc)
+
+    await db.execute(delete(ChatStatsVisitor).where(ChatStatsVisitor.day >= start))
+    await db.execute(delete(ChatStatsDaily).where(ChatStatsDaily.day >= start))
+
+    session_day = _utc_day(ChatSession.started_at)
+    await db.execute(
+        insert(ChatStatsVisitor).from_select(
+            ["day", "visitor_hash"],
+            select(session_day, _visitor_hash_sql(ChatSession.ip_address))
+            .where(ChatSession.started_at >= since)
+            .distinct(),
+        )
+    )
+
+    days: dict[date, dict] = {}
+
+    def row(day: date) -> dict:
+        return days.setdefault(
+            day, {"day": day, "sessions": 0, "messages": 0, "unique_ips": 0, "new_ips": 0}
+        )
+
+    for day, count in (
+        await db.execute(
+            select(session_day, func.count(ChatSession.id))
+            .where(ChatSession.started_at >= since)
+            .group_by(session_day)
+        )
+    ).all():
+        row(day)["sessions"] = count
+
+    message_day = _utc_day(ChatMessage.created_at)
+    for day, count in (
+        await db.execute(
+            select(message_day, func.count(ChatMessage.id))
+            .where(ChatMessage.created_at >= since)
+            .group_by(message_day)
+        )
+    ).all():
+        row(day)["messages"] = count
+
+    earlier = aliased(ChatStatsVisitor)
+    seen_before = exists().where(
+        earlier.visitor_hash == ChatStatsVisitor.visitor_hash,
+        earlier.day < ChatStatsVisitor.day,
+    )
+    for day, unique, new in (
+        await db.execute(
+            select(
+                ChatStatsVisitor.day,
+                func.count(),
+                func.count().filter(~seen_before),
+            )
+            .where(ChatStatsVisitor.day >= start)
+            .group_by(ChatStatsVisitor.day)
+        )
+    ).all():
+        row(day).update(unique_ips=unique, new_ips=new)
+
+    if days:
+        await db.execute(insert(ChatStatsDaily), list(days.values()))
+    return start
+
+
+async def refresh_chat_stats() -> None:
+    """Scheduled rollup refresh. Never raises; a failed run is redone by the next."""
+    try:
+        async with AsyncSessionLocal() as db:
+            start = await _roll_up(db, datetime.now(timezone.utc).date())
+            await db.commit()
+        if start is not None:
+            logger.debug("Chat stats rolled up from %s", start.isoformat())
+    except Exception:
+        logger.exception("Chat stats refresh failed")
+
+
+# ── Reads ───────────────────────────────────────────────────────────────────
+
+def _week(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def _month(day: date) -> date:
+    return day.replace(day=1)
+
+
+async def _distinct_visitors(db: AsyncSession, granularity: str, start: date) -> dict[date, int]:
+    bucket = func.date_trunc(granularity, cast(ChatStatsVisitor.day, DateTime))
+    rows = (
+        await db.execute(
+            select(bucket, func.count(func.distinct(ChatStatsVisitor.visitor_hash)))
+            .where(ChatStatsVisitor.day >= start)
+            .group_by(bucket)
+        )
+    ).all()
+    return {value.date(): count for value, count in rows}
+
+
+def _series(days: dict[date, dict], start: date, key, visitors: Optional[dict] = None) -> list:
+    buckets: dict[date, dict] = {}
+    for day, counts in days.items():
+        if day < start:
+            continue
+        entry = buckets.setdefault(
+            key(day), {"bucket": key(day).isoformat(), "sessions": 0, "unique_ips": 0, "messages": 0}
+        )
+        entry["sessions"] += counts["sessions"]
+        entry["messages"] += counts["messages"]
+        if visitors is None:
+            entry["unique_ips"] += counts["unique_ips"]
+    if visitors is not None:
+        for bucket, entry in buckets.items():
+            entry["unique_ips"] = visitors.get(bucket, 0)
+    return [
+        buckets[bucket]
+        for bucket in sorted(buckets)
+        if buckets[bucket]["sessions"] or buckets[bucket]["messages"]
+    ]
+
+
+def _window(days: dict[date, dict], start: date, unique_ips: int) -> dict:
+    window = [counts for day, counts in days.items() if day >= start]
+    return {
+        "sessions": sum(c["sessions"] for c in window),
+        "messages": sum(c["messages"] for c in window),
+        "unique_ips": unique_ips,
+    }
+
+
+async def load_chat_stats(db: AsyncSession, today: date) -> dict:
+    """Totals and daily/weekly/monthly series, from the rollup plus today's counters."""
+    daily_start = today - timedelta(days=DAILY_BUCKETS)
+    weekly_start = today - timedelta(weeks=WEEKLY_BUCKETS)
+    monthly_start = today - timedelta(days=MONTHLY_BUCKETS * 31)
+    day7 = today - timedelta(days=6)
+    day30 = today - timedelta(days=29)
+
+    days: dict[date, dict] = {
+        r.day: {"sessions": r.sessions, "messages": r.messages, "unique_ips": r.unique_ips}
+        for r in (
+            await db.execute(select(ChatStatsDaily).where(ChatStatsDaily.day >= monthly_start))
+        ).scalars()
+    }
+    all_time = (
+        await db.execute(
+            select(
+                func.coalesce(func.sum(ChatStatsDaily.sessions), 0),
+                func.coalesce(func.sum(ChatStatsDaily.messages), 0),
+                func.coalesce(func.sum(ChatStatsDaily.new_ips), 0),
+            )
+        )
+    ).one()
+
+    rolled = days.get(today, dict.fromkeys(_FIELDS, 0))
+    live = await _live_today(today)
+    if live is not None:
+        merged = {field: max(rolled[field], live[field]) for field in _FIELDS}
+        if any(merged.values()):
+            days[today] = merged
+    current = days.get(today, dict.fromkeys(_FIELDS, 0))
+
+    unique_7, unique_30 = (
+        await db.execute(
+            select(
+                func.count(func.distinct(ChatStatsVisitor.visitor_hash)).filter(
+                    ChatStatsVisitor.day >= day7
+                ),
+                func.count(func.distinct(ChatStatsVisitor.visitor_hash)),
+            ).where(ChatStatsVisitor.day >= day30)
+        )
+    ).one()
+
+    return {
+        "totals": {
+            "today": dict(current),
+            # Calendar days: today and the 6 (29) before it.
+            "last_7_days": _window(days, day7, max(unique_7, current["unique_ips"])),
+            "last_30_days": _window(days, day30, max(unique_30, current["unique_ips"])),
+            "all_time": {
+                "sessions": all_time[0] + current["sessions"] - rolled["sessions"],
+                "messages": all_time[1] + current["messages"] - rolled["messages"],
+                "unique_ips": all_time[2],
+            },
+        },
+        "daily": _series(days, daily_start, lambda day: day),
+        "weekly": _series(
+            days, weekly_start, _week, await _distinct_visitors(db, "week", weekly_start)
+        ),
+        "monthly": _series(
+            days, monthly_start, _month, await _distinct_visitors(db, "month", monthly_start)
+        ),
+    }
@@ -13,6 +13,7 @@ from app.core.database import AsyncSessionLocal
 from app.core.logger import get_logger
 from app.models.chat.chatbot_knowledge_source import ChatbotKnowledgeSource
 from app.models.chat.chatbot_knowledge import ChatbotKnowledge
+from app.services.chat_knowledge import index_source_knowledge
 
 logger = get_logger("aztu.scraper")
 
@@ -96,6 +97,7 @@ async def scrape_source(source: ChatbotKnowledgeSource, db: AsyncSession) -> boo
 
     source.last_scraped_at = now
     await db.commit()
+    await index_source_knowledge(source.id, source.label or source.url, content)
     logger.info("Scraped %s (%d chars)", source.url, len(content))
     return True
 
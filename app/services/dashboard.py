@@ -4,8 +4,17 @@ One response, five round trips. Every number is a SQL ``count(*)``; nothing is
 counted by loading rows and calling ``len()``. The per-entity counts, the
 publishing trend and the visitor series are each folded into a single statement
 with ``UNION ALL`` / ``GROUP BY`` rather than one query per metric.
+
+The four panels run concurrently, each on its own pooled connection, so the
+response takes as long as the slowest panel rather than the sum. The counts and
+the trend — the two that scan every content table — are shared across admins
+through the response cache under the ``dashboard`` tag for
+DASHBOARD_CACHE_TTL_SECONDS. The audit middleware bumps that tag after every
+successful mutation in one of ``DASHBOARD_DOMAINS``, so a new item shows up on
+the next open rather than after the TTL.
 """
 
+import asyncio
 import logging
 from datetime import date, datetime, timedelta, timezone
 
@@ -14,6 +23,9 @@ from fastapi.responses import JSONResponse
 from sqlalchemy import String, cast, func, literal, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cached_value, invalidate
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
 from app.models.admin.activity_log import AdminActivityLog
 from app.models.admin.admin_user import AdminUser
 from app.models.analytics.site_visit import SiteVisitDaily, SiteVisitUnique
@@ -41,6 +53,14 @@ MAX_ACTIVITY_LIMIT = 50
 TREND_MONTHS = 12
 VISIT_SERIES_DAYS = 30
 
+CACHE_TAG = "dashboard"
+# Permission domains whose mutations change the counts or the trend.
+DASHBOARD_DOMAINS = frozenset({
+    "news", "announcements", "projects", "hero", "menu", "menu_header",
+    "collaborations", "faculties", "cafedras", "employees",
+    "research_institutes", "admin_users",
+})
+
 # Every metric that is a plain row count, resolved in one UNION ALL.
 # (key, model) — order here is the order the buckets are read back into.
 _CONTENT_COUNTS = (
@@ -206,23 +226,50 @@ async def _visitors(db: AsyncSession, today: date) -> dict:
     }
 
 
-async def _section(db: AsyncSession, name: str, coro, fallback, unavailable: list):
-    """Run one panel's query, degrading that panel alone if it fails.
+async def _section(name: str, query, fallback) -> tuple:
+    """Run one panel on its own session, degrading that panel alone if it fails.
 
     A dashboard should not go blank because a single table is missing — that is
     exactly what happened when admin_activity_log had not been migrated yet. The
-    rollback is required, not defensive: in PostgreSQL a failed statement aborts
-    the surrounding transaction, so without it every later panel fails too.
-    Failures are reported in ``unavailable`` rather than swallowed into zeros,
-    which would read as real data.
+    panels no longer share a session, so a failed statement cannot abort the
+    others' transaction. Returns ``(value, failed)``; failures are reported in
+    ``unavailable`` rather than swallowed into zeros, which would read as real
+    data.
     """
     try:
-        return await coro
+        async with AsyncSessionLocal() as db:
+            return await query(db), False
     except Exception:
         logger.exception("Dashboard section %r failed", name)
-        await db.rollback()
-        unavailable.append(name)
-        return fallback
+        return fallback, True
+
+
+class _SectionFailed(Exception):
+    pass
+
+
+async def _cached_section(name: str, key: str, query, fallback) -> tuple:
+    """:func:`_section` through the shared cache; a failed panel is never cached."""
+
+    async def build():
+        value, failed = await _section(name, query, fallback)
+        if failed:
+            raise _SectionFailed()
+        return value
+
+    try:
+        value = await cached_value(
+            key, [CACHE_TAG], build, ttl=settings.DASHBOARD_CACHE_TTL_SECONDS
+        )
+    except _SectionFailed:
+        return fallback, True
+    return value, False
+
+
+async def invalidate_dashboard(domain: str | None) -> None:
+    """Called by the audit middleware after a successful mutation in ``domain``."""
+    if domain in DASHBOARD_DOMAINS:
+        await invalidate(CACHE_TAG)
 
 
 async def _recent_activity(db: AsyncSession, limit: int):
@@ -235,18 +282,30 @@ async def _recent_activity(db: AsyncSession, limit: int):
     ).scalars().all()
 
 
-async def get_dashboard_stats(db: AsyncSession, activity_limit: int = DEFAULT_ACTIVITY_LIMIT) -> JSONResponse:
+async def get_dashboard_stats(activity_limit: int = DEFAULT_ACTIVITY_LIMIT) -> JSONResponse:
     activity_limit = max(1, min(activity_limit, MAX_ACTIVITY_LIMIT))
     today = datetime.now(timezone.utc).date()
     months = _month_keys(today)
-    unavailable: list = []
 
-    totals = await _section(db, "counts", _counts(db), {}, unavailable)
-    recent_rows = await _section(
-        db, "activity", _recent_activity(db, activity_limit), [], unavailable
-    )
-    trend = await _section(db, "publishing_trend", _publishing_trend(db, months), [], unavailable)
-    visitors = await _section(db, "visitors", _visitors(db, today), None, unavailable)
+    sections = {
+        "counts": _cached_section("counts", "dashboard:counts", _counts, {}),
+        "activity": _section(
+            "activity", lambda db: _recent_activity(db, activity_limit), []
+        ),
+        "publishing_trend": _cached_section(
+            "publishing_trend",
+            f"dashboard:trend:{months[-1].isoformat()}",
+            lambda db: _publishing_trend(db, months),
+            [],
+        ),
+        "visitors": _section("visitors", lambda db: _visitors(db, today), None),
+    }
+    results = dict(zip(sections, await asyncio.gather(*sections.values())))
+    unavailable = [name for name, (_, failed) in results.items() if failed]
+    totals = results["counts"][0]
+    recent_rows = results["activity"][0]
+    trend = results["publishing_trend"][0]
+    visitors = results["visitors"][0]
 
     return JSONResponse(
         content={
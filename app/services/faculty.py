@@ -6,6 +6,7 @@ from fastapi import Depends, File, HTTPException, UploadFile, status
 from fastapi.responses import JSONResponse
 from sqlalchemy import delete as sqlalchemy_delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.api.v1.schema.faculty import (
     CreateFaculty,
@@ -22,6 +23,7 @@ from app.api.v1.schema.faculty import (
 from app.utils.file_upload import ALLOWED_IMAGE_MIMES, safe_delete_file, save_upload
 from app.services.search import on_faculty_change, on_faculty_delete
 from app.core.logger import get_logger
+from app.core.cache import cached_response, invalidate
 from app.core.session import get_db
 from app.models.cafedras.cafedras import Cafedra
 from app.models.faculties.faculties import Faculty
@@ -120,28 +122,17 @@ async def _create_translated_section(
         )
 
 
-async def _serialize_translated_section(
-    parent_cls: Type[Any],
-    tr_cls: Type[Any],
-    parent_id_name: str,
-    faculty_code: str,
-    lang_code: str | None,
-    db: AsyncSession,
-):
+def _tr_by_lang(translations: list[Any]) -> dict[str, Any]:
+    return {tr.lang_code: tr for tr in translations}
+
+
+def _serialize_section_items(parents: list[Any], lang_code: str | None) -> list[dict]:
+    """Serialize an already-loaded section (parents with `translations` eager-loaded)."""
     items = []
-    parents_query = await db.execute(
-        select(parent_cls).where(parent_cls.faculty_code == faculty_code).order_by(parent_cls.display_order.asc())
-    )
-    parents = parents_query.scalars().all()
-    for parent in parents:
+    for parent in sorted(parents, key=lambda p: (p.display_order, p.id)):
+        trs = _tr_by_lang(parent.translations)
         if lang_code:
-            tr_query = await db.execute(
-                select(tr_cls).where(
-                    getattr(tr_cls, parent_id_name) == parent.id,
-                    tr_cls.lang_code == lang_code,
-                )
-            )
-            tr = tr_query.scalar_one_or_none()
+            tr = trs.get(lang_code)
             items.append(
                 {
                     "id": parent.id,
@@ -153,13 +144,7 @@ async def _serialize_translated_section(
             # Bilingual
             item_data = {"id": parent.id}
             for lc in ["az", "en"]:
-                tr_query = await db.execute(
-                    select(tr_cls).where(
-                        getattr(tr_cls, parent_id_name) == parent.id,
-                        tr_cls.lang_code == lc,
-                    )
-                )
-                tr = tr_query.scalar_one_or_none()
+                tr = trs.get(lc)
                 item_data[lc] = {
                     "title": tr.title if tr else None,
                     "description": tr.description if tr else None,
@@ -168,6 +153,20 @@ async def _serialize_translated_section(
     return items
 
 
+async def _serialize_translated_section(
+    parent_cls: Type[Any],
+    faculty_code: str,
+    lang_code: str | None,
+    db: AsyncSession,
+):
+    parents_query = await db.execute(
+        select(parent_cls)
+        .where(parent_cls.faculty_code == faculty_code)
+        .options(selectinload(parent_cls.translations))
+    )
+    return _serialize_section_items(parents_query.scalars().all(), lang_code)
+
+
 async def _create_person_translations(
     tr_cls: Type[Any],
     person_id_field: str,
@@ -614,89 +613,67 @@ async def _delete_section(parent_cls: Type[Any], faculty_code: str, db: AsyncSes
     )
 
 
-async def _fetch_people_with_tr(parent_cls: Type[Any], tr_cls: Type[Any], person_id_field: str, faculty_code: str, lang_code: str | None, db: AsyncSession):
-    query = await db.execute(
-        select(parent_cls).where(parent_cls.faculty_code == faculty_code)
+def _faculty_graph_query():
+    """The whole faculty detail graph in a fixed number of round trips.
+
+    Every relationship is fetched with one ``SELECT ... WHERE fk IN (...)``, so
+    the query count is the same for a faculty with two workers as for one with
+    two hundred. The cafedra count rides along as a scalar subquery.
+    """
+    cafedra_count = (
+        select(func.count())
+        .select_from(Cafedra)
+        .where(Cafedra.faculty_code == Faculty.faculty_code)
+        .correlate(Faculty)
+        .scalar_subquery()
+    )
+    director = selectinload(Faculty.director)
+    return select(Faculty, cafedra_count).options(
+        director.selectinload(FacultyDirector.translations),
+        director.selectinload(FacultyDirector.working_hours)
+        .selectinload(FacultyDirectorWorkingHour.translations),
+        director.selectinload(FacultyDirector.scientific_events)
+        .selectinload(FacultyDirectorScientificEvent.translations),
+        director.selectinload(FacultyDirector.educations)
+        .selectinload(FacultyDirectorEducation.translations),
+        selectinload(Faculty.laboratories).selectinload(FacultyLaboratory.translations),
+        selectinload(Faculty.research_works).selectinload(FacultyResearchWork.translations),
+        selectinload(Faculty.partner_companies).selectinload(FacultyPartnerCompany.translations),
+        selectinload(Faculty.objectives).selectinload(FacultyObjective.translations),
+        selectinload(Faculty.duties).selectinload(FacultyDuty.translations),
+        selectinload(Faculty.projects).selectinload(FacultyProject.translations),
+        selectinload(Faculty.directions_of_action).selectinload(FacultyDirectionOfAction.translations),
+        selectinload(Faculty.deputy_deans).selectinload(FacultyDeputyDean.translations),
+        selectinload(Faculty.scientific_council).selectinload(FacultyCouncilMember.translations),
+        selectinload(Faculty.workers).selectinload(FacultyWorker.translations),
     )
-    people = query.scalars().all()
+
+
+def _people_with_tr(people: list[Any], lang_code: str | None) -> list[tuple[Any, Any]]:
+    """Pair each loaded person with its translation (or the az/en dict when bilingual)."""
     result = []
-    for person in people:
+    for person in sorted(people, key=lambda p: p.id):
+        trs = _tr_by_lang(person.translations)
         if lang_code:
-            tr_query = await db.execute(
-                select(tr_cls).where(
-                    getattr(tr_cls, person_id_field) == person.id,
-                    tr_cls.lang_code == lang_code,
-                )
-            )
-            tr = tr_query.scalar_one_or_none()
-            result.append((person, tr))
+            result.append((person, trs.get(lang_code)))
         else:
             # Bilingual
-            tr_data = {}
-            for lc in ["az", "en"]:
-                tr_query = await db.execute(
-                    select(tr_cls).where(
-                        getattr(tr_cls, person_id_field) == person.id,
-                        tr_cls.lang_code == lc,
-                    )
-                )
-                tr_data[lc] = tr_query.scalar_one_or_none()
-            result.append((person, tr_data))
+            result.append((person, {lc: trs.get(lc) for lc in ["az", "en"]}))
     return result
 
 
-async def _serialize_director(director: FacultyDirector, lang_code: str | None, db: AsyncSession):
+def _serialize_director(director: FacultyDirector, lang_code: str | None):
     if not director:
         return None
 
-    if lang_code:
-        tr_query = await db.execute(
-            select(FacultyDirectorTr).where(
-                FacultyDirectorTr.director_id == director.id,
-                FacultyDirectorTr.lang_code == lang_code,
-            )
-        )
-        tr = tr_query.scalar_one_or_none()
-    else:
-        tr = None
-
-    tr_bilingual = {}
-    if not lang_code:
-        for lc in ["az", "en"]:
-            lc_query = await db.execute(
-                select(FacultyDirectorTr).where(
-                    FacultyDirectorTr.director_id == director.id,
-                    FacultyDirectorTr.lang_code == lc,
-                )
-            )
-            tr_bilingual[lc] = lc_query.scalar_one_or_none()
-
-    working_hours_query = await db.execute(
-        select(FacultyDirectorWorkingHour).where(
-            FacultyDirectorWorkingHour.director_id == director.id
-        )
-    )
-    scientific_events_query = await db.execute(
-        select(FacultyDirectorScientificEvent).where(
-            FacultyDirectorScientificEvent.director_id == director.id
-        )
-    )
-    educations_query = await db.execute(
-        select(FacultyDirectorEducation).where(
-            FacultyDirectorEducation.director_id == director.id
-        )
-    )
+    director_trs = _tr_by_lang(director.translations)
+    tr = director_trs.get(lang_code) if lang_code else None
 
     working_hours = []
-    for hour in working_hours_query.scalars().all():
+    for hour in sorted(director.working_hours, key=lambda h: h.id):
+        wh_trs = _tr_by_lang(hour.translations)
         if lang_code:
-            wh_tr_q = await db.execute(
-                select(FacultyDirectorWorkingHourTr).where(
-                    FacultyDirectorWorkingHourTr.working_hour_id == hour.id,
-                    FacultyDirectorWorkingHourTr.lang_code == lang_code,
-                )
-            )
-            wh_tr = wh_tr_q.scalar_one_or_none()
+            wh_tr = wh_trs.get(lang_code)
             working_hours.append({
                 "day": wh_tr.day if wh_tr else None,
                 "time_range": hour.time_range,
@@ -704,26 +681,15 @@ async def _serialize_director(director: FacultyDirector, lang_code: str | None,
         else:
             wh_item = {"time_range": hour.time_range}
             for lc in ["az", "en"]:
-                wh_tr_q = await db.execute(
-                    select(FacultyDirectorWorkingHourTr).where(
-                        FacultyDirectorWorkingHourTr.working_hour_id == hour.id,
-                        FacultyDirectorWorkingHourTr.lang_code == lc,
-                    )
-                )
-                wh_tr = wh_tr_q.scalar_one_or_none()
+                wh_tr = wh_trs.get(lc)
                 wh_item[lc] = {"day": wh_tr.day if wh_tr else None}
             working_hours.append(wh_item)
 
     scientific_events = []
-    for event in scientific_events_query.scalars().all():
+    for event in sorted(director.scientific_events, key=lambda e: e.id):
+        ev_trs = _tr_by_lang(event.translations)
         if lang_code:
-            ev_tr_q = await db.execute(
-                select(FacultyDirectorScientificEventTr).where(
-                    FacultyDirectorScientificEventTr.scientific_event_id == event.id,
-                    FacultyDirectorScientificEventTr.lang_code == lang_code,
-                )
-            )
-            ev_tr = ev_tr_q.scalar_one_or_none()
+            ev_tr = ev_trs.get(lang_code)
             scientific_events.append({
                 "event_title": ev_tr.event_title if ev_tr else None,
                 "event_description": ev_tr.event_description if ev_tr else None,
@@ -731,13 +697,7 @@ async def _serialize_director(director: FacultyDirector, lang_code: str | None,
         else:
             ev_item = {}
             for lc in ["az", "en"]:
-                ev_tr_q = await db.execute(
-                    select(FacultyDirectorScientificEventTr).where(
-                        FacultyDirectorScientificEventTr.scientific_event_id == event.id,
-                        FacultyDirectorScientificEventTr.lang_code == lc,
-                    )
-                )
-                ev_tr = ev_tr_q.scalar_one_or_none()
+                ev_tr = ev_trs.get(lc)
                 ev_item[lc] = {
                     "event_title": ev_tr.event_title if ev_tr else None,
                     "event_description": ev_tr.event_description if ev_tr else None,
@@ -745,15 +705,10 @@ async def _serialize_director(director: FacultyDirector, lang_code: str | None,
             scientific_events.append(ev_item)
 
     educations = []
-    for edu in educations_query.scalars().all():
+    for edu in sorted(director.educations, key=lambda e: e.id):
+        edu_trs = _tr_by_lang(edu.translations)
         if lang_code:
-            edu_tr_q = await db.execute(
-                select(FacultyDirectorEducationTr).where(
-                    FacultyDirectorEducationTr.education_id == edu.id,
-                    FacultyDirectorEducationTr.lang_code == lang_code,
-                )
-            )
-            edu_tr = edu_tr_q.scalar_one_or_none()
+            edu_tr = edu_trs.get(lang_code)
             educations.append({
                 "degree": edu_tr.degree if edu_tr else None,
                 "university": edu_tr.university if edu_tr else None,
@@ -763,13 +718,7 @@ async def _serialize_director(director: FacultyDirector, lang_code: str | None,
         else:
             edu_item = {"start_year": edu.start_year, "end_year": edu.end_year}
             for lc in ["az", "en"]:
-                edu_tr_q = await db.execute(
-                    select(FacultyDirectorEducationTr).where(
-                        FacultyDirectorEducationTr.education_id == edu.id,
-                        FacultyDirectorEducationTr.lang_code == lc,
-                    )
-                )
-                edu_tr = edu_tr_q.scalar_one_or_none()
+                edu_tr = edu_trs.get(lc)
                 edu_item[lc] = {
                     "degree": edu_tr.degree if edu_tr else None,
                     "university": edu_tr.university if edu_tr else None,
@@ -800,7 +749,7 @@ async def _serialize_director(director: FacultyDirector, lang_code: str | None,
         result["scientific_research_fields"] = tr.scientific_research_fields if tr else []
     else:
         for lc in ["az", "en"]:
-            lc_tr = tr_bilingual.get(lc)
+            lc_tr = director_trs.get(lc)
             result[lc] = {
                 "first_name": getattr(lc_tr, "first_name", None) if lc_tr else None,
                 "last_name": getattr(lc_tr, "last_name", None) if lc_tr else None,
@@ -1096,6 +1045,7 @@ def _serialize_people(people_with_tr: list, lang_code: str | None, has_profile_i
     return result
 
 
+@cached_response("faculty:detail", tags=lambda p: [f"faculty:{p['faculty_code']}"])
 async def get_faculty(
     faculty_code: str,
     lang_code: str = Depends(get_optional_language),
@@ -1103,65 +1053,32 @@ async def get_faculty(
 ):
     try:
         faculty_query = await db.execute(
-            select(Faculty).where(Faculty.faculty_code == faculty_code)
+            _faculty_graph_query().where(Faculty.faculty_code == faculty_code)
         )
-        faculty = faculty_query.scalar_one_or_none()
+        row = faculty_query.one_or_none()
 
-        if not faculty:
+        if not row:
             return JSONResponse(
                 content={"status_code": 404, "message": "Faculty not found."},
                 status_code=status.HTTP_404_NOT_FOUND,
             )
+        faculty, cafedra_count = row
 
-        if lang_code:
-            tr_query = await db.execute(
-                select(FacultyTr).where(
-                    FacultyTr.faculty_code == faculty.faculty_code,
-                    FacultyTr.lang_code == lang_code,
-                )
+        # faculties_tr is keyed by faculty_code rather than a relationship, so
+        # both languages come back in one query and are split in memory.
+        tr_query = await db.execute(
+            select(FacultyTr).where(
+                FacultyTr.faculty_code == faculty.faculty_code,
+                FacultyTr.lang_code.in_([lang_code] if lang_code else ["az", "en"]),
             )
-            tr = tr_query.scalar_one_or_none()
+        )
+        faculty_trs = _tr_by_lang(tr_query.scalars().all())
+        if lang_code:
+            tr = faculty_trs.get(lang_code)
             tr_bilingual = None
         else:
             tr = None
-            tr_bilingual = {}
-            for lc in ["az", "en"]:
-                lc_query = await db.execute(
-                    select(FacultyTr).where(
-                        FacultyTr.faculty_code == faculty.faculty_code,
-                        FacultyTr.lang_code == lc,
-                    )
-                )
-                tr_bilingual[lc] = lc_query.scalar_one_or_none()
-
-        director_query = await db.execute(
-            select(FacultyDirector).where(FacultyDirector.faculty_code == faculty_code)
-        )
-        director = director_query.scalar_one_or_none()
-
-        deputy_deans_with_tr = await _fetch_people_with_tr(
-            FacultyDeputyDean, FacultyDeputyDeanTr, "deputy_dean_id", faculty_code, lang_code, db
-        )
-        council_with_tr = await _fetch_people_with_tr(
-            FacultyCouncilMember, FacultyCouncilMemberTr, "council_member_id", faculty_code, lang_code, db
-        )
-        workers_with_tr = await _fetch_people_with_tr(
-            FacultyWorker, FacultyWorkerTr, "worker_id", faculty_code, lang_code, db
-        )
-
-        cafedra_count_query = await db.execute(
-            select(func.count()).select_from(Cafedra).where(
-                Cafedra.faculty_code == faculty_code
-            )
-        )
-        cafedra_count = cafedra_count_query.scalar() or 0
-
-        deputy_count_query = await db.execute(
-            select(func.count()).select_from(FacultyDeputyDean).where(
-                FacultyDeputyDean.faculty_code == faculty_code
-            )
-        )
-        deputy_count = deputy_count_query.scalar() or 0
+            tr_bilingual = faculty_trs
 
         faculty_obj = {
             "id": faculty.id,
@@ -1176,34 +1093,26 @@ async def get_faculty(
             "projects_patents_count": faculty.projects_patents_count or 0,
             "industrial_collaborations_count": faculty.industrial_collaborations_count or 0,
             "sdgs": faculty.sdgs or [],
-            "cafedra_count": cafedra_count,
-            "deputy_dean_count": deputy_count,
-
-            "director": await _serialize_director(director, lang_code, db) if director else None,
-            "laboratories": await _serialize_translated_section(
-                FacultyLaboratory, FacultyLaboratoryTr, "laboratory_id", faculty_code, lang_code, db,
-            ),
-            "research_works": await _serialize_translated_section(
-                FacultyResearchWork, FacultyResearchWorkTr, "research_work_id", faculty_code, lang_code, db,
-            ),
-            "partner_companies": await _serialize_translated_section(
-                FacultyPartnerCompany, FacultyPartnerCompanyTr, "partner_company_id", faculty_code, lang_code, db,
-            ),
-            "objectives": await _serialize_translated_section(
-                FacultyObjective, FacultyObjectiveTr, "objective_id", faculty_code, lang_code, db,
+            "cafedra_count": cafedra_count or 0,
+            "deputy_dean_count": len(faculty.deputy_deans),
+
+            "director": _serialize_director(faculty.director, lang_code) if faculty.director else None,
+            "laboratories": _serialize_section_items(faculty.laboratories, lang_code),
+            "research_works": _serialize_section_items(faculty.research_works, lang_code),
+            "partner_companies": _serialize_section_items(faculty.partner_companies, lang_code),
+            "objectives": _serialize_section_items(faculty.objectives, lang_code),
+            "duties": _serialize_section_items(faculty.duties, lang_code),
+            "projects": _serialize_section_items(faculty.projects, lang_code),
+            "directions_of_action": _serialize_section_items(faculty.directions_of_action, lang_code),
+            "deputy_deans": _serialize_people(
+                _people_with_tr(faculty.deputy_deans, lang_code), lang_code, has_profile_image=True,
             ),
-            "duties": await _serialize_translated_section(
-                FacultyDuty, FacultyDutyTr, "duty_id", faculty_code, lang_code, db,
+            "scientific_council": _serialize_people(
+                _people_with_tr(faculty.scientific_council, lang_code), lang_code, has_profile_image=False,
             ),
-            "projects": await _serialize_translated_section(
-                FacultyProject, FacultyProjectTr, "project_id", faculty_code, lang_code, db,
+            "workers": _serialize_people(
+                _people_with_tr(faculty.workers, lang_code), lang_code, has_profile_image=True,
             ),
-            "directions_of_action": await _serialize_translated_section(
-                FacultyDirectionOfAction, FacultyDirectionOfActionTr, "direction_of_action_id", faculty_code, lang_code, db,
-            ),
-            "deputy_deans": _serialize_people(deputy_deans_with_tr, lang_code, has_profile_image=True),
-            "scientific_council": _serialize_people(council_with_tr, lang_code, has_profile_image=False),
-            "workers": _serialize_people(workers_with_tr, lang_code, has_profile_image=True),
             "created_at": faculty.created_at.isoformat() if faculty.created_at else None,
             "updated_at": faculty.updated_at.isoformat() if faculty.updated_at else None,
         }
@@ -1388,6 +1297,7 @@ async def update_faculty(
 
         faculty.updated_at = now
         await db.commit()
+        await invalidate(f"faculty:{faculty_code}")
         await on_faculty_change(db, faculty_code)
 
         return JSONResponse(
@@ -1440,6 +1350,7 @@ async def upload_director_profile_image(
         director.profile_image = new_path
         director.updated_at = datetime.now(timezone.utc)
         await db.commit()
+        await invalidate(f"faculty:{faculty_code}")
 
         if old_path:
             safe_delete_file(old_path)
@@ -1489,6 +1400,7 @@ async def upload_deputy_dean_profile_image(
         deputy_dean.profile_image = new_path
         deputy_dean.updated_at = datetime.now(timezone.utc)
         await db.commit()
+        await invalidate(f"faculty:{deputy_dean.faculty_code}")
 
         if old_path:
             safe_delete_file(old_path)
@@ -1536,6 +1448,7 @@ async def upload_worker_profile_image(
         worker.profile_image = new_path
         worker.updated_at = datetime.now(timezone.utc)
         await db.commit()
+        await invalidate(f"faculty:{worker.faculty_code}")
 
         if old_path:
             safe_delete_file(old_path)
@@ -1577,8 +1490,6 @@ async def get_directions_of_action(
 
         items = await _serialize_translated_section(
             FacultyDirectionOfAction,
-            FacultyDirectionOfActionTr,
-            "direction_of_action_id",
             faculty_code,
             lang_code,
             db,
@@ -1642,6 +1553,7 @@ async def create_direction_of_action(
         ))
 
         await db.commit()
+        await invalidate(f"faculty:{faculty_code}")
 
         return JSONResponse(
             content={
@@ -1708,6 +1620,7 @@ async def update_direction_of_action(
 
         direction.updated_at = now
         await db.commit()
+        await invalidate(f"faculty:{direction.faculty_code}")
 
         return JSONResponse(
             content={"status_code": 200, "message": "Direction of action updated successfully."},
@@ -1730,16 +1643,19 @@ async def delete_direction_of_action(
         direction_query = await db.execute(
             select(FacultyDirectionOfAction).where(FacultyDirectionOfAction.id == direction_id)
         )
-        if not direction_query.scalar_one_or_none():
+        direction = direction_query.scalar_one_or_none()
+        if not direction:
             return JSONResponse(
                 content={"status_code": 404, "message": "Direction of action not found."},
                 status_code=status.HTTP_404_NOT_FOUND,
             )
+        faculty_code = direction.faculty_code
 
         await db.execute(
             sqlalchemy_delete(FacultyDirectionOfAction).where(FacultyDirectionOfAction.id == direction_id)
         )
         await db.commit()
+        await invalidate(f"faculty:{faculty_code}")
 
         return JSONResponse(
             content={"status_code": 200, "message": "Direction of action deleted successfully."},
@@ -1814,6 +1730,7 @@ async def create_worker(
             ))
 
         await db.commit()
+        await invalidate(f"faculty:{faculty_code}")
         await on_faculty_change(db, faculty_code)
 
         return JSONResponse(
@@ -1843,6 +1760,7 @@ async def update_worker(worker_id: int, request: UpdateWorker, db: AsyncSession)
             )
         faculty_code = person.faculty_code
         await db.commit()
+        await invalidate(f"faculty:{faculty_code}")
         await on_faculty_change(db, faculty_code)
         return JSONResponse(
             content={"status_code": 200, "message": "Worker updated successfully.", "data": {"id": worker_id}},
@@ -1866,6 +1784,7 @@ async def delete_worker(worker_id: int, db: AsyncSession):
                 status_code=status.HTTP_404_NOT_FOUND,
             )
         await db.commit()
+        await invalidate(f"faculty:{faculty_code}")
         if profile_image:
             safe_delete_file(profile_image)
         await on_faculty_change(db, faculty_code)
@@ -1895,6 +1814,7 @@ async def create_deputy_dean(faculty_code: str, request: DeputyDean, db: AsyncSe
             FacultyDeputyDean, FacultyDeputyDeanTr, "deputy_dean_id", faculty_code, request, now, db
         )
         await db.commit()
+        await invalidate(f"faculty:{faculty_code}")
         await on_faculty_change(db, faculty_code)
         return JSONResponse(
             content={"status_code": 201, "message": "Deputy dean added successfully.", "data": {"id": deputy.id}},
@@ -1921,6 +1841,7 @@ async def update_deputy_dean(deputy_dean_id: int, request: UpdateDeputyDean, db:
             )
         faculty_code = person.faculty_code
         await db.commit()
+        await invalidate(f"faculty:{faculty_code}")
         await on_faculty_change(db, faculty_code)
         return JSONResponse(
             content={"status_code": 200, "message": "Deputy dean updated successfully.", "data": {"id": deputy_dean_id}},
@@ -1944,6 +1865,7 @@ async def delete_deputy_dean(deputy_dean_id: int, db: AsyncSession):
                 status_code=status.HTTP_404_NOT_FOUND,
             )
         await db.commit()
+        await invalidate(f"faculty:{faculty_code}")
         if profile_image:
             safe_delete_file(profile_image)
         await on_faculty_change(db, faculty_code)
@@ -1973,6 +1895,7 @@ async def create_council_member(faculty_code: str, request: ScientificCouncilMem
             FacultyCouncilMember, FacultyCouncilMemberTr, "council_member_id", faculty_code, request, now, db
         )
         await db.commit()
+        await invalidate(f"faculty:{faculty_code}")
         await on_faculty_change(db, faculty_code)
         return JSONResponse(
             content={"status_code": 201, "message": "Council member added successfully.", "data": {"id": member.id}},
@@ -1999,6 +1922,7 @@ async def update_council_member(member_id: int, request: UpdateCouncilMember, db
             )
         faculty_code = person.faculty_code
         await db.commit()
+        await invalidate(f"faculty:{faculty_code}")
         await on_faculty_change(db, faculty_code)
         return JSONResponse(
             content={"status_code": 200, "message": "Council member updated successfully.", "data": {"id": member_id}},
@@ -2022,6 +1946,7 @@ async def delete_council_member(member_id: int, db: AsyncSession):
                 status_code=status.HTTP_404_NOT_FOUND,
             )
         await db.commit()
+        await invalidate(f"faculty:{faculty_code}")
         await on_faculty_change(db, faculty_code)
         return JSONResponse(
             content={"status_code": 200, "message": "Council member deleted successfully."},
@@ -2060,6 +1985,7 @@ async def delete_faculty(
         )
 
         await db.commit()
+        await invalidate(f"faculty:{faculty_code}")
         await on_faculty_delete(faculty_code)
 
         return JSONResponse(
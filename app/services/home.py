@@ -27,6 +27,7 @@ from sqlalchemy.orm import selectinload
 
 from app.api.v1.schema.home import UpdateHomePage
 from app.core.logger import get_logger
+from app.core.cache import cached_response, invalidate
 from app.models.home.home import HomeMetric, HomeMetricTr, HomePage
 
 logger = get_logger(__name__)
@@ -205,6 +206,7 @@ async def get_page_admin(page_key: str, db: AsyncSession):
         return _error(500, "Failed to load home page.")
 
 
+@cached_response("home:page", tags=lambda p: [f"home:{p['page_key']}"])
 async def get_page_public(page_key: str, lang: str, db: AsyncSession):
     try:
         page = await _load_page(db, page_key)
@@ -273,6 +275,7 @@ async def update_page(page_key: str, request: UpdateHomePage, db: AsyncSession):
 
         page.updated_at = now
         await db.commit()
+        await invalidate(f"home:{page_key}")
         return JSONResponse(content={"status_code": 200, "message": "Home page updated."})
     except Exception:
         await db.rollback()
@@ -292,6 +295,7 @@ async def publish_page(page_key: str, is_active: bool, db: AsyncSession):
         page.is_active = is_active
         page.updated_at = _now()
         await db.commit()
+        await invalidate(f"home:{page_key}")
 
         return JSONResponse(
             content={
@@ -1,9 +1,10 @@
 from typing import Optional
-from sqlalchemy import select, delete as sql_delete
+from sqlalchemy import select, and_, delete as sql_delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import status
 from fastapi.responses import JSONResponse
 from app.core.logger import get_logger
+from app.core.cache import LocalSnapshot, invalidate
 from app.utils.file_upload import safe_delete_file
 
 logger = get_logger(__name__)
@@ -39,136 +40,134 @@ LANGS = ("az", "en")
 # ─────────────────────────────────────────────────────────────
 # GET  —  Footer
 # ─────────────────────────────────────────────────────────────
+#
+# Both menus render on every public page. Each builder reads every table once,
+# already joined with its translation for the requested language (the inner
+# join drops rows that have no translation, as before), and assembles the tree
+# in memory. The built data is kept per language in a LocalSnapshot that every
+# menu mutation below rebuilds via _menu_changed().
+
+async def _load_contact(context: str, lang_code: str, db: AsyncSession) -> dict:
+    contact_result = await db.execute(
+        select(MenuContact, MenuContactAddress.address)
+        .outerjoin(
+            MenuContactAddress,
+            and_(
+                MenuContactAddress.contact_id == MenuContact.id,
+                MenuContactAddress.lang_code == lang_code,
+            ),
+        )
+        .where(MenuContact.context == context, MenuContact.is_active == True)
+    )
+    row = contact_result.one_or_none()
+    if row is None:
+        return {}
+    contact, address = row
+
+    phones_result = await db.execute(
+        select(MenuContactPhone.phone)
+        .where(MenuContactPhone.contact_id == contact.id)
+        .order_by(MenuContactPhone.display_order.asc(), MenuContactPhone.id.asc())
+    )
+    contact_obj = {"email": contact.email, "phones": list(phones_result.scalars().all())}
+    if context == "footer":
+        contact_obj["address"] = address or ""
+    return contact_obj
+
+
+async def _load_social_links(context: str, db: AsyncSession) -> list[dict]:
+    social_result = await db.execute(
+        select(MenuSocialLink)
+        .where(
+            MenuSocialLink.context.in_([context, "both"]),
+            MenuSocialLink.is_active == True,
+        )
+        .order_by(MenuSocialLink.display_order.asc(), MenuSocialLink.id.asc())
+    )
+    return [{"platform": s.platform, "url": s.url} for s in social_result.scalars().all()]
+
+
+async def _build_footer_menu(lang_code: str, db: AsyncSession) -> dict:
+    columns_result = await db.execute(
+        select(MenuFooterColumn.id, MenuFooterColumnTranslation.title)
+        .join(
+            MenuFooterColumnTranslation,
+            and_(
+                MenuFooterColumnTranslation.column_id == MenuFooterColumn.id,
+                MenuFooterColumnTranslation.lang_code == lang_code,
+            ),
+        )
+        .where(MenuFooterColumn.is_active == True)
+        .order_by(MenuFooterColumn.display_order.asc(), MenuFooterColumn.id.asc())
+    )
+    columns = columns_result.all()
+
+    links_result = await db.execute(
+        select(MenuFooterLink.column_id, MenuFooterLink.url, MenuFooterLinkTranslation.label)
+        .join(
+            MenuFooterLinkTranslation,
+            and_(
+                MenuFooterLinkTranslation.link_id == MenuFooterLink.id,
+                MenuFooterLinkTranslation.lang_code == lang_code,
+            ),
+        )
+        .where(MenuFooterLink.is_active == True)
+        .order_by(MenuFooterLink.display_order.asc(), MenuFooterLink.id.asc())
+    )
+    links_by_column: dict[int, list[dict]] = {}
+    for column_id, url, label in links_result.all():
+        links_by_column.setdefault(column_id, []).append({"label": label, "url": url})
+
+    columns_arr = [
+        {"title": title, "links": links_by_column.get(column_id, [])}
+        for column_id, title in columns
+    ]
+
+    logos_result = await db.execute(
+        select(MenuFooterPartnerLogo)
+        .where(MenuFooterPartnerLogo.is_active == True)
+        .order_by(MenuFooterPartnerLogo.display_order.asc(), MenuFooterPartnerLogo.id.asc())
+    )
+    logos_arr = [
+        {"label": l.label, "image_url": l.image_url, "url": l.url}
+        for l in logos_result.scalars().all()
+    ]
+
+    icons_result = await db.execute(
+        select(MenuFooterQuickIcon.icon, MenuFooterQuickIcon.url, MenuFooterQuickIconTranslation.label)
+        .join(
+            MenuFooterQuickIconTranslation,
+            and_(
+                MenuFooterQuickIconTranslation.icon_id == MenuFooterQuickIcon.id,
+                MenuFooterQuickIconTranslation.lang_code == lang_code,
+            ),
+        )
+        .where(MenuFooterQuickIcon.is_active == True)
+        .order_by(MenuFooterQuickIcon.display_order.asc(), MenuFooterQuickIcon.id.asc())
+    )
+    icons_arr = [
+        {"label": label, "icon": icon, "url": url}
+        for icon, url, label in icons_result.all()
+    ]
+
+    return {
+        "university_name": "Azerbaijan Technical University",
+        "columns": columns_arr,
+        "contact": await _load_contact("footer", lang_code, db),
+        "social_links": await _load_social_links("footer", db),
+        "partner_logos": logos_arr,
+        "quick_icons": icons_arr,
+    }
+
+
+_footer_snapshot = LocalSnapshot("menu:footer", _build_footer_menu)
+
 
 async def get_footer_menu(lang_code: str, db: AsyncSession):
     try:
-        columns_result = await db.execute(
-            select(MenuFooterColumn)
-            .where(MenuFooterColumn.is_active == True)
-            .order_by(MenuFooterColumn.display_order.asc())
-        )
-        columns = columns_result.scalars().all()
-
-        columns_arr = []
-        for column in columns:
-            col_tr_result = await db.execute(
-                select(MenuFooterColumnTranslation).where(
-                    MenuFooterColumnTranslation.column_id == column.id,
-                    MenuFooterColumnTranslation.lang_code == lang_code,
-                )
-            )
-            col_tr = col_tr_result.scalar_one_or_none()
-            if not col_tr:
-                continue
-
-            links_result = await db.execute(
-                select(MenuFooterLink)
-                .where(
-                    MenuFooterLink.column_id == column.id,
-                    MenuFooterLink.is_active == True,
-                )
-                .order_by(MenuFooterLink.display_order.asc())
-            )
-            links = links_result.scalars().all()
-
-            links_arr = []
-            for link in links:
-                link_tr_result = await db.execute(
-                    select(MenuFooterLinkTranslation).where(
-                        MenuFooterLinkTranslation.link_id == link.id,
-                        MenuFooterLinkTranslation.lang_code == lang_code,
-                    )
-                )
-                link_tr = link_tr_result.scalar_one_or_none()
-                if not link_tr:
-                    continue
-                links_arr.append({"label": link_tr.label, "url": link.url})
-
-            columns_arr.append({"title": col_tr.title, "links": links_arr})
-
-        contact_result = await db.execute(
-            select(MenuContact).where(
-                MenuContact.context == "footer",
-                MenuContact.is_active == True,
-            )
-        )
-        contact = contact_result.scalar_one_or_none()
-
-        contact_obj = {}
-        if contact:
-            phones_result = await db.execute(
-                select(MenuContactPhone)
-                .where(MenuContactPhone.contact_id == contact.id)
-                .order_by(MenuContactPhone.display_order.asc())
-            )
-            phones = phones_result.scalars().all()
-
-            address_result = await db.execute(
-                select(MenuContactAddress).where(
-                    MenuContactAddress.contact_id == contact.id,
-                    MenuContactAddress.lang_code == lang_code,
-                )
-            )
-            address = address_result.scalar_one_or_none()
-            contact_obj = {
-                "email": contact.email,
-                "phones": [p.phone for p in phones],
-                "address": address.address if address else "",
-            }
-
-        social_result = await db.execute(
-            select(MenuSocialLink)
-            .where(
-                MenuSocialLink.context.in_(["footer", "both"]),
-                MenuSocialLink.is_active == True,
-            )
-            .order_by(MenuSocialLink.display_order.asc())
-        )
-        social_arr = [
-            {"platform": s.platform, "url": s.url}
-            for s in social_result.scalars().all()
-        ]
-
-        logos_result = await db.execute(
-            select(MenuFooterPartnerLogo)
-            .where(MenuFooterPartnerLogo.is_active == True)
-            .order_by(MenuFooterPartnerLogo.display_order.asc())
-        )
-        logos_arr = [
-            {"label": l.label, "image_url": l.image_url, "url": l.url}
-            for l in logos_result.scalars().all()
-        ]
-
-        icons_result = await db.execute(
-            select(MenuFooterQuickIcon)
-            .where(MenuFooterQuickIcon.is_active == True)
-            .order_by(MenuFooterQuickIcon.display_order.asc())
-        )
-        icons_arr = []
-        for icon in icons_result.scalars().all():
-            icon_tr_result = await db.execute(
-                select(MenuFooterQuickIconTranslation).where(
-                    MenuFooterQuickIconTranslation.icon_id == icon.id,
-                    MenuFooterQuickIconTranslation.lang_code == lang_code,
-                )
-            )
-            icon_tr = icon_tr_result.scalar_one_or_none()
-            if not icon_tr:
-                continue
-            icons_arr.append({"label": icon_tr.label, "icon": icon.icon, "url": icon.url})
-
+        data = await _footer_snapshot.get(lang_code, db)
         return JSONResponse(
-            content={
-                "status_code": 200,
-                "data": {
-                    "university_name": "Azerbaijan Technical University",
-                    "columns": columns_arr,
-                    "contact": contact_obj,
-                    "social_links": social_arr,
-                    "partner_logos": logos_arr,
-                    "quick_icons": icons_arr,
-                },
-            },
+            content={"status_code": 200, "data": data},
             status_code=status.HTTP_200_OK,
         )
     except Exception as e:
@@ -183,113 +182,73 @@ async def get_footer_menu(lang_code: str, db: AsyncSession):
 # GET  —  Quick
 # ─────────────────────────────────────────────────────────────
 
-async def get_quick_menu(lang_code: str, db: AsyncSession):
-    try:
-        left_items_result = await db.execute(
-            select(MenuQuickLeftItem)
-            .where(MenuQuickLeftItem.is_active == True)
-            .order_by(MenuQuickLeftItem.display_order.asc())
-        )
-        left_items_arr = []
-        for item in left_items_result.scalars().all():
-            item_tr_result = await db.execute(
-                select(MenuQuickLeftItemTranslation).where(
-                    MenuQuickLeftItemTranslation.item_id == item.id,
-                    MenuQuickLeftItemTranslation.lang_code == lang_code,
-                )
-            )
-            item_tr = item_tr_result.scalar_one_or_none()
-            if not item_tr:
-                continue
-            left_items_arr.append({"label": item_tr.label, "url": item.url})
-
-        contact_result = await db.execute(
-            select(MenuContact).where(
-                MenuContact.context == "quick",
-                MenuContact.is_active == True,
-            )
-        )
-        contact = contact_result.scalar_one_or_none()
-        contact_obj = {}
-        if contact:
-            phones_result = await db.execute(
-                select(MenuContactPhone)
-                .where(MenuContactPhone.contact_id == contact.id)
-                .order_by(MenuContactPhone.display_order.asc())
-            )
-            contact_obj = {
-                "email": contact.email,
-                "phones": [p.phone for p in phones_result.scalars().all()],
-            }
-
-        social_result = await db.execute(
-            select(MenuSocialLink)
-            .where(
-                MenuSocialLink.context.in_(["quick", "both"]),
-                MenuSocialLink.is_active == True,
-            )
-            .order_by(MenuSocialLink.display_order.asc())
-        )
-        social_arr = [
-            {"platform": s.platform, "url": s.url}
-            for s in social_result.scalars().all()
-        ]
-
-        sections_result = await db.execute(
-            select(MenuQuickSection)
-            .where(MenuQuickSection.is_active == True)
-            .order_by(MenuQuickSection.display_order.asc())
-        )
-        sections_arr = []
-        for section in sections_result.scalars().all():
-            section_tr_result = await db.execute(
-                select(MenuQuickSectionTranslation).where(
-                    MenuQuickSectionTranslation.section_id == section.id,
-                    MenuQuickSectionTranslation.lang_code == lang_code,
-                )
-            )
-            section_tr = section_tr_result.scalar_one_or_none()
-            if not section_tr:
-                continue
-
-            items_result = await db.execute(
-                select(MenuQuickSectionItem)
-                .where(
-                    MenuQuickSectionItem.section_id == section.id,
-                    MenuQuickSectionItem.is_active == True,
-                )
-                .order_by(MenuQuickSectionItem.display_order.asc())
-            )
-            items_arr = []
-            for item in items_result.scalars().all():
-                item_tr_result = await db.execute(
-                    select(MenuQuickSectionItemTranslation).where(
-                        MenuQuickSectionItemTranslation.item_id == item.id,
-                        MenuQuickSectionItemTranslation.lang_code == lang_code,
-                    )
-                )
-                item_tr = item_tr_result.scalar_one_or_none()
-                if not item_tr:
-                    continue
-                items_arr.append({"label": item_tr.label, "url": item.url})
+async def _build_quick_menu(lang_code: str, db: AsyncSession) -> dict:
+    left_items_result = await db.execute(
+        select(MenuQuickLeftItem.url, MenuQuickLeftItemTranslation.label)
+        .join(
+            MenuQuickLeftItemTranslation,
+            and_(
+                MenuQuickLeftItemTranslation.item_id == MenuQuickLeftItem.id,
+                MenuQuickLeftItemTranslation.lang_code == lang_code,
+            ),
+        )
+        .where(MenuQuickLeftItem.is_active == True)
+        .order_by(MenuQuickLeftItem.display_order.asc(), MenuQuickLeftItem.id.asc())
+    )
+    left_items_arr = [{"label": label, "url": url} for url, label in left_items_result.all()]
+
+    sections_result = await db.execute(
+        select(MenuQuickSection.id, MenuQuickSection.section_key, MenuQuickSectionTranslation.title)
+        .join(
+            MenuQuickSectionTranslation,
+            and_(
+                MenuQuickSectionTranslation.section_id == MenuQuickSection.id,
+                MenuQuickSectionTranslation.lang_code == lang_code,
+            ),
+        )
+        .where(MenuQuickSection.is_active == True)
+        .order_by(MenuQuickSection.display_order.asc(), MenuQuickSection.id.asc())
+    )
+    sections = sections_result.all()
+
+    items_result = await db.execute(
+        select(MenuQuickSectionItem.section_id, MenuQuickSectionItem.url, MenuQuickSectionItemTranslation.label)
+        .join(
+            MenuQuickSectionItemTranslation,
+            and_(
+                MenuQuickSectionItemTranslation.item_id == MenuQuickSectionItem.id,
+                MenuQuickSectionItemTranslation.lang_code == lang_code,
+            ),
+        )
+        .where(MenuQuickSectionItem.is_active == True)
+        .order_by(MenuQuickSectionItem.display_order.asc(), MenuQuickSectionItem.id.asc())
+    )
+    items_by_section: dict[int, list[dict]] = {}
+    for section_id, url, label in items_result.all():
+        items_by_section.setdefault(section_id, []).append({"label": label, "url": url})
+
+    sections_arr = [
+        {"key": section_key, "title": title, "items": items_by_section.get(section_id, [])}
+        for section_id, section_key, title in sections
+    ]
+
+    return {
+        "title": "AzTU Quick Menu",
+        "left_items": left_items_arr,
+        "contact": await _load_contact("quick", lang_code, db),
+        "social_links": await _load_social_links("quick", db),
+        "right_sections": sections_arr,
+    }
+
+
+_quick_snapshot = LocalSnapshot("menu:quick", _build_quick_menu)
 
-            sections_arr.append({
-                "key": section.section_key,
-                "title": section_tr.title,
-                "items": items_arr,
-            })
 
+async def get_quick_menu(lang_code: str, db: AsyncSession):
+    try:
+        data = await _quick_snapshot.get(lang_code, db)
         return JSONResponse(
-            content={
-                "status_code": 200,
-                "data": {
-                    "title": "AzTU Quick Menu",
-                    "left_items": left_items_arr,
-                    "contact": contact_obj,
-                    "social_links": social_arr,
-                    "right_sections": sections_arr,
-                },
-            },
+            content={"status_code": 200, "data": data},
             status_code=status.HTTP_200_OK,
         )
     except Exception as e:
@@ -300,6 +259,20 @@ async def get_quick_menu(lang_code: str, db: AsyncSession):
         )
 
 
+async def _menu_changed(db: AsyncSession, *snapshots: LocalSnapshot) -> None:
+    """Invalidate and rebuild ``snapshots`` after a committed menu mutation.
+
+    Other workers notice the bumped tag on their next read. A failed rebuild
+    only logs — the mutation itself has already been committed.
+    """
+    await invalidate(*(snapshot.tag for snapshot in snapshots))
+    try:
+        for snapshot in snapshots:
+            await snapshot.rebuild(LANGS, db)
+    except Exception:
+        logger.exception("Failed to rebuild menu snapshot")
+
+
 # ─────────────────────────────────────────────────────────────
 # CRUD  —  Footer Column
 # ─────────────────────────────────────────────────────────────
@@ -318,6 +291,7 @@ async def create_footer_column(request: CreateFooterColumn, db: AsyncSession):
             ))
 
         await db.commit()
+        await _menu_changed(db, _footer_snapshot)
         await db.refresh(column)
         return JSONResponse(
             content={"status_code": 201, "message": "Footer column created.", "id": column.id},
@@ -365,6 +339,7 @@ async def update_footer_column(column_id: int, request: UpdateFooterColumn, db:
                     db.add(MenuFooterColumnTranslation(column_id=column_id, lang_code=lang, title=val))
 
         await db.commit()
+        await _menu_changed(db, _footer_snapshot)
         return JSONResponse(
             content={"status_code": 200, "message": "Footer column updated."},
             status_code=status.HTTP_200_OK,
@@ -391,6 +366,7 @@ async def delete_footer_column(column_id: int, db: AsyncSession):
             )
         await db.delete(column)
         await db.commit()
+        await _menu_changed(db, _footer_snapshot)
         return JSONResponse(
             content={"status_code": 200, "message": "Footer column deleted."},
             status_code=status.HTTP_200_OK,
@@ -435,6 +411,7 @@ async def create_footer_link(request: CreateFooterLink, db: AsyncSession):
             ))
 
         await db.commit()
+        await _menu_changed(db, _footer_snapshot)
         await db.refresh(link)
         return JSONResponse(
             content={"status_code": 201, "message": "Footer link created.", "id": link.id},
@@ -484,6 +461,7 @@ async def update_footer_link(link_id: int, request: UpdateFooterLink, db: AsyncS
                     db.add(MenuFooterLinkTranslation(link_id=link_id, lang_code=lang, label=val))
 
         await db.commit()
+        await _menu_changed(db, _footer_snapshot)
         return JSONResponse(
             content={"status_code": 200, "message": "Footer link updated."},
             status_code=status.HTTP_200_OK,
@@ -510,6 +488,7 @@ async def delete_footer_link(link_id: int, db: AsyncSession):
             )
         await db.delete(link)
         await db.commit()
+        await _menu_changed(db, _footer_snapshot)
         return JSONResponse(
             content={"status_code": 200, "message": "Footer link deleted."},
             status_code=status.HTTP_200_OK,
@@ -537,6 +516,7 @@ async def create_partner_logo(request: CreatePartnerLogo, db: AsyncSession):
         )
         db.add(logo)
         await db.commit()
+        await _menu_changed(db, _footer_snapshot)
         await db.refresh(logo)
         return JSONResponse(
             content={"status_code": 201, "message": "Partner logo created.", "id": logo.id},
@@ -573,6 +553,7 @@ async def update_partner_logo(logo_id: int, request: UpdatePartnerLogo, db: Asyn
             logo.display_order = request.display_order
 
         await db.commit()
+        await _menu_changed(db, _footer_snapshot)
         return JSONResponse(
             content={"status_code": 200, "message": "Partner logo updated."},
             status_code=status.HTTP_200_OK,
@@ -599,6 +580,7 @@ async def delete_partner_logo(logo_id: int, db: AsyncSession):
             )
         await db.delete(logo)
         await db.commit()
+        await _menu_changed(db, _footer_snapshot)
         return JSONResponse(
             content={"status_code": 200, "message": "Partner logo deleted."},
             status_code=status.HTTP_200_OK,
@@ -634,6 +616,7 @@ async def create_quick_icon(request: CreateQuickIcon, db: AsyncSession):
             ))
 
         await db.commit()
+        await _menu_changed(db, _footer_snapshot)
         await db.refresh(icon)
         return JSONResponse(
             content={"status_code": 201, "message": "Quick icon created.", "id": icon.id},
@@ -685,6 +668,7 @@ async def update_quick_icon(icon_id: int, request: UpdateQuickIcon, db: AsyncSes
                     db.add(MenuFooterQuickIconTranslation(icon_id=icon_id, lang_code=lang, label=val))
 
         await db.commit()
+        await _menu_changed(db, _footer_snapshot)
         return JSONResponse(
             content={"status_code": 200, "message": "Quick icon updated."},
             status_code=status.HTTP_200_OK,
@@ -711,6 +695,7 @@ async def delete_quick_icon(icon_id: int, db: AsyncSession):
             )
         await db.delete(icon)
         await db.commit()
+        await _menu_changed(db, _footer_snapshot)
         return JSONResponse(
             content={"status_code": 200, "message": "Quick icon deleted."},
             status_code=status.HTTP_200_OK,
@@ -743,6 +728,7 @@ async def create_social_link(request: CreateSocialLink, db: AsyncSession):
         )
         db.add(link)
         await db.commit()
+        await _menu_changed(db, _footer_snapshot, _quick_snapshot)
         await db.refresh(link)
         return JSONResponse(
             content={"status_code": 201, "message": "Social link created.", "id": link.id},
@@ -785,6 +771,7 @@ async def update_social_link(link_id: int, request: UpdateSocialLink, db: AsyncS
             link.display_order = request.display_order
 
         await db.commit()
+        await _menu_changed(db, _footer_snapshot, _quick_snapshot)
         return JSONResponse(
             content={"status_code": 200, "message": "Social link updated."},
             status_code=status.HTTP_200_OK,
@@ -811,6 +798,7 @@ async def delete_social_link(link_id: int, db: AsyncSession):
             )
         await db.delete(link)
         await db.commit()
+        await _menu_changed(db, _footer_snapshot, _quick_snapshot)
         return JSONResponse(
             content={"status_code": 200, "message": "Social link deleted."},
             status_code=status.HTTP_200_OK,
@@ -850,6 +838,7 @@ async def create_contact(request: CreateContact, db: AsyncSession):
                     db.add(MenuContactAddress(contact_id=contact.id, lang_code=lang, address=val))
 
         await db.commit()
+        await _menu_changed(db, _footer_snapshot, _quick_snapshot)
         await db.refresh(contact)
         return JSONResponse(
             content={"status_code": 201, "message": "Contact created.", "id": contact.id},
@@ -904,6 +893,7 @@ async def update_contact(contact_id: int, request: UpdateContact, db: AsyncSessi
                     db.add(MenuContactAddress(contact_id=contact_id, lang_code=lang, address=val))
 
         await db.commit()
+        await _menu_changed(db, _footer_snapshot, _quick_snapshot)
         return JSONResponse(
             content={"status_code": 200, "message": "Contact updated."},
             status_code=status.HTTP_200_OK,
@@ -930,6 +920,7 @@ async def delete_contact(contact_id: int, db: AsyncSession):
             )
         await db.delete(contact)
         await db.commit()
+        await _menu_changed(db, _footer_snapshot, _quick_snapshot)
         return JSONResponse(
             content={"status_code": 200, "message": "Contact deleted."},
             status_code=status.HTTP_200_OK,
@@ -961,6 +952,7 @@ async def create_quick_left_item(request: CreateQuickLeftItem, db: AsyncSession)
             ))
 
         await db.commit()
+        await _menu_changed(db, _quick_snapshot)
         await db.refresh(item)
         return JSONResponse(
             content={"status_code": 201, "message": "Quick left item created.", "id": item.id},
@@ -1010,6 +1002,7 @@ async def update_quick_left_item(item_id: int, request: UpdateQuickLeftItem, db:
                     db.add(MenuQuickLeftItemTranslation(item_id=item_id, lang_code=lang, label=val))
 
         await db.commit()
+        await _menu_changed(db, _quick_snapshot)
         return JSONResponse(
             content={"status_code": 200, "message": "Quick left item updated."},
             status_code=status.HTTP_200_OK,
@@ -1036,6 +1029,7 @@ async def delete_quick_left_item(item_id: int, db: AsyncSession):
             )
         await db.delete(item)
         await db.commit()
+        await _menu_changed(db, _quick_snapshot)
         return JSONResponse(
             content={"status_code": 200, "message": "Quick left item deleted."},
             status_code=status.HTTP_200_OK,
@@ -1079,6 +1073,7 @@ async def create_quick_section(request: CreateQuickSection, db: AsyncSession):
             ))
 
         await db.commit()
+        await _menu_changed(db, _quick_snapshot)
         await db.refresh(section)
         return JSONResponse(
             content={"status_code": 201, "message": "Quick section created.", "id": section.id},
@@ -1126,6 +1121,7 @@ async def update_quick_section(section_id: int, request: UpdateQuickSection, db:
                     db.add(MenuQuickSectionTranslation(section_id=section_id, lang_code=lang, title=val))
 
         await db.commit()
+        await _menu_changed(db, _quick_snapshot)
         return JSONResponse(
             content={"status_code": 200, "message": "Quick section updated."},
             status_code=status.HTTP_200_OK,
@@ -1152,6 +1148,7 @@ async def delete_quick_section(section_id: int, db: AsyncSession):
             )
         await db.delete(section)
         await db.commit()
+        await _menu_changed(db, _quick_snapshot)
         return JSONResponse(
             content={"status_code": 200, "message": "Quick section deleted."},
             status_code=status.HTTP_200_OK,
@@ -1196,6 +1193,7 @@ async def create_quick_section_item(request: CreateQuickSectionItem, db: AsyncSe
             ))
 
         await db.commit()
+        await _menu_changed(db, _quick_snapshot)
         await db.refresh(item)
         return JSONResponse(
             content={"status_code": 201, "message": "Quick section item created.", "id": item.id},
@@ -1245,6 +1243,7 @@ async def update_quick_section_item(item_id: int, request: UpdateQuickSectionIte
                     db.add(MenuQuickSectionItemTranslation(item_id=item_id, lang_code=lang, label=val))
 
         await db.commit()
+        await _menu_changed(db, _quick_snapshot)
         return JSONResponse(
             content={"status_code": 200, "message": "Quick section item updated."},
             status_code=status.HTTP_200_OK,
@@ -1271,6 +1270,7 @@ async def delete_quick_section_item(item_id: int, db: AsyncSession):
             )
         await db.delete(item)
         await db.commit()
+        await _menu_changed(db, _quick_snapshot)
         return JSONResponse(
             content={"status_code": 200, "message": "Quick section item deleted."},
             status_code=status.HTTP_200_OK,
@@ -1,11 +1,12 @@
 from typing import Any, Dict, List, Optional
 
 from fastapi import status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logger import get_logger
+from app.core.cache import LocalSnapshot, invalidate
 from app.models.menu.header import (
     MenuHeader, MenuHeaderTranslation,
     MenuHeaderItem, MenuHeaderItemTranslation,
@@ -24,115 +25,139 @@ LANGS = ("az", "en")
 
 
 # ─────────────────────────────────────────────────────────────
-# GET  —  public
+# Tree loading  —  shared by the public and admin readers
 # ─────────────────────────────────────────────────────────────
+#
+# The header menu is a handful of rows by nature, so each of the six tables is
+# read in one query and the tree is stitched in memory rather than walked
+# per-parent — six round trips however large the mega-menu grows.
 
-async def get_header_menu(lang_code: str, db: AsyncSession):
-    try:
-        headers_result = await db.execute(
-            select(MenuHeader)
-            .where(MenuHeader.is_active == True)
-            .order_by(MenuHeader.display_order.asc())
-        )
-        headers = headers_result.scalars().all()
+def _by_parent_and_lang(rows, parent_attr: str) -> Dict[int, Dict[str, Any]]:
+    """{parent_id: {"az": translation, "en": translation}}."""
+    grouped: Dict[int, Dict[str, Any]] = {}
+    for row in rows:
+        grouped.setdefault(getattr(row, parent_attr), {})[row.lang_code] = row
+    return grouped
 
-        data = []
-        for header in headers:
-            tr_result = await db.execute(
-                select(MenuHeaderTranslation).where(
-                    MenuHeaderTranslation.header_id == header.id,
-                    MenuHeaderTranslation.lang_code == lang_code,
-                )
-            )
-            tr = tr_result.scalar_one_or_none()
-            if not tr:
-                continue
 
-            # Auto-generate direct_url if it's a leaf
-            header_url = header.direct_url
-            if not header.has_subitems and not header_url:
-                header_url = f"/{lang_code}/{tr.slug}"
-
-            items_arr = []
-            if header.has_subitems:
-                items_result = await db.execute(
-                    select(MenuHeaderItem)
-                    .where(
-                        MenuHeaderItem.header_id == header.id,
-                        MenuHeaderItem.is_active == True,
-                    )
-                    .order_by(MenuHeaderItem.display_order.asc())
-                )
-                for item in items_result.scalars().all():
-                    item_tr_result = await db.execute(
-                        select(MenuHeaderItemTranslation).where(
-                            MenuHeaderItemTranslation.item_id == item.id,
-                            MenuHeaderItemTranslation.lang_code == lang_code,
-                        )
-                    )
-                    item_tr = item_tr_result.scalar_one_or_none()
-                    if not item_tr:
-                        continue
-
-                    # Auto-generate item url: /{lang}/{header_slug}/{item_slug}
-                    item_url = item.direct_url
-                    if not item.has_subitems and not item_url:
-                        item_url = f"/{lang_code}/{tr.slug}/{item_tr.slug}"
-
-                    sub_items_arr = []
-                    if item.has_subitems:
-                        sub_result = await db.execute(
-                            select(MenuHeaderSubItem)
-                            .where(
-                                MenuHeaderSubItem.item_id == item.id,
-                                MenuHeaderSubItem.is_active == True,
-                            )
-                            .order_by(MenuHeaderSubItem.display_order.asc())
-                        )
-                        for sub in sub_result.scalars().all():
-                            sub_tr_result = await db.execute(
-                                select(MenuHeaderSubItemTranslation).where(
-                                    MenuHeaderSubItemTranslation.sub_item_id == sub.id,
-                                    MenuHeaderSubItemTranslation.lang_code == lang_code,
-                                )
-                            )
-                            sub_tr = sub_tr_result.scalar_one_or_none()
-                            if not sub_tr:
-                                continue
-
-                            # Auto-generate sub-item url: /{lang}/{header_slug}/{item_slug}/{sub_item_slug}
-                            sub_url = sub.direct_url
-                            if not sub_url:
-                                sub_url = f"/{lang_code}/{tr.slug}/{item_tr.slug}/{sub_tr.slug}"
-
-                            sub_items_arr.append({
-                                "id": sub.id,
-                                "title": sub_tr.title,
-                                "slug": sub_tr.slug,
-                                "direct_url": sub_url,
-                            })
-
-                    items_arr.append({
-                        "id": item.id,
-                        "title": item_tr.title,
-                        "slug": item_tr.slug,
-                        "direct_url": item_url,
-                        "sub_items": sub_items_arr,
-                    })
-
-            data.append({
-                "id": header.id,
-                "image_url": header.image_url,
-                "title": tr.title,
-                "slug": tr.slug,
-                "direct_url": header_url,
-                "items": items_arr,
-            })
+def _by_parent(rows, parent_attr: str) -> Dict[int, List[Any]]:
+    grouped: Dict[int, List[Any]] = {}
+    for row in rows:
+        grouped.setdefault(getattr(row, parent_attr), []).append(row)
+    return grouped
 
-        return JSONResponse(
-            content={"status_code": 200, "data": data},
-            status_code=status.HTTP_200_OK,
-        )
+
+async def _load_header_rows(db: AsyncSession, active_only: bool) -> dict:
+    """Every header/item/sub-item row and its translations, six queries total.
+
+    Rows come back in display order; translations are grouped with
+    _by_parent_and_lang.
+    """
+    def ordered(model):
+        stmt = select(model).order_by(model.display_order.asc(), model.id.asc())
+        return stmt.where(model.is_active == True) if active_only else stmt
+
+    return {
+        "headers": (await db.execute(ordered(MenuHeader))).scalars().all(),
+        "items": (await db.execute(ordered(MenuHeaderItem))).scalars().all(),
+        "sub_items": (await db.execute(ordered(MenuHeaderSubItem))).scalars().all(),
+        "header_tr": _by_parent_and_lang(
+            (await db.execute(select(MenuHeaderTranslation))).scalars().all(),
+            "header_id",
+        ),
+        "item_tr": _by_parent_and_lang(
+            (await db.execute(select(MenuHeaderItemTranslation))).scalars().all(),
+            "item_id",
+        ),
+        "sub_tr": _by_parent_and_lang(
+            (await db.execute(select(MenuHeaderSubItemTranslation))).scalars().all(),
+            "sub_item_id",
+        ),
+    }
+
+
+# ─────────────────────────────────────────────────────────────
+# GET  —  public
+# ─────────────────────────────────────────────────────────────
+#
+# The mega-menu renders on every public page. Each worker keeps the finished
+# response body per language in a LocalSnapshot; a body is built once, never
+# mutated, and replaced wholesale when a mutation below calls _header_changed().
+
+async def _build_header_menu(lang_code: str, db: AsyncSession) -> bytes:
+    rows = await _load_header_rows(db, active_only=True)
+    items_by_header = _by_parent(rows["items"], "header_id")
+    subs_by_item = _by_parent(rows["sub_items"], "item_id")
+
+    data = []
+    for header in rows["headers"]:
+        tr = rows["header_tr"].get(header.id, {}).get(lang_code)
+        if not tr:
+            continue
+
+        # Auto-generate direct_url if it's a leaf
+        header_url = header.direct_url
+        if not header.has_subitems and not header_url:
+            header_url = f"/{lang_code}/{tr.slug}"
+
+        items_arr = []
+        if header.has_subitems:
+            for item in items_by_header.get(header.id, []):
+                item_tr = rows["item_tr"].get(item.id, {}).get(lang_code)
+                if not item_tr:
+                    continue
+
+                # Auto-generate item url: /{lang}/{header_slug}/{item_slug}
+                item_url = item.direct_url
+                if not item.has_subitems and not item_url:
+                    item_url = f"/{lang_code}/{tr.slug}/{item_tr.slug}"
+
+                sub_items_arr = []
+                if item.has_subitems:
+                    for sub in subs_by_item.get(item.id, []):
+                        sub_tr = rows["sub_tr"].get(sub.id, {}).get(lang_code)
+                        if not sub_tr:
+                            continue
+
+                        # Auto-generate sub-item url: /{lang}/{header_slug}/{item_slug}/{sub_item_slug}
+                        sub_url = sub.direct_url
+                        if not sub_url:
+                            sub_url = f"/{lang_code}/{tr.slug}/{item_tr.slug}/{sub_tr.slug}"
+
+                        sub_items_arr.append({
+                            "id": sub.id,
+                            "title": sub_tr.title,
+                            "slug": sub_tr.slug,
+                            "direct_url": sub_url,
+                        })
+
+                items_arr.append({
+                    "id": item.id,
+                    "title": item_tr.title,
+                    "slug": item_tr.slug,
+                    "direct_url": item_url,
+                    "sub_items": sub_items_arr,
+                })
+
+        data.append({
+            "id": header.id,
+            "image_url": header.image_url,
+            "title": tr.title,
+            "slug": tr.slug,
+            "direct_url": header_url,
+            "items": items_arr,
+        })
+
+    return JSONResponse(content={"status_code": 200, "data": data}).body
+
+
+_header_snapshot = LocalSnapshot("menu:header", _build_header_menu)
+
+
+async def get_header_menu(lang_code: str, db: AsyncSession):
+    try:
+        body = await _header_snapshot.get(lang_code, db)
+        return Response(content=body, media_type="application/json")
     except Exception:
         logger.exception("get_header_menu failed")
         return JSONResponse(
@@ -141,18 +166,23 @@ async def get_header_menu(lang_code: str, db: AsyncSession):
         )
 
 
+async def _header_changed(db: AsyncSession) -> None:
+    """Invalidate and rebuild the header snapshot after a committed mutation.
+
+    Other workers notice the bumped tag on their next read. A failed rebuild
+    only logs — the mutation itself has already been committed.
+    """
+    await invalidate(_header_snapshot.tag)
+    try:
+        await _header_snapshot.rebuild(LANGS, db)
+    except Exception:
+        logger.exception("Failed to rebuild header menu snapshot")
+
+
 # ─────────────────────────────────────────────────────────────
 # GET  —  admin
 # ─────────────────────────────────────────────────────────────
 
-def _by_parent_and_lang(rows, parent_attr: str) -> Dict[int, Dict[str, Any]]:
-    """{parent_id: {"az": translation, "en": translation}}."""
-    grouped: Dict[int, Dict[str, Any]] = {}
-    for row in rows:
-        grouped.setdefault(getattr(row, parent_attr), {})[row.lang_code] = row
-    return grouped
-
-
 def _titles(by_lang: Dict[str, Any]) -> Dict[str, str]:
     """Both translations side by side, plus an az-preferred pair the editor lists
     rows by. A row half-translated still renders rather than vanishing."""
@@ -176,44 +206,14 @@ async def get_header_menu_admin(db: AsyncSession):
     work without: inactive rows (otherwise deactivating one hides it forever),
     both translations at once, and the raw `display_order` / `has_subitems` /
     `is_active` columns it has to round-trip on save.
-
-    The header menu is a handful of rows by nature, so each level loads in one
-    query and is stitched in memory rather than walked per-parent.
     """
     try:
-        headers = (await db.execute(
-            select(MenuHeader).order_by(
-                MenuHeader.display_order.asc(), MenuHeader.id.asc()
-            )
-        )).scalars().all()
-
-        items = (await db.execute(
-            select(MenuHeaderItem).order_by(
-                MenuHeaderItem.display_order.asc(), MenuHeaderItem.id.asc()
-            )
-        )).scalars().all()
-
-        sub_items = (await db.execute(
-            select(MenuHeaderSubItem).order_by(
-                MenuHeaderSubItem.display_order.asc(), MenuHeaderSubItem.id.asc()
-            )
-        )).scalars().all()
-
-        header_tr = _by_parent_and_lang(
-            (await db.execute(select(MenuHeaderTranslation))).scalars().all(),
-            "header_id",
-        )
-        item_tr = _by_parent_and_lang(
-            (await db.execute(select(MenuHeaderItemTranslation))).scalars().all(),
-            "item_id",
-        )
-        sub_tr = _by_parent_and_lang(
-            (await db.execute(select(MenuHeaderSubItemTranslation))).scalars().all(),
-            "sub_item_id",
-        )
+        rows = await _load_header_rows(db, active_only=False)
+        headers = rows["headers"]
+        header_tr, item_tr, sub_tr = rows["header_tr"], rows["item_tr"], rows["sub_tr"]
 
         subs_by_item: Dict[int, List[dict]] = {}
-        for sub in sub_items:
+        for sub in rows["sub_items"]:
             subs_by_item.setdefault(sub.item_id, []).append({
                 "id": sub.id,
                 "item_id": sub.item_id,
@@ -224,7 +224,7 @@ async def get_header_menu_admin(db: AsyncSession):
             })
 
         items_by_header: Dict[int, List[dict]] = {}
-        for item in items:
+        for item in rows["items"]:
             items_by_header.setdefault(item.header_id, []).append({
                 "id": item.id,
                 "header_id": item.header_id,
@@ -294,6 +294,7 @@ async def create_header(
             ))
 
         await db.commit()
+        await _header_changed(db)
         await db.refresh(header)
         return JSONResponse(
             content={"status_code": 201, "message": "Header created.", "id": header.id},
@@ -371,6 +372,7 @@ async def update_header(
                 ))
 
         await db.commit()
+        await _header_changed(db)
         return JSONResponse(
             content={"status_code": 200, "message": "Header updated."},
             status_code=status.HTTP_200_OK,
@@ -400,6 +402,7 @@ async def delete_header(header_id: int, db: AsyncSession):
             safe_delete_file(old_rel)
         await db.delete(header)
         await db.commit()
+        await _header_changed(db)
         return JSONResponse(
             content={"status_code": 200, "message": "Header deleted."},
             status_code=status.HTTP_200_OK,
@@ -426,6 +429,7 @@ async def delete_header_item(item_id: int, db: AsyncSession):
             )
         await db.delete(item)
         await db.commit()
+        await _header_changed(db)
         return JSONResponse(
             content={"status_code": 200, "message": "Header item deleted."},
             status_code=status.HTTP_200_OK,
@@ -480,6 +484,7 @@ async def create_header_item(request: CreateHeaderItem, db: AsyncSession):
             ))
 
         await db.commit()
+        await _header_changed(db)
         await db.refresh(item)
         return JSONResponse(
             content={"status_code": 201, "message": "Header item created.", "id": item.id},
@@ -538,6 +543,7 @@ async def update_header_item(item_id: int, request: UpdateHeaderItem, db: AsyncS
                 ))
 
         await db.commit()
+        await _header_changed(db)
         return JSONResponse(
             content={"status_code": 200, "message": "Header item updated."},
             status_code=status.HTTP_200_OK,
@@ -592,6 +598,7 @@ async def create_header_sub_item(request: CreateHeaderSubItem, db: AsyncSession)
             ))
 
         await db.commit()
+        await _header_changed(db)
         await db.refresh(sub)
         return JSONResponse(
             content={"status_code": 201, "message": "Header sub-item created.", "id": sub.id},
@@ -650,6 +657,7 @@ async def update_header_sub_item(
                 ))
 
         await db.commit()
+        await _header_changed(db)
         return JSONResponse(
             content={"status_code": 200, "message": "Header sub-item updated."},
             status_code=status.HTTP_200_OK,
@@ -676,6 +684,7 @@ async def delete_header_sub_item(sub_item_id: int, db: AsyncSession):
             )
         await db.delete(sub)
         await db.commit()
+        await _header_changed(db)
         return JSONResponse(
             content={"status_code": 200, "message": "Header sub-item deleted."},
             status_code=status.HTTP_200_OK,
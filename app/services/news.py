@@ -4,6 +4,8 @@ from typing import List, Optional
 from sqlalchemy import select, func, update
 from app.core.session import get_db
 from app.core.logger import get_logger
+from app.core.cache import cached_count, cached_response, invalidate
+from app.utils.pagination import InvalidCursor, Keyset, SortKey
 
 logger = get_logger(__name__)
 from app.api.v1.schema.news import *
@@ -11,6 +13,7 @@ from app.models.news.news import News
 from fastapi.responses import JSONResponse
 from app.utils.language import get_language
 from app.utils.file_upload import save_upload, safe_delete_file, ALLOWED_IMAGE_MIMES
+from app.utils.image_variants import variant_urls
 from app.utils.html_sanitizer import sanitize_html
 from sqlalchemy.ext.asyncio import AsyncSession
 from asyncpg.exceptions import UndefinedTableError
@@ -22,6 +25,15 @@ from app.models.news_category.news_category_translation import NewsCategoryTrans
 from app.services.search import on_news_change, on_news_delete
 
 
+# List order for both feeds; `id` makes it total so cursor pages never skip or
+# repeat a row (served by ix_news_feed_order).
+_NEWS_ORDER = Keyset(
+    SortKey(News.display_order),
+    SortKey(News.created_at, descending=True),
+    SortKey(News.id, descending=True),
+)
+
+
 def news_id_generator() -> int:
     # Cryptographically random ID — replaces insecure random.randint
     return secrets.randbelow(900000) + 100000
@@ -151,6 +163,7 @@ async def create_news(
 
         # Single commit for the entire operation — atomic
         await db.commit()
+        await invalidate("news")
         await on_news_change(db, news_id)
 
         return JSONResponse(
@@ -169,12 +182,14 @@ async def create_news(
         )
 
 
+@cached_response("news:public", tags=lambda p: ["news"])
 async def get_public_news(
     category_id: Optional[int] = Query(None, description="Filter by category ID"),
     start: int = Query(0, ge=0, description="Start index"),
     end: int = Query(10, gt=0, description="End index (absolute offset)"),
     lang_code: str = Depends(get_language),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = None,
 ):
     try:
         count_query = (
@@ -185,8 +200,7 @@ async def get_public_news(
         )
         if category_id is not None:
             count_query = count_query.where(News.category_id == category_id)
-        total_query = await db.execute(count_query)
-        total = total_query.scalar() or 0
+        total = await cached_count(db, count_query, tags=["news"])
 
         # start/end are absolute offsets; cap the page size (not the offset) so
         # deep pagination keeps working without rejecting large `end` values.
@@ -196,14 +210,22 @@ async def get_public_news(
             select(News)
             .where(News.is_active == True)  # noqa: E712
             .where(News.show_in_all_news == True)  # noqa: E712
-            .order_by(News.display_order.asc(), News.created_at.desc())
-            .offset(start)
-            .limit(page_size)
+            .order_by(*_NEWS_ORDER.order_by())
         )
         if category_id is not None:
             query = query.where(News.category_id == category_id)
+        # Cursor mode (opt-in): page after the cursor, `start` is ignored.
+        if cursor is not None:
+            if cursor:
+                query = query.where(_NEWS_ORDER.after(cursor))
+            query = query.limit(page_size + 1)
+        else:
+            query = query.offset(start).limit(page_size)
 
         fetched_news = (await db.execute(query)).scalars().all()
+        next_cursor = None
+        if cursor is not None:
+            fetched_news, next_cursor = _NEWS_ORDER.page(fetched_news, page_size)
 
         if not fetched_news:
             return JSONResponse(content={"status_code": 204}, status_code=status.HTTP_204_NO_CONTENT)
@@ -242,14 +264,20 @@ async def get_public_news(
                 "title": tr.title if tr else None,
                 "html_content": tr.html_content if tr else None,
                 "cover_image": cover.image if cover else None,
+                "cover_image_variants": variant_urls(cover.image if cover else None),
                 "created_at": news.created_at.isoformat() if news.created_at else None,
             })
 
+        content = {"status_code": 200, "message": "News fetched successfully.", "news": news_arr, "total": total}
+        if cursor is not None:
+            content["next_cursor"] = next_cursor
+        return JSONResponse(content=content, status_code=status.HTTP_200_OK)
+
+    except InvalidCursor as exc:
         return JSONResponse(
-            content={"status_code": 200, "message": "News fetched successfully.", "news": news_arr, "total": total},
-            status_code=status.HTTP_200_OK
+            content={"status_code": 400, "message": str(exc)},
+            status_code=status.HTTP_400_BAD_REQUEST
         )
-
     except Exception:
         logger.exception("Failed to fetch public news")
         return JSONResponse(
@@ -262,25 +290,30 @@ async def get_admin_news(
     start: int = Query(0, ge=0, description="Start index"),
     end: int = Query(10, gt=0, description="End index (absolute offset)"),
     lang_code: str = Depends(get_language),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = None,
 ):
     try:
         count_query = select(func.count()).select_from(News)
         if category_id is not None:
             count_query = count_query.where(News.category_id == category_id)
-        total_query = await db.execute(count_query)
-        total = total_query.scalar() or 0
+        total = await cached_count(db, count_query, tags=["news"])
 
-        query = (
-            select(News)
-            .order_by(News.display_order.asc(), News.created_at.desc())
-            .offset(start)
-            .limit(end - start)
-        )
+        page_size = end - start
+        query = select(News).order_by(*_NEWS_ORDER.order_by())
         if category_id is not None:
             query = query.where(News.category_id == category_id)
+        if cursor is not None:
+            if cursor:
+                query = query.where(_NEWS_ORDER.after(cursor))
+            query = query.limit(page_size + 1)
+        else:
+            query = query.offset(start).limit(page_size)
 
         fetched_news = (await db.execute(query)).scalars().all()
+        next_cursor = None
+        if cursor is not None:
+            fetched_news, next_cursor = _NEWS_ORDER.page(fetched_news, page_size)
 
         if not fetched_news:
             return JSONResponse(content={"status_code": 204}, status_code=status.HTTP_204_NO_CONTENT)
@@ -318,14 +351,20 @@ async def get_admin_news(
                 "show_in_all_news": news.show_in_all_news,
                 "title": tr.title if tr else None,
                 "cover_image": cover.image if cover else None,
+                "cover_image_variants": variant_urls(cover.image if cover else None),
                 "created_at": news.created_at.isoformat() if news.created_at else None,
             })
 
+        content = {"status_code": 200, "message": "News fetched successfully.", "news": news_arr, "total": total}
+        if cursor is not None:
+            content["next_cursor"] = next_cursor
+        return JSONResponse(content=content, status_code=status.HTTP_200_OK)
+
+    except InvalidCursor as exc:
         return JSONResponse(
-            content={"status_code": 200, "message": "News fetched successfully.", "news": news_arr, "total": total},
-            status_code=status.HTTP_200_OK
+            content={"status_code": 400, "message": str(exc)},
+            status_code=status.HTTP_400_BAD_REQUEST
         )
-
     except Exception:
         logger.exception("Failed to fetch admin news")
         return JSONResponse(
@@ -410,9 +449,15 @@ async def get_news_details(
                     "is_active": news.is_active,
                     "display_order": news.display_order,
                     "cover_image": cover.image if cover else None,
+                    "cover_image_variants": variant_urls(cover.image if cover else None),
                     "cover_image_id": cover.id if cover else None,
                     "gallery_images": [
-                        {"image_id": g.id, "image": g.image, "display_order": g.display_order}
+                        {
+                            "image_id": g.id,
+                            "image": g.image,
+                            "image_variants": variant_urls(g.image),
+                            "display_order": g.display_order,
+                        }
                         for g in gallery
                     ],
                     "created_at": news.created_at.isoformat() if news.created_at else None,
@@ -441,6 +486,7 @@ async def deactivate_news(
             )
         news.is_active = False
         await db.commit()
+        await invalidate("news")
         await on_news_change(db, news_id)
         return JSONResponse(content={"status_code": 200, "message": "News deactivated successfully."})
 
@@ -465,6 +511,7 @@ async def activate_news(
             )
         news.is_active = True
         await db.commit()
+        await invalidate("news")
         await on_news_change(db, news_id)
         return JSONResponse(content={"status_code": 200, "message": "News activated successfully."})
 
@@ -500,7 +547,10 @@ async def get_news_gallery(
             content={
                 "status_code": 200,
                 "message": "News gallery fetched successfully.",
-                "gallery_images": [{"id": g.id, "news_id": g.news_id, "image": g.image} for g in gallery],
+                "gallery_images": [
+                    {"id": g.id, "news_id": g.news_id, "image": g.image, "image_variants": variant_urls(g.image)}
+                    for g in gallery
+                ],
             }
         )
 
@@ -545,6 +595,7 @@ async def reorder_news(
         _resequence_display_order(all_rows, target, request.new_order)
 
         await db.commit()
+        await invalidate("news")
 
         return JSONResponse(content={"status_code": 200, "message": "News reordered successfully"})
 
@@ -759,6 +810,7 @@ async def update_news(
         news.updated_at = datetime.now(timezone.utc)
 
         await db.commit()
+        await invalidate("news")
         await on_news_change(db, news_id)
 
         for path in files_to_delete_after_commit:
@@ -810,6 +862,7 @@ async def delete_news(
 
         await db.delete(news)
         await db.commit()
+        await invalidate("news")
         await on_news_delete(news_id)
 
         # Delete files after successful DB commit — safe_delete_file prevents path traversal
@@ -886,6 +939,7 @@ async def _get_news_by_owner(
             "title": tr.title if tr else None,
             "html_content": tr.html_content if tr else None,
             "cover_image": cover.image if cover else None,
+            "cover_image_variants": variant_urls(cover.image if cover else None),
             "created_at": news.created_at.isoformat() if news.created_at else None,
         })
 
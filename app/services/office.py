@@ -21,6 +21,7 @@ from sqlalchemy.orm import selectinload
 
 from app.api.v1.schema.office import OfficeCreate, UpdateOffice
 from app.core.logger import get_logger
+from app.core.cache import cached_response, invalidate
 from app.models.office.office import (
     Office,
     OfficeTr,
@@ -275,6 +276,7 @@ async def get_office_admin(office_id: int, db: AsyncSession):
         return _error(500, "Failed to load office.")
 
 
+@cached_response("office:list", tags=lambda p: ["office"])
 async def get_offices_public(lang: str, db: AsyncSession):
     """Published offices only, one language — for the website's list/grid."""
     try:
@@ -297,6 +299,7 @@ async def get_offices_public(lang: str, db: AsyncSession):
         return _error(500, "Failed to list offices.")
 
 
+@cached_response("office:detail", tags=lambda p: ["office"])
 async def get_office_public(slug: str, lang: str, db: AsyncSession):
     try:
         office = await _load_by_slug(db, slug)
@@ -344,6 +347,7 @@ async def create_office(request: OfficeCreate, db: AsyncSession):
         db.add(OfficeTr(office_id=office.id, lang_code="en", name=name_en or name_az, created_at=now, updated_at=now))
 
         await db.commit()
+        await invalidate("office")
         return JSONResponse(
             content={
                 "status_code": 201,
@@ -462,6 +466,7 @@ async def update_office(office_id: int, request: UpdateOffice, db: AsyncSession)
             await _replace_staff(db, office.id, data["staff"], now)
 
         await db.commit()
+        await invalidate("office")
         return JSONResponse(content={"status_code": 200, "message": "Office updated."})
     except Exception:
         await db.rollback()
@@ -480,6 +485,7 @@ async def publish_office(office_id: int, is_active: bool, db: AsyncSession):
         office.is_active = is_active
         office.updated_at = _now()
         await db.commit()
+        await invalidate("office")
         return JSONResponse(
             content={
                 "status_code": status.HTTP_200_OK,
@@ -504,6 +510,7 @@ async def delete_office(office_id: int, db: AsyncSession):
         images = [office.director_image_url] + [m.image_url for m in office.staff]
         await db.execute(sqlalchemy_delete(Office).where(Office.id == office_id))
         await db.commit()
+        await invalidate("office")
 
         for path in images:
             if path and not path.startswith(("http://", "https://")):
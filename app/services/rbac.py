@@ -1,9 +1,10 @@
 """RBAC service — permission resolution, the six super-admin invariants, role CRUD.
 
-Permissions are resolved from the database on every request, never from JWT claims:
-a revoked role must take effect immediately, not after the 15-minute access token
-expires. The cost is mitigated by a 30 s TTL cache keyed on ``role_id`` — the user
-row itself is always read fresh, so ``is_active`` and ``role_id`` changes are instant.
+Permissions are resolved from the database, never from JWT claims: a revoked role
+must take effect immediately, not after the 15-minute access token expires. Requests
+read them off the actor record (``app.core.actor_cache``), which every worker drops
+as soon as a role's grants or an admin's row change; other callers go through a
+30 s TTL cache keyed on ``role_id``.
 
 ``super_admin`` is implicit-all: it owns zero ``role_permissions`` rows and is
 short-circuited in :func:`has_permission`, so no amount of DB state can neuter it.
@@ -79,9 +80,18 @@ async def get_role_snapshot(db: AsyncSession, role_id: Optional[int]) -> Optiona
     if cached and (time.monotonic() - cached[0]) < ROLE_CACHE_TTL_SECONDS:
         return cached[1]
 
+    snapshot = await load_role_snapshot(db, role_id)
+    _role_cache[role_id] = (time.monotonic(), snapshot)
+    return snapshot
+
+
+async def load_role_snapshot(db: AsyncSession, role_id: Optional[int]) -> Optional[RoleSnapshot]:
+    """Uncached :func:`get_role_snapshot` — for records shared beyond this worker."""
+    if role_id is None:
+        return None
+
     role = (await db.execute(select(Role).where(Role.id == role_id))).scalar_one_or_none()
     if role is None:
-        _role_cache[role_id] = (time.monotonic(), None)
         return None
 
     if role.code == SUPER_ADMIN_CODE:
@@ -94,11 +104,9 @@ async def get_role_snapshot(db: AsyncSession, role_id: Optional[int]) -> Optiona
         )
         keys = frozenset(rows.scalars().all())
 
-    snapshot = RoleSnapshot(
+    return RoleSnapshot(
         id=role.id, code=role.code, is_system=bool(role.is_system), permissions=keys
     )
-    _role_cache[role_id] = (time.monotonic(), snapshot)
-    return snapshot
 
 
 async def get_role_permissions(db: AsyncSession, role_id: Optional[int]) -> FrozenSet[str]:
@@ -107,7 +115,10 @@ async def get_role_permissions(db: AsyncSession, role_id: Optional[int]) -> Froz
 
 
 async def has_permission(db: AsyncSession, user: AdminUser, key: Optional[str]) -> bool:
-    snapshot = await get_role_snapshot(db, user.role_id)
+    return snapshot_permits(await get_role_snapshot(db, user.role_id), key)
+
+
+def snapshot_permits(snapshot: Optional[RoleSnapshot], key: Optional[str]) -> bool:
     if snapshot is None:
         return False
     if snapshot.is_super_admin:
@@ -122,6 +133,13 @@ async def is_super_admin(db: AsyncSession, user: AdminUser) -> bool:
     return bool(snapshot and snapshot.is_super_admin)
 
 
+async def _invalidate_actors() -> None:
+    # Imported here: actor_cache builds its records from this module.
+    from app.core.actor_cache import invalidate_all_actors
+
+    await invalidate_all_actors()
+
+
 # ── Invariants ─────────────────────────────────────────────────────────────────
 
 def assert_not_self(actor: Optional[AdminUser], target_user_id: Optional[int]) -> None:
@@ -423,6 +441,7 @@ async def update_role_permissions(db: AsyncSession, role_id: int, payload):
 
         await db.commit()
         invalidate_role_cache(role_id)
+        await _invalidate_actors()
 
         return JSONResponse(
             content={"status_code": 200, "message": "Rolun icazələri yeniləndi."},
@@ -486,6 +505,7 @@ async def delete_role(db: AsyncSession, role_id: int, reassign_to_role_id: Optio
         await db.delete(role)
         await db.commit()
         invalidate_role_cache()
+        await _invalidate_actors()
 
         return JSONResponse(
             content={"status_code": 200, "message": "Rol silindi."}, status_code=status.HTTP_200_OK
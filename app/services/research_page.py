@@ -28,6 +28,7 @@ from sqlalchemy.orm import selectinload
 
 from app.api.v1.schema.research import UpdateResearchPage
 from app.core.logger import get_logger
+from app.core.cache import cached_response, invalidate
 from app.models.research.research import (
     ResearchPage,
     ResearchPageLink,
@@ -380,6 +381,7 @@ async def get_page_admin(page_key: str, db: AsyncSession):
         return _error(500, "Failed to load research page.")
 
 
+@cached_response("research:page", tags=lambda p: [f"research:{p['page_key']}"])
 async def get_page_public(page_key: str, lang: str, db: AsyncSession):
     try:
         page = await _load_page(db, page_key)
@@ -613,6 +615,7 @@ async def update_page(page_key: str, request: UpdateResearchPage, db: AsyncSessi
             await _replace_links(db, page.id, data["links"], now)
 
         await db.commit()
+        await invalidate(f"research:{page_key}")
 
         # Only after the rows are durably gone, and never inside the try that
         # could roll back: a file unlinked ahead of a failed commit would leave
@@ -644,6 +647,7 @@ async def publish_page(page_key: str, is_active: bool, db: AsyncSession):
         page.is_active = is_active
         page.updated_at = _now()
         await db.commit()
+        await invalidate(f"research:{page_key}")
 
         return JSONResponse(
             content={
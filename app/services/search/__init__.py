@@ -13,6 +13,8 @@ from app.services.search.service import (
     reindex_employee,
     reindex_research_institute,
     delete_doc_by_type,
+    build_docs,
+    bulk_actions,
     on_news_change, on_news_delete,
     on_announcement_change, on_announcement_delete,
     on_project_change, on_project_delete,
@@ -23,6 +25,11 @@ from app.services.search.service import (
     on_employee_change, on_employee_delete,
     on_research_institute_change, on_research_institute_delete,
 )
+from app.services.search.queue import (
+    enqueue,
+    start_indexing_queue,
+    stop_indexing_queue,
+)
 
 __all__ = [
     "SUPPORTED_LANGS",
@@ -39,6 +46,11 @@ __all__ = [
     "reindex_employee",
     "reindex_research_institute",
     "delete_doc_by_type",
+    "build_docs",
+    "bulk_actions",
+    "enqueue",
+    "start_indexing_queue",
+    "stop_indexing_queue",
     "on_news_change", "on_news_delete",
     "on_announcement_change", "on_announcement_delete",
     "on_project_change", "on_project_delete",
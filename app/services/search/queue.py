@@ -0,0 +1,248 @@
+"""Background indexing queue for the `on_*` search hooks.
+
+Service mutations only call ``enqueue(doc_type, ident)``; a per-worker asyncio
+task re-reads the rows in its own DB session and writes them to Elasticsearch
+through a single ``_bulk`` request per batch. Repeated changes to the same
+document before a flush coalesce into one sync, and a delete is just a sync
+that finds the row gone.
+
+Pending documents are mirrored in a Redis sorted set so an ES outage or a
+worker restart does not drop updates: a member is only removed once ES has
+accepted the document, failed batches are retried with back-off, and every
+worker picks up the set again on startup. Each member is scored with the time
+of its latest enqueue, and a flush only removes members scored before the
+moment it took its batch — a change enqueued while the flush ran, here or
+in another worker, stays in Redis until a flush that read it. Redis being
+unavailable degrades to the in-memory queue alone — never to a failed request.
+
+A document whose row cannot be turned into an ES document (an error in
+``build_docs`` that is not the database being away) is dropped with an error
+log, like one ES rejects, so it never holds up the rest of its batch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+
+from sqlalchemy.exc import DataError, DBAPIError, IntegrityError
+
+from app.core.database import AsyncSessionLocal
+from app.core.elasticsearch import get_es
+from app.core.redis_client import get_redis
+
+logger = logging.getLogger("aztu.search.queue")
+
+PENDING_KEY = "search:pending:z"
+# The plain set used before members carried a score; drained on startup.
+_LEGACY_PENDING_KEY = "search:pending"
+BATCH_SIZE = 200
+# Short pause before a flush so a burst of saves (e.g. a cafedra edit firing
+# several hooks) lands in one batch.
+_COALESCE_SECONDS = 0.5
+_RETRY_MIN_SECONDS = 2.0
+_RETRY_MAX_SECONDS = 60.0
+# SQLSTATE classes for a row that fails the same way on every read: data
+# exceptions (22) and integrity violations (23).
+_ROW_SQLSTATE_CLASSES = ("22", "23")
+
+# Raise a member's score, never lower it: a worker whose clock lags must not
+# make a newer enqueue look older than a flush that never read it.
+_MARK = """
+local current = redis.call('ZSCORE', KEYS[1], ARGV[2])
+if not current or tonumber(current) < tonumber(ARGV[1]) then
+    redis.call('ZADD', KEYS[1], ARGV[1], ARGV[2])
+end
+return 1
+"""
+# Remove the members a flush taken at ARGV[1] covered. Strictly earlier: an
+# enqueue in the same millisecond may have committed after the flush read.
+_CLEAR = """
+local removed = 0
+for i = 2, #ARGV do
+    local score = redis.call('ZSCORE', KEYS[1], ARGV[i])
+    if score and tonumber(score) < tonumber(ARGV[1]) then
+        removed = removed + redis.call('ZREM', KEYS[1], ARGV[i])
+    end
+end
+return removed
+"""
+
+_pending: dict[str, tuple[str, object]] = {}
+_wakeup: asyncio.Event | None = None
+_worker: asyncio.Task | None = None
+
+
+def _member(doc_type: str, ident) -> str:
+    # JSON keeps the identifier's type: news ids are ints, faculty codes strings.
+    return json.dumps([doc_type, ident])
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _event() -> asyncio.Event:
+    global _wakeup
+    if _wakeup is None:
+        _wakeup = asyncio.Event()
+    return _wakeup
+
+
+async def enqueue(doc_type: str, ident) -> None:
+    """Schedule ``doc_type``/``ident`` to be synced to ES. Never raises."""
+    member = _member(doc_type, ident)
+    _pending[member] = (doc_type, ident)
+    _event().set()
+    try:
+        redis = await get_redis()
+        await redis.eval(_MARK, 1, PENDING_KEY, _now_ms(), member)
+    except Exception as exc:
+        logger.warning("Index queue: Redis unavailable, %s kept in memory only: %s", member, exc)
+
+
+def _transient(exc: Exception) -> bool:
+    """Whether building a document failed because the database is away, not
+    because of the document's row."""
+    if isinstance(exc, (IntegrityError, DataError)):
+        return False
+    if isinstance(exc, DBAPIError):
+        sqlstate = getattr(exc.orig, "sqlstate", None) or ""
+        return sqlstate[:2] not in _ROW_SQLSTATE_CLASSES
+    return isinstance(exc, (OSError, asyncio.TimeoutError))
+
+
+async def _flush(batch: dict[str, tuple[str, object]]) -> set[str]:
+    """Sync ``batch`` to ES; returns the members ES accepted."""
+    from app.services.search.service import build_docs, bulk_actions
+
+    operations: list[dict] = []
+    owners: list[str] = []  # member for every action, in _bulk item order
+    async with AsyncSessionLocal() as db:
+        for member, (doc_type, ident) in batch.items():
+            try:
+                docs = await build_docs(db, doc_type, ident)
+            except Exception as exc:
+                if _transient(exc):
+                    raise
+                logger.exception("Index queue: could not build %s, dropped: %s", member, exc)
+                await db.rollback()
+                continue
+            operations.extend(bulk_actions(doc_type, ident, docs))
+            owners.extend([member] * len(docs))  # one action per language
+
+    if not operations:
+        return set(batch)
+    es = await get_es()
+    response = await es.bulk(operations=operations, refresh=False)
+
+    failed: set[str] = set()
+    if response.get("errors"):
+        for member, item in zip(owners, response["items"]):
+            (op, result), = item.items()
+            code = result.get("status", 500)
+            if code < 300 or (op == "delete" and code == 404):
+                continue  # deleting a document that was never indexed is fine
+            if code == 429 or code >= 500:
+                failed.add(member)
+                logger.warning("Index queue: %s %s failed, will retry: %s", op, member, result.get("error"))
+            else:
+                # A rejected document (e.g. a mapping error) fails the same way
+                # on every retry — log it and let it go.
+                logger.error("Index queue: %s %s rejected: %s", op, member, result.get("error"))
+    return set(batch) - failed
+
+
+def _take_batch() -> tuple[int, dict[str, tuple[str, object]]]:
+    """The next batch and when it was taken — before its rows are read."""
+    batch: dict[str, tuple[str, object]] = {}
+    for member in list(_pending)[:BATCH_SIZE]:
+        batch[member] = _pending.pop(member)
+    return _now_ms(), batch
+
+
+async def _process(taken: tuple[int, dict[str, tuple[str, object]]]) -> bool:
+    """Flush a batch, clear what ES accepted from Redis and requeue the rest.
+
+    Returns whether the whole batch went through.
+    """
+    taken_at, batch = taken
+    try:
+        done = await _flush(batch)
+    except Exception as exc:
+        logger.warning("Index queue: flush of %d documents failed: %s", len(batch), exc)
+        done = set()
+
+    for member in set(batch) - done:
+        # A newer enqueue of the same document wins; it syncs the same row.
+        _pending.setdefault(member, batch[member])
+    if done:
+        try:
+            redis = await get_redis()
+            await redis.eval(_CLEAR, 1, PENDING_KEY, taken_at, *done)
+        except Exception as exc:
+            logger.warning("Index queue: could not clear %d synced members: %s", len(done), exc)
+    return len(done) == len(batch)
+
+
+async def _run() -> None:
+    delay = _RETRY_MIN_SECONDS
+    while True:
+        await _event().wait()
+        _event().clear()
+        await asyncio.sleep(_COALESCE_SECONDS)
+
+        while _pending:
+            if await _process(_take_batch()):
+                delay = _RETRY_MIN_SECONDS
+            else:
+                logger.info("Index queue: retrying in %.0fs", delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _RETRY_MAX_SECONDS)
+
+
+async def start_indexing_queue() -> None:
+    """Start this worker's queue task and pick up anything left in Redis."""
+    global _worker
+    try:
+        redis = await get_redis()
+        legacy = await redis.smembers(_LEGACY_PENDING_KEY)
+        if legacy:
+            now = _now_ms()
+            async with redis.pipeline(transaction=True) as pipe:
+                for member in legacy:
+                    pipe.eval(_MARK, 1, PENDING_KEY, now, member)
+                pipe.delete(_LEGACY_PENDING_KEY)
+                await pipe.execute()
+        for member in await redis.zrange(PENDING_KEY, 0, -1):
+            doc_type, ident = json.loads(member)
+            _pending[member] = (doc_type, ident)
+        if _pending:
+            logger.info("Index queue: resuming %d pending documents", len(_pending))
+            _event().set()
+    except Exception as exc:
+        logger.warning("Index queue: could not load pending documents: %s", exc)
+    _worker = asyncio.create_task(_run(), name="search-index-queue")
+
+
+async def stop_indexing_queue(timeout: float = 5.0) -> None:
+    """Flush what is pending (bounded by ``timeout``) and stop the task.
+
+    Anything not flushed stays in the Redis set for the next start.
+    """
+    global _worker
+    if _worker is None:
+        return
+    _worker.cancel()
+    try:
+        await _worker
+    except asyncio.CancelledError:
+        pass
+    _worker = None
+    if _pending:
+        try:
+            await asyncio.wait_for(_process(_take_batch()), timeout)
+        except Exception as exc:
+            logger.warning("Index queue: final flush skipped: %s", exc)
@@ -2,14 +2,15 @@
 
 Indexing helpers re-query the DB by primary identifier so callers in service
 files only need a single line after `db.commit()` and don't have to pass
-loaded relationships around. All ES errors are caught and logged — they
+loaded relationships around. The `on_*` hooks hand the identifier to the
+background queue (`queue.py`); all ES errors are caught and logged — they
 must NEVER fail the originating API request.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Iterable
+from typing import AsyncIterator, Iterable
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -17,6 +18,7 @@ from elasticsearch import AsyncElasticsearch
 from elasticsearch import NotFoundError
 
 from app.core.config import settings
+from app.services.search.queue import enqueue
 from app.services.search.mappings import LANG_TO_ANALYZER, index_settings
 from app.services.search.indexers import (
     build_news_doc,
@@ -88,7 +90,10 @@ async def drop_indices(es: AsyncElasticsearch, doc_types: Iterable[str] | None =
     for lang in langs_t:
         for doc_type in types:
             try:
-                await es.indices.delete(index=index_name(doc_type, lang))
+                # After a --swap reindex the per-type name is an alias; ES only
+                # deletes concrete indices, so resolve it first.
+                backing = await es.indices.get(index=index_name(doc_type, lang))
+                await es.indices.delete(index=",".join(backing.keys()))
             except NotFoundError:
                 pass
             except Exception as exc:
@@ -124,251 +129,201 @@ async def delete_doc_by_type(es: AsyncElasticsearch, doc_type: str, doc_id) -> N
         await _safe_delete(es, doc_type, lang, doc_id)
 
 
-# ── Per-type reindex (queries DB by id, builds per-language docs) ────────────
+# ── Per-type document sources ────────────────────────────────────────────────
 
-async def reindex_news(es: AsyncElasticsearch, db: AsyncSession, news_id: int) -> None:
-    from app.models.news.news import News
-    from app.models.news.news_translation import NewsTranslation
+def _doc_source(doc_type: str):
+    """``(model, id column, translation model, translation FK)`` for a type.
 
-    news = (await db.execute(select(News).where(News.news_id == news_id))).scalar_one_or_none()
-    if not news:
-        await delete_doc_by_type(es, "news", news_id)
-        return
-    translations = (await db.execute(
-        select(NewsTranslation).where(NewsTranslation.news_id == news_id)
-    )).scalars().all()
+    Model imports stay local to avoid import cycles with the services.
+    """
+    if doc_type == "news":
+        from app.models.news.news import News
+        from app.models.news.news_translation import NewsTranslation
+        return News, News.news_id, NewsTranslation, NewsTranslation.news_id
+    if doc_type == "announcement":
+        from app.models.announcement.announcement import Announcement
+        from app.models.announcement.announcement_translation import AnnouncementTranslation
+        return Announcement, Announcement.announcement_id, AnnouncementTranslation, AnnouncementTranslation.announcement_id
+    if doc_type == "project":
+        from app.models.project.project import Project
+        from app.models.project.project_tr import ProjectTranslation
+        return Project, Project.project_id, ProjectTranslation, ProjectTranslation.project_id
+    if doc_type == "collaboration":
+        from app.models.collaboration.collaboration import Collaboration
+        from app.models.collaboration.collaboration_tr import CollaborationTranslation
+        return Collaboration, Collaboration.collaboration_id, CollaborationTranslation, CollaborationTranslation.collaboration_id
+    if doc_type == "faculty":
+        from app.models.faculties.faculties import Faculty
+        from app.models.faculties.faculties_tr import FacultyTr
+        return Faculty, Faculty.faculty_code, FacultyTr, FacultyTr.faculty_code
+    if doc_type == "cafedra":
+        from app.models.cafedras.cafedras import Cafedra
+        from app.models.cafedras.cafedras_tr import CafedraTr
+        return Cafedra, Cafedra.cafedra_code, CafedraTr, CafedraTr.cafedra_code
+    if doc_type == "department":
+        from app.models.departments.department import Department
+        from app.models.departments.department_tr import DepartmentTr
+        return Department, Department.department_code, DepartmentTr, DepartmentTr.department_code
+    if doc_type == "employee":
+        from app.models.employee.employee import Employee
+        from app.models.employee.employee_tr import EmployeeTr
+        return Employee, Employee.employee_code, EmployeeTr, EmployeeTr.employee_code
+    if doc_type == "research_institute":
+        from app.models.research_institute.institute import ResearchInstitute, ResearchInstituteTr
+        return ResearchInstitute, ResearchInstitute.institute_code, ResearchInstituteTr, ResearchInstituteTr.institute_code
+    raise ValueError(f"Unknown doc type: {doc_type}")
+
+
+_DOC_BUILDERS = {
+    "news": build_news_doc,
+    "announcement": build_announcement_doc,
+    "project": build_project_doc,
+    "collaboration": build_collaboration_doc,
+    "faculty": build_faculty_doc,
+    "cafedra": build_cafedra_doc,
+    "department": build_department_doc,
+    "employee": build_employee_doc,
+    "research_institute": build_research_institute_doc,
+}
+
+
+def _docs_for(doc_type: str, row, translations) -> dict[str, dict | None]:
+    build = _DOC_BUILDERS[doc_type]
     tr_by_lang = {t.lang_code: t for t in translations}
-    for lang in SUPPORTED_LANGS:
-        tr = tr_by_lang.get(lang)
-        doc = build_news_doc(news, tr, lang)
+    return {lang: build(row, tr_by_lang.get(lang), lang) for lang in SUPPORTED_LANGS}
+
+
+async def build_docs(db: AsyncSession, doc_type: str, ident) -> dict[str, dict | None]:
+    """Current ES document per language; ``None`` means "must not be indexed".
+
+    A deleted row yields ``None`` for every language, so syncing a document
+    and deleting it are the same operation.
+    """
+    model, id_col, tr_model, tr_fk = _doc_source(doc_type)
+    row = (await db.execute(select(model).where(id_col == ident))).scalar_one_or_none()
+    if row is None:
+        return {lang: None for lang in SUPPORTED_LANGS}
+    translations = (await db.execute(select(tr_model).where(tr_fk == ident))).scalars().all()
+    return _docs_for(doc_type, row, translations)
+
+
+async def iter_doc_batches(
+    db: AsyncSession, doc_type: str, batch_size: int = 500, limit: int | None = None,
+) -> AsyncIterator[list[tuple[object, dict[str, dict | None]]]]:
+    """Yield ``[(ident, docs_by_lang), ...]`` for every row of ``doc_type``.
+
+    Rows are read in primary-key order with keyset pagination, and each
+    batch's translations in a single ``IN`` query — two queries per batch
+    instead of two per row.
+    """
+    model, id_col, tr_model, tr_fk = _doc_source(doc_type)
+    last = None
+    seen = 0
+    while limit is None or seen < limit:
+        size = batch_size if limit is None else min(batch_size, limit - seen)
+        query = select(model).order_by(id_col).limit(size)
+        if last is not None:
+            query = query.where(id_col > last)
+        rows = (await db.execute(query)).scalars().all()
+        if not rows:
+            return
+        key = id_col.key
+        ids = [getattr(row, key) for row in rows]
+        translations = (await db.execute(select(tr_model).where(tr_fk.in_(ids)))).scalars().all()
+        by_owner: dict[object, list] = {}
+        for tr in translations:
+            by_owner.setdefault(getattr(tr, tr_fk.key), []).append(tr)
+        yield [(ident, _docs_for(doc_type, row, by_owner.get(ident, []))) for ident, row in zip(ids, rows)]
+        # Rows are ORM instances of a big table: drop them from the identity map.
+        db.expunge_all()
+        last = ids[-1]
+        seen += len(rows)
+
+
+def bulk_actions(doc_type: str, ident, docs: dict[str, dict | None]) -> list[dict]:
+    """``_bulk`` operation lines that bring ``ident`` in line with ``docs``."""
+    operations: list[dict] = []
+    for lang, doc in docs.items():
+        target = {"_index": index_name(doc_type, lang), "_id": str(ident)}
         if doc is None:
-            await _safe_delete(es, "news", lang, news_id)
+            operations.append({"delete": target})
         else:
-            await _safe_index(es, "news", lang, news_id, doc)
+            operations.append({"index": target})
+            operations.append(doc)
+    return operations
 
 
-async def reindex_announcement(es: AsyncElasticsearch, db: AsyncSession, announcement_id: int) -> None:
-    from app.models.announcement.announcement import Announcement
-    from app.models.announcement.announcement_translation import AnnouncementTranslation
-
-    ann = (await db.execute(
-        select(Announcement).where(Announcement.announcement_id == announcement_id)
-    )).scalar_one_or_none()
-    if not ann:
-        await delete_doc_by_type(es, "announcement", announcement_id)
-        return
-    translations = (await db.execute(
-        select(AnnouncementTranslation).where(AnnouncementTranslation.announcement_id == announcement_id)
-    )).scalars().all()
-    tr_by_lang = {t.lang_code: t for t in translations}
-    for lang in SUPPORTED_LANGS:
-        doc = build_announcement_doc(ann, tr_by_lang.get(lang), lang)
+# ── Per-type reindex (direct writes, used by the reindex script) ─────────────
+
+async def _reindex(es: AsyncElasticsearch, db: AsyncSession, doc_type: str, ident) -> None:
+    docs = await build_docs(db, doc_type, ident)
+    for lang, doc in docs.items():
         if doc is None:
-            await _safe_delete(es, "announcement", lang, announcement_id)
+            await _safe_delete(es, doc_type, lang, ident)
         else:
-            await _safe_index(es, "announcement", lang, announcement_id, doc)
+            await _safe_index(es, doc_type, lang, ident, doc)
+
+
+async def reindex_news(es: AsyncElasticsearch, db: AsyncSession, news_id: int) -> None:
+    await _reindex(es, db, "news", news_id)
+
+
+async def reindex_announcement(es: AsyncElasticsearch, db: AsyncSession, announcement_id: int) -> None:
+    await _reindex(es, db, "announcement", announcement_id)
 
 
 async def reindex_project(es: AsyncElasticsearch, db: AsyncSession, project_id: int) -> None:
-    from app.models.project.project import Project
-    from app.models.project.project_tr import ProjectTranslation
-
-    proj = (await db.execute(
-        select(Project).where(Project.project_id == project_id)
-    )).scalar_one_or_none()
-    if not proj:
-        await delete_doc_by_type(es, "project", project_id)
-        return
-    translations = (await db.execute(
-        select(ProjectTranslation).where(ProjectTranslation.project_id == project_id)
-    )).scalars().all()
-    tr_by_lang = {t.lang_code: t for t in translations}
-    for lang in SUPPORTED_LANGS:
-        doc = build_project_doc(proj, tr_by_lang.get(lang), lang)
-        if doc is None:
-            await _safe_delete(es, "project", lang, project_id)
-        else:
-            await _safe_index(es, "project", lang, project_id, doc)
+    await _reindex(es, db, "project", project_id)
 
 
 async def reindex_collaboration(es: AsyncElasticsearch, db: AsyncSession, collaboration_id: int) -> None:
-    from app.models.collaboration.collaboration import Collaboration
-    from app.models.collaboration.collaboration_tr import CollaborationTranslation
-
-    coll = (await db.execute(
-        select(Collaboration).where(Collaboration.collaboration_id == collaboration_id)
-    )).scalar_one_or_none()
-    if not coll:
-        await delete_doc_by_type(es, "collaboration", collaboration_id)
-        return
-    translations = (await db.execute(
-        select(CollaborationTranslation).where(CollaborationTranslation.collaboration_id == collaboration_id)
-    )).scalars().all()
-    tr_by_lang = {t.lang_code: t for t in translations}
-    for lang in SUPPORTED_LANGS:
-        doc = build_collaboration_doc(coll, tr_by_lang.get(lang), lang)
-        if doc is None:
-            await _safe_delete(es, "collaboration", lang, collaboration_id)
-        else:
-            await _safe_index(es, "collaboration", lang, collaboration_id, doc)
+    await _reindex(es, db, "collaboration", collaboration_id)
 
 
 async def reindex_faculty(es: AsyncElasticsearch, db: AsyncSession, faculty_code: str) -> None:
-    from app.models.faculties.faculties import Faculty
-    from app.models.faculties.faculties_tr import FacultyTr
-
-    fac = (await db.execute(
-        select(Faculty).where(Faculty.faculty_code == faculty_code)
-    )).scalar_one_or_none()
-    if not fac:
-        await delete_doc_by_type(es, "faculty", faculty_code)
-        return
-    translations = (await db.execute(
-        select(FacultyTr).where(FacultyTr.faculty_code == faculty_code)
-    )).scalars().all()
-    tr_by_lang = {t.lang_code: t for t in translations}
-    for lang in SUPPORTED_LANGS:
-        doc = build_faculty_doc(fac, tr_by_lang.get(lang), lang)
-        if doc is None:
-            await _safe_delete(es, "faculty", lang, faculty_code)
-        else:
-            await _safe_index(es, "faculty", lang, faculty_code, doc)
+    await _reindex(es, db, "faculty", faculty_code)
 
 
 async def reindex_cafedra(es: AsyncElasticsearch, db: AsyncSession, cafedra_code: str) -> None:
-    from app.models.cafedras.cafedras import Cafedra
-    from app.models.cafedras.cafedras_tr import CafedraTr
-
-    caf = (await db.execute(
-        select(Cafedra).where(Cafedra.cafedra_code == cafedra_code)
-    )).scalar_one_or_none()
-    if not caf:
-        await delete_doc_by_type(es, "cafedra", cafedra_code)
-        return
-    translations = (await db.execute(
-        select(CafedraTr).where(CafedraTr.cafedra_code == cafedra_code)
-    )).scalars().all()
-    tr_by_lang = {t.lang_code: t for t in translations}
-    for lang in SUPPORTED_LANGS:
-        doc = build_cafedra_doc(caf, tr_by_lang.get(lang), lang)
-        if doc is None:
-            await _safe_delete(es, "cafedra", lang, cafedra_code)
-        else:
-            await _safe_index(es, "cafedra", lang, cafedra_code, doc)
+    await _reindex(es, db, "cafedra", cafedra_code)
 
 
 async def reindex_department(es: AsyncElasticsearch, db: AsyncSession, department_code: str) -> None:
-    from app.models.departments.department import Department
-    from app.models.departments.department_tr import DepartmentTr
-
-    dep = (await db.execute(
-        select(Department).where(Department.department_code == department_code)
-    )).scalar_one_or_none()
-    if not dep:
-        await delete_doc_by_type(es, "department", department_code)
-        return
-    translations = (await db.execute(
-        select(DepartmentTr).where(DepartmentTr.department_code == department_code)
-    )).scalars().all()
-    tr_by_lang = {t.lang_code: t for t in translations}
-    for lang in SUPPORTED_LANGS:
-        doc = build_department_doc(dep, tr_by_lang.get(lang), lang)
-        if doc is None:
-            await _safe_delete(es, "department", lang, department_code)
-        else:
-            await _safe_index(es, "department", lang, department_code, doc)
+    await _reindex(es, db, "department", department_code)
 
 
 async def reindex_employee(es: AsyncElasticsearch, db: AsyncSession, employee_code: str) -> None:
-    from app.models.employee.employee import Employee
-    from app.models.employee.employee_tr import EmployeeTr
-
-    emp = (await db.execute(
-        select(Employee).where(Employee.employee_code == employee_code)
-    )).scalar_one_or_none()
-    if not emp:
-        await delete_doc_by_type(es, "employee", employee_code)
-        return
-    translations = (await db.execute(
-        select(EmployeeTr).where(EmployeeTr.employee_code == employee_code)
-    )).scalars().all()
-    tr_by_lang = {t.lang_code: t for t in translations}
-    for lang in SUPPORTED_LANGS:
-        doc = build_employee_doc(emp, tr_by_lang.get(lang), lang)
-        if doc is None:
-            await _safe_delete(es, "employee", lang, employee_code)
-        else:
-            await _safe_index(es, "employee", lang, employee_code, doc)
+    await _reindex(es, db, "employee", employee_code)
 
 
 async def reindex_research_institute(es: AsyncElasticsearch, db: AsyncSession, institute_code: str) -> None:
-    from app.models.research_institute.institute import ResearchInstitute, ResearchInstituteTr
-
-    inst = (await db.execute(
-        select(ResearchInstitute).where(ResearchInstitute.institute_code == institute_code)
-    )).scalar_one_or_none()
-    if not inst:
-        await delete_doc_by_type(es, "research_institute", institute_code)
-        return
-    translations = (await db.execute(
-        select(ResearchInstituteTr).where(ResearchInstituteTr.institute_code == institute_code)
-    )).scalars().all()
-    tr_by_lang = {t.lang_code: t for t in translations}
-    for lang in SUPPORTED_LANGS:
-        doc = build_research_institute_doc(inst, tr_by_lang.get(lang), lang)
-        if doc is None:
-            await _safe_delete(es, "research_institute", lang, institute_code)
-        else:
-            await _safe_index(es, "research_institute", lang, institute_code, doc)
+    await _reindex(es, db, "research_institute", institute_code)
 
 
 # ── Hook helpers (one line per service-file call site) ──────────────────────
-
-async def _hook(reindex_fn, db, ident) -> None:
-    """Run an async reindex inside a guarded ES client lookup."""
-    try:
-        from app.core.elasticsearch import get_es as _get_es
-        es = await _get_es()
-    except Exception as exc:
-        logger.warning("ES client unavailable for indexing: %s", exc)
-        return
-    try:
-        await reindex_fn(es, db, ident)
-    except Exception as exc:
-        logger.warning("Reindex hook %s(%s) failed: %s", reindex_fn.__name__, ident, exc)
-
-
-async def _delete_hook(doc_type: str, ident) -> None:
-    try:
-        from app.core.elasticsearch import get_es as _get_es
-        es = await _get_es()
-    except Exception as exc:
-        logger.warning("ES client unavailable for delete: %s", exc)
-        return
-    try:
-        await delete_doc_by_type(es, doc_type, ident)
-    except Exception as exc:
-        logger.warning("Delete hook %s(%s) failed: %s", doc_type, ident, exc)
-
-
-async def on_news_change(db, news_id):                 await _hook(reindex_news, db, news_id)
-async def on_news_delete(news_id):                     await _delete_hook("news", news_id)
-async def on_announcement_change(db, announcement_id): await _hook(reindex_announcement, db, announcement_id)
-async def on_announcement_delete(announcement_id):     await _delete_hook("announcement", announcement_id)
-async def on_project_change(db, project_id):           await _hook(reindex_project, db, project_id)
-async def on_project_delete(project_id):               await _delete_hook("project", project_id)
-async def on_collaboration_change(db, collaboration_id): await _hook(reindex_collaboration, db, collaboration_id)
-async def on_collaboration_delete(collaboration_id):   await _delete_hook("collaboration", collaboration_id)
-async def on_faculty_change(db, faculty_code):         await _hook(reindex_faculty, db, faculty_code)
-async def on_faculty_delete(faculty_code):             await _delete_hook("faculty", faculty_code)
-async def on_cafedra_change(db, cafedra_code):         await _hook(reindex_cafedra, db, cafedra_code)
-async def on_cafedra_delete(cafedra_code):             await _delete_hook("cafedra", cafedra_code)
-async def on_department_change(db, department_code):   await _hook(reindex_department, db, department_code)
-async def on_department_delete(department_code):       await _delete_hook("department", department_code)
-async def on_employee_change(db, employee_code):       await _hook(reindex_employee, db, employee_code)
-async def on_employee_delete(employee_code):           await _delete_hook("employee", employee_code)
-async def on_research_institute_change(db, institute_code): await _hook(reindex_research_institute, db, institute_code)
-async def on_research_institute_delete(institute_code):     await _delete_hook("research_institute", institute_code)
+#
+# Hooks only enqueue: the indexing queue re-reads the row in its own session and
+# writes through ``_bulk`` after the admin's response is sent. ``db`` is kept
+# in the change-hook signature so call sites stay one line.
+
+async def on_news_change(db, news_id):                 await enqueue("news", news_id)
+async def on_news_delete(news_id):                     await enqueue("news", news_id)
+async def on_announcement_change(db, announcement_id): await enqueue("announcement", announcement_id)
+async def on_announcement_delete(announcement_id):     await enqueue("announcement", announcement_id)
+async def on_project_change(db, project_id):           await enqueue("project", project_id)
+async def on_project_delete(project_id):               await enqueue("project", project_id)
+async def on_collaboration_change(db, collaboration_id): await enqueue("collaboration", collaboration_id)
+async def on_collaboration_delete(collaboration_id):   await enqueue("collaboration", collaboration_id)
+async def on_faculty_change(db, faculty_code):         await enqueue("faculty", faculty_code)
+async def on_faculty_delete(faculty_code):             await enqueue("faculty", faculty_code)
+async def on_cafedra_change(db, cafedra_code):         await enqueue("cafedra", cafedra_code)
+async def on_cafedra_delete(cafedra_code):             await enqueue("cafedra", cafedra_code)
+async def on_department_change(db, department_code):   await enqueue("department", department_code)
+async def on_department_delete(department_code):       await enqueue("department", department_code)
+async def on_employee_change(db, employee_code):       await enqueue("employee", employee_code)
+async def on_employee_delete(employee_code):           await enqueue("employee", employee_code)
+async def on_research_institute_change(db, institute_code): await enqueue("research_institute", institute_code)
+async def on_research_institute_delete(institute_code):     await enqueue("research_institute", institute_code)
 
 
 # ── Search ───────────────────────────────────────────────────────────────────
@@ -1,9 +1,16 @@
+import asyncio
+import hashlib
 import os
 import logging
 import secrets
 import filetype
 from fastapi import UploadFile, HTTPException
+from sqlalchemy import delete, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.upload.upload_blob import UploadBlob
+from app.core.static_files import COMPRESSIBLE_TYPES, compressed_siblings, media_type, precompress
 
 logger = logging.getLogger("aztu.upload")
 
@@ -43,6 +50,129 @@ ALLOWED_DOC_MIMES: dict[str, str] = {
 }
 
 
+# Uploads are streamed: read in chunks, sniffed from the head, size-checked as
+# they arrive and written off the event loop, so a large video costs one chunk
+# of memory instead of its whole size and never blocks other requests.
+_CHUNK_SIZE = 1024 * 1024
+# filetype inspects at most this many leading bytes.
+_SNIFF_SIZE = 8192
+
+
+def _too_large(limit: int) -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"File too large. Max {limit // (1024 * 1024)} MB",
+    )
+
+
+def _resolve_target_dir(subdirectory: str) -> str:
+    target_dir = os.path.abspath(os.path.join(STATIC_BASE, subdirectory))
+    # Robust path traversal check
+    if os.path.commonpath([STATIC_BASE, target_dir]) != STATIC_BASE:
+        logger.error("Path traversal attempt: subdirectory='%s', resolved='%s'", subdirectory, target_dir)
+        raise HTTPException(status_code=400, detail="Invalid directory")
+
+    try:
+        os.makedirs(target_dir, exist_ok=True)
+    except OSError as e:
+        logger.error("Failed to create directory %s: %s", target_dir, e)
+        raise HTTPException(
+            status_code=500,
+            detail="Could not create upload directory. Please check permissions."
+        )
+    return target_dir
+
+
+def _discard(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _write_chunk(f, digest, chunk: bytes) -> None:
+    f.write(chunk)
+    digest.update(chunk)
+
+
+def _public_url(key: str) -> str:
+    relative = f"static/{key}"
+    base = (settings.PUBLIC_BASE_URL or "").rstrip("/")
+    return f"{base}/{relative}" if base else relative
+
+
+# Uploads are content-addressed: identical bytes are stored once, in the file
+# of the first upload, and every later upload of them gets that file's URL
+# with one more reference (upload_blobs). Files from before the table, or
+# stored while the database was unreachable, have no row and are deleted
+# outright as they always were.
+
+async def _claim_blob(sha256: str, ext: str, key: str, size: int) -> str | None:
+    """Key of the file holding these bytes, now with one more reference.
+
+    ``key`` itself when this is the first copy; ``None`` when the blob table
+    could not be used, in which case the new file simply stays untracked.
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            stmt = pg_insert(UploadBlob).values(
+                sha256=sha256, extension=ext, path=key, size=size, ref_count=1,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[UploadBlob.sha256, UploadBlob.extension],
+                set_={"ref_count": UploadBlob.ref_count + 1},
+            ).returning(UploadBlob.path)
+            path = (await db.execute(stmt)).scalar_one()
+            if path != key and not os.path.isfile(os.path.join(STATIC_BASE, path)):
+                # The shared copy was removed behind the app's back; the new
+                # upload takes its place.
+                logger.warning("Upload blob %s is missing, replacing it with %s", path, key)
+                await db.execute(
+                    update(UploadBlob)
+                    .where(UploadBlob.sha256 == sha256, UploadBlob.extension == ext)
+                    .values(path=key)
+                )
+                path = key
+            await db.commit()
+            return path
+    except Exception as exc:
+        logger.warning("Upload dedup unavailable, keeping %s untracked: %s", key, exc)
+        return None
+
+
+async def _release_blob(key: str) -> bool:
+    """Drop one reference to ``key``; whether its file should now be deleted.
+
+    Untracked files are deleted. When the table cannot be reached the file is
+    kept — a leaked file is recoverable, a deleted shared one is not.
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            remaining = (await db.execute(
+                update(UploadBlob)
+                .where(UploadBlob.path == key)
+                .values(ref_count=UploadBlob.ref_count - 1)
+                .returning(UploadBlob.ref_count)
+            )).scalar_one_or_none()
+            if remaining is None:
+                return True
+            if remaining > 0:
+                await db.commit()
+                return False
+            # Conditional: an upload that claimed the blob since the decrement
+            # keeps the row and the file.
+            deleted = (await db.execute(
+                delete(UploadBlob)
+                .where(UploadBlob.path == key, UploadBlob.ref_count <= 0)
+                .returning(UploadBlob.path)
+            )).scalar_one_or_none()
+            await db.commit()
+            return deleted is not None
+    except Exception as exc:
+        logger.warning("Upload dedup unavailable, keeping %s: %s", key, exc)
+        return False
+
+
 async def save_upload(
     upload: UploadFile,
     subdirectory: str,
@@ -50,18 +180,22 @@ async def save_upload(
     max_size: int | None = None,
     allow_extension_fallback: bool = False,
 ) -> str:
-    content = await upload.read()
-
-    # 1. Size check
+    # 1. Size check — up front when the client declared it, else as it streams
     limit = max_size or settings.MAX_UPLOAD_SIZE_BYTES
-    if len(content) > limit:
-        raise HTTPException(
-            status_code=413,
-            detail=f"File too large. Max {limit // (1024 * 1024)} MB",
-        )
+    if upload.size is not None and upload.size > limit:
+        raise _too_large(limit)
+
+    head = b""
+    while len(head) < _SNIFF_SIZE:
+        chunk = await upload.read(_CHUNK_SIZE)
+        if not chunk:
+            break
+        head += chunk
+    if len(head) > limit:
+        raise _too_large(limit)
 
     # 2. Detect MIME (SAFE, no system dependency)
-    kind = filetype.guess(content)
+    kind = filetype.guess(head[:_SNIFF_SIZE])
 
     detected_mime = kind.mime if kind else None
     ext: str | None = None
@@ -86,36 +220,58 @@ async def save_upload(
     filename = f"{secrets.token_hex(16)}.{ext}"
 
     # 4. Safe path
-    target_dir = os.path.abspath(os.path.join(STATIC_BASE, subdirectory))
-    # Robust path traversal check
-    if os.path.commonpath([STATIC_BASE, target_dir]) != STATIC_BASE:
-        logger.error("Path traversal attempt: subdirectory='%s', resolved='%s'", subdirectory, target_dir)
-        raise HTTPException(status_code=400, detail="Invalid directory")
-
-    try:
-        os.makedirs(target_dir, exist_ok=True)
-    except OSError as e:
-        logger.error("Failed to create directory %s: %s", target_dir, e)
-        raise HTTPException(
-            status_code=500,
-            detail="Could not create upload directory. Please check permissions."
-        )
-
+    target_dir = _resolve_target_dir(subdirectory)
     file_path = os.path.join(target_dir, filename)
 
+    # 5. Stream into a hidden temp file beside the target, then rename: the
+    #    public URL never serves a half-written file, and a rejected or failed
+    #    upload leaves nothing behind.
+    temp_path = os.path.join(target_dir, f".{filename}.part")
+    size = len(head)
+    digest = hashlib.sha256()
     try:
-        with open(file_path, "wb") as f:
-            f.write(content)
+        f = await asyncio.to_thread(open, temp_path, "wb")
+        try:
+            chunk = head
+            while chunk:
+                await asyncio.to_thread(_write_chunk, f, digest, chunk)
+                chunk = await upload.read(_CHUNK_SIZE)
+                size += len(chunk)
+                if size > limit:
+                    raise _too_large(limit)
+        finally:
+            await asyncio.to_thread(f.close)
+        await asyncio.to_thread(os.replace, temp_path, file_path)
+    except HTTPException:
+        await asyncio.to_thread(_discard, temp_path)
+        raise
     except OSError as e:
+        await asyncio.to_thread(_discard, temp_path)
         logger.error("Failed to write file %s: %s", file_path, e)
         raise HTTPException(
             status_code=500,
             detail="Could not save file. Please check permissions."
         )
 
-    relative = f"static/{subdirectory}/{filename}"
-    base = (settings.PUBLIC_BASE_URL or "").rstrip("/")
-    return f"{base}/{relative}" if base else relative
+    # 6. Deduplicate: reuse an identical stored file if there is one
+    key = os.path.relpath(file_path, STATIC_BASE).replace(os.sep, "/")
+    stored = await _claim_blob(digest.hexdigest(), ext, key, size)
+    if stored is not None and stored != key:
+        await asyncio.to_thread(_discard, file_path)
+        return _public_url(stored)
+
+    if media_type(filename) in COMPRESSIBLE_TYPES:
+        # Served precompressed by CachedStaticFiles; plain is still there.
+        try:
+            await asyncio.to_thread(precompress, file_path)
+        except OSError as e:
+            logger.warning("Precompressing %s failed: %s", file_path, e)
+
+    if detected_mime and detected_mime.startswith("image/"):
+        from app.utils.image_variants import schedule_variants
+        schedule_variants(file_path)
+
+    return _public_url(key)
 
 
 # Startup check
@@ -131,29 +287,65 @@ else:
     logger.info("Static base directory %s is ready and writable.", STATIC_BASE)
 
 
-def safe_delete_file(relative_path: str) -> None:
-    if not relative_path:
-        return
+def static_file_path(url: str) -> str | None:
+    """Local path of a stored media URL, or ``None`` if it is not under static/."""
+    if not url:
+        return None
 
     # Accept either a stored relative path ("static/...") or a full URL
     # ("https://host/static/..."). Strip the scheme+host so we resolve
     # against the local filesystem.
-    path = relative_path
+    path = url
     if "://" in path:
         path = path.split("://", 1)[1]
         path = path.split("/", 1)[1] if "/" in path else ""
     if not path:
-        return
+        return None
 
     app_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
     resolved = os.path.abspath(os.path.join(app_dir, path))
 
     if not resolved.startswith(STATIC_BASE):
-        logger.error("Path traversal attempt: %s", relative_path)
+        logger.error("Path traversal attempt: %s", url)
+        return None
+    return resolved
+
+
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _remove_stored_file(resolved: str) -> None:
+    for path in [resolved, *compressed_siblings(resolved)]:
+        if os.path.isfile(path):
+            try:
+                os.remove(path)
+            except OSError as exc:
+                logger.warning("Delete failed %s: %s", path, exc)
+
+    from app.utils.image_variants import delete_variants
+    delete_variants(resolved)
+
+
+async def _release_file(resolved: str) -> None:
+    key = os.path.relpath(resolved, STATIC_BASE).replace(os.sep, "/")
+    if await _release_blob(key):
+        await asyncio.to_thread(_remove_stored_file, resolved)
+
+
+def safe_delete_file(relative_path: str) -> None:
+    """Release a ``save_upload`` result; the file goes with its last reference.
+
+    Returns immediately: the reference is released in the background.
+    """
+    resolved = static_file_path(relative_path)
+    if resolved is None:
         return
 
-    if os.path.isfile(resolved):
-        try:
-            os.remove(resolved)
-        except OSError as exc:
-            logger.warning("Delete failed %s: %s", resolved, exc)
\ No newline at end of file
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(_release_file(resolved))
+        return
+    task = loop.create_task(_release_file(resolved))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
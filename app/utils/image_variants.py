@@ -0,0 +1,221 @@
+"""Responsive variants of uploaded images.
+
+Editors upload camera-sized photos and the public site used to send them as-is
+to every phone. After ``save_upload`` stores an image, it is resized here to
+each of IMAGE_VARIANT_WIDTHS (never upscaled) and written next to the original
+as WebP — plus AVIF when the installed Pillow can encode it:
+
+    static/news/<hex>.jpg
+    static/news/<hex>-400w.webp    static/news/<hex>-400w.avif
+    static/news/<hex>-800w.webp    ...
+    static/news/<hex>.variants.json
+
+The manifest is written last, so its presence means the set is complete.
+Readers call ``variant_urls(url)`` to list the variants beside the original URL
+(``cover_image_variants`` etc.); until the manifest exists the list is empty
+and clients keep using the original. Cached public lists show the variants
+once their entry is rebuilt.
+
+Resizing is CPU-bound, so it runs in a small process pool rather than on the
+event loop or a thread, and the upload request does not wait for it. A failed
+or skipped render (Pillow not installed, animated GIF, corrupt file) only logs;
+``python -m app.scripts.generate_image_variants`` backfills existing files.
+"""
+
+import asyncio
+import importlib.util
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from app.core.config import settings
+from app.utils.file_upload import static_file_path
+
+logger = logging.getLogger("aztu.upload.variants")
+
+_FORMATS = (
+    # (extension, Pillow format, save options)
+    ("webp", "WEBP", {"quality": 80, "method": 4}),
+    ("avif", "AVIF", {"quality": 55}),
+)
+# Parsed manifests by original path; only complete sets are remembered, so a
+# render finishing later is picked up on the next read.
+_MAX_CACHED_MANIFESTS = 4096
+_manifests: dict[str, list[dict]] = {}
+
+_pool: ProcessPoolExecutor | None = None
+_background_tasks: set[asyncio.Task] = set()
+_pillow_available: bool | None = None
+
+
+def manifest_path_for(path: str) -> str:
+    return f"{os.path.splitext(path)[0]}.variants.json"
+
+
+def _write_atomic(path: str, write) -> None:
+    temp_path = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.part")
+    try:
+        write(temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def render_variants(path: str, widths: list[int]) -> list[dict]:
+    """Write the variants of the image at ``path`` and its manifest.
+
+    Runs in a pool process (or the backfill script). Returns the manifest
+    entries; an image that gets none (already small, animated) still gets a
+    manifest so it is not rendered again.
+    """
+    from PIL import Image, ImageOps, features
+
+    formats = [f for f in _FORMATS if f[1] != "AVIF" or features.check("avif")]
+    stem, _ = os.path.splitext(path)
+    variants: list[dict] = []
+
+    with Image.open(path) as source:
+        if not getattr(source, "is_animated", False):
+            image = ImageOps.exif_transpose(source)
+            if image.mode not in ("RGB", "RGBA"):
+                has_alpha = "A" in image.getbands() or "transparency" in image.info
+                image = image.convert("RGBA" if has_alpha else "RGB")
+
+            for width in sorted(set(widths)):
+                if width >= image.width:
+                    continue
+                height = max(1, round(image.height * width / image.width))
+                resized = image.resize((width, height), Image.Resampling.LANCZOS)
+                for ext, fmt, options in formats:
+                    target = f"{stem}-{width}w.{ext}"
+                    _write_atomic(target, lambda p: resized.save(p, fmt, **options))
+                    variants.append({
+                        "file": os.path.basename(target),
+                        "width": width,
+                        "height": height,
+                        "format": ext,
+                    })
+
+    manifest = {"source": os.path.basename(path), "variants": variants}
+
+    def write_manifest(temp_path: str) -> None:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+
+    _write_atomic(manifest_path_for(path), write_manifest)
+    return variants
+
+
+def pillow_available() -> bool:
+    global _pillow_available
+    if _pillow_available is None:
+        _pillow_available = importlib.util.find_spec("PIL") is not None
+        if not _pillow_available:
+            logger.warning("Pillow is not installed; image variants are disabled")
+    return _pillow_available
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # spawn, not fork: forking a process that runs an event loop and holds
+        # DB/Redis sockets would copy all of them into the child.
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.IMAGE_VARIANT_PROCESSES,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+async def _render(path: str) -> None:
+    loop = asyncio.get_running_loop()
+    try:
+        variants = await loop.run_in_executor(
+            _get_pool(), render_variants, path, list(settings.IMAGE_VARIANT_WIDTHS)
+        )
+        logger.info("Rendered %d variants of %s", len(variants), path)
+    except Exception as exc:
+        logger.warning("Rendering variants of %s failed: %s", path, exc)
+
+
+def schedule_variants(path: str) -> None:
+    """Render variants of a freshly saved image in the background."""
+    if not settings.IMAGE_VARIANTS_ENABLED or not pillow_available():
+        return
+    task = asyncio.create_task(_render(path))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def _load_manifest(path: str) -> list[dict]:
+    variants = _manifests.get(path)
+    if variants is not None:
+        return variants
+    try:
+        with open(manifest_path_for(path), encoding="utf-8") as f:
+            variants = json.load(f)["variants"]
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        logger.warning("Unreadable variant manifest for %s: %s", path, exc)
+        return []
+    if len(_manifests) >= _MAX_CACHED_MANIFESTS:
+        _manifests.clear()
+    _manifests[path] = variants
+    return variants
+
+
+def variant_urls(url: str | None) -> list[dict]:
+    """``[{"url", "width", "height", "format"}, ...]`` for a stored image URL."""
+    if not url:
+        return []
+    path = static_file_path(url)
+    if path is None:
+        return []
+    prefix = url.rsplit("/", 1)[0]
+    return [
+        {
+            "url": f"{prefix}/{v['file']}",
+            "width": v["width"],
+            "height": v["height"],
+            "format": v["format"],
+        }
+        for v in _load_manifest(path)
+    ]
+
+
+def delete_variants(path: str) -> None:
+    """Remove the variants and manifest of the original at ``path``."""
+    _manifests.pop(path, None)
+    manifest_path = manifest_path_for(path)
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            files = [v["file"] for v in json.load(f)["variants"]]
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        logger.warning("Unreadable variant manifest for %s: %s", path, exc)
+        files = []
+    directory = os.path.dirname(path)
+    for name in [*files, os.path.basename(manifest_path)]:
+        try:
+            os.remove(os.path.join(directory, os.path.basename(name)))
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.warning("Delete failed %s: %s", name, exc)
+
+
+async def shutdown_variant_pool() -> None:
+    global _pool
+    if _background_tasks:
+        await asyncio.gather(*_background_tasks, return_exceptions=True)
+    if _pool is not None:
+        _pool.shutdown(wait=True)
+        _pool = None
@@ -0,0 +1,142 @@
+"""Keyset (cursor) pagination.
+
+OFFSET pagination makes the database read and discard every row before the
+page, so deep pages of the news archive or the activity log get slower as the
+tables grow. A keyset page instead starts right after the last row the client
+saw: ``WHERE (sort key) > (last row's sort key)``, which a composite index on
+the same columns answers directly.
+
+Lists opt in with a ``cursor`` query parameter: an empty ``cursor=`` asks for
+the first page, and every page returns ``next_cursor`` (``None`` on the last
+one) to pass back unchanged. The cursor is the last row's sort-key tuple,
+JSON-encoded in URL-safe base64 — opaque to clients, but not secret: a forged
+one can only move the starting point.
+
+Every sort must end in a unique column (the primary key) so the order is total
+and no row is skipped or repeated between pages.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, Sequence
+
+from sqlalchemy import and_, false, or_, true, tuple_
+
+
+class InvalidCursor(ValueError):
+    """The ``cursor`` parameter could not be decoded for this list."""
+
+
+class SortKey:
+    """One column of a keyset ordering.
+
+    ``attr`` is the name the value is read from on a result row, for selects
+    whose column is labelled differently from the model attribute.
+    """
+
+    def __init__(self, column, descending: bool = False, nulls_last: bool = False, attr: str | None = None):
+        self.column = column
+        self.descending = descending
+        # Only for nullable columns; NULLs then sort after every value in both
+        # directions, matching ``.nullslast()`` in the ORDER BY.
+        self.nulls_last = nulls_last
+        self.attr = attr or column.key
+
+    def order_by(self):
+        clause = self.column.desc() if self.descending else self.column.asc()
+        return clause.nullslast() if self.nulls_last else clause
+
+    def after(self, value):
+        """Rows strictly after ``value`` in this column's direction."""
+        if value is None:
+            # NULLs sort last: nothing comes after them within this column.
+            return false()
+        clause = self.column < value if self.descending else self.column > value
+        return or_(clause, self.column.is_(None)) if self.nulls_last else clause
+
+    def at_or_after(self, value):
+        """Rows at ``value`` or after it — ``after`` plus its ties."""
+        if value is None:
+            return self.column.is_(None)
+        clause = self.column <= value if self.descending else self.column >= value
+        return or_(clause, self.column.is_(None)) if self.nulls_last else clause
+
+    def equals(self, value):
+        return self.column.is_(None) if value is None else self.column == value
+
+    def encode(self, value) -> Any:
+        return value.isoformat() if isinstance(value, (datetime, date)) else value
+
+    def decode(self, raw) -> Any:
+        if raw is None:
+            if not self.nulls_last:
+                raise InvalidCursor("Invalid cursor.")
+            return None
+        python_type = self.column.type.python_type
+        try:
+            if python_type in (datetime, date):
+                return python_type.fromisoformat(raw)
+            if not isinstance(raw, python_type) or isinstance(raw, bool):
+                raise InvalidCursor("Invalid cursor.")
+        except (TypeError, ValueError) as exc:
+            raise InvalidCursor("Invalid cursor.") from exc
+        return raw
+
+
+class Keyset:
+    """A total ordering that can be resumed from an encoded cursor."""
+
+    def __init__(self, *keys: SortKey):
+        self.keys = keys
+
+    def order_by(self) -> list:
+        return [key.order_by() for key in self.keys]
+
+    def after(self, cursor: str):
+        """WHERE clause selecting the rows that follow ``cursor``."""
+        values = self._decode(cursor)
+        same_direction = len({key.descending for key in self.keys}) == 1
+        if same_direction and not any(key.nulls_last for key in self.keys):
+            # A row-value comparison is what Postgres matches to the index.
+            row = tuple_(*(key.column for key in self.keys))
+            bound = tuple_(*values)
+            return row < bound if self.keys[0].descending else row > bound
+
+        # Mixed directions: (a after x) OR (a = x AND b after y) OR ...
+        branches = []
+        for i, key in enumerate(self.keys):
+            prefix = [k.equals(v) for k, v in zip(self.keys[:i], values[:i])]
+            branches.append(and_(*prefix, key.after(values[i])) if prefix else key.after(values[i]))
+        if not branches:
+            return true()
+        # Postgres cannot bound an index scan by the OR; the redundant
+        # ``a >= x`` can, so the scan starts at the cursor instead of
+        # filtering every row before it.
+        return and_(self.keys[0].at_or_after(values[0]), or_(*branches))
+
+    def cursor_for(self, row) -> str:
+        values = [key.encode(getattr(row, key.attr)) for key in self.keys]
+        raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    def page(self, rows: Sequence, page_size: int) -> tuple[list, str | None]:
+        """Trim a ``page_size + 1`` fetch to the page and its ``next_cursor``."""
+        rows = list(rows)
+        if page_size < 1:
+            return [], None
+        if len(rows) <= page_size:
+            return rows, None
+        rows = rows[:page_size]
+        return rows, self.cursor_for(rows[-1])
+
+    def _decode(self, cursor: str) -> list:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            raw = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        except (binascii.Error, UnicodeError, ValueError) as exc:
+            raise InvalidCursor("Invalid cursor.") from exc
+        if not isinstance(raw, list) or len(raw) != len(self.keys):
+            raise InvalidCursor("Invalid cursor.")
+        return [key.decode(value) for key, value in zip(self.keys, raw)]
@@ -0,0 +1,55 @@
+-- =====================================================================
+-- MIGRATION — Admin search: trigram and full-text indexes
+--
+-- The admin search box (GET /api/search/admin) used to run
+-- ILIKE '%term%' over news and announcement titles, a sequential scan
+-- of both translation tables on every keystroke. It now searches news,
+-- announcements, faculties, cafedras, employees and offices in one
+-- ranked query (app.services.admin_search), and every column it reads
+-- carries two GIN indexes (app.core.text_search):
+--
+--   * <prefix>_trgm — pg_trgm trigrams: ILIKE '%term%' and fuzzy
+--                     word similarity (term <% column)
+--   * <prefix>_fts  — to_tsvector('simple', column): whole words
+--
+-- Requires the pg_trgm extension (shipped with Postgres contrib; the
+-- role running this needs CREATE on the database). Idempotent and
+-- additive. On a busy database, run each index with CONCURRENTLY
+-- (outside a transaction) to avoid blocking writes.
+-- =====================================================================
+
+create extension if not exists pg_trgm;
+
+-- News and announcements — titles, every language.
+create index if not exists ix_news_translation_title_trgm
+    on news_translation using gin (title gin_trgm_ops);
+create index if not exists ix_news_translation_title_fts
+    on news_translation using gin (to_tsvector('simple', title));
+
+create index if not exists ix_announcement_translation_title_trgm
+    on announcement_translation using gin (title gin_trgm_ops);
+create index if not exists ix_announcement_translation_title_fts
+    on announcement_translation using gin (to_tsvector('simple', title));
+
+-- Faculties and cafedras — names.
+create index if not exists ix_faculties_tr_name_trgm
+    on faculties_tr using gin (faculty_name gin_trgm_ops);
+create index if not exists ix_faculties_tr_name_fts
+    on faculties_tr using gin (to_tsvector('simple', faculty_name));
+
+create index if not exists ix_cafedras_tr_name_trgm
+    on cafedras_tr using gin (cafedra_name gin_trgm_ops);
+create index if not exists ix_cafedras_tr_name_fts
+    on cafedras_tr using gin (to_tsvector('simple', cafedra_name));
+
+-- Employees — full name ("first last", kept in sync by the service).
+create index if not exists ix_employee_tr_full_name_trgm
+    on employee_tr using gin (full_name gin_trgm_ops);
+create index if not exists ix_employee_tr_full_name_fts
+    on employee_tr using gin (to_tsvector('simple', full_name));
+
+-- Offices and centres — names.
+create index if not exists ix_office_tr_name_trgm
+    on office_tr using gin (name gin_trgm_ops);
+create index if not exists ix_office_tr_name_fts
+    on office_tr using gin (to_tsvector('simple', name));
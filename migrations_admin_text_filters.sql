@@ -0,0 +1,66 @@
+-- =====================================================================
+-- MIGRATION — Trigram-indexed free-text filters: activity log, chat
+--
+-- The activity log's "q" filter OR'ed four ILIKE '%term%' conditions
+-- and the chatbot session list probed chat_messages.content with
+-- ILIKE per session, so both read every row. Now:
+--
+--   * admin_activity_log.search_text — generated column joining the
+--     fields the filter searches (admin_username, action_key, path,
+--     target_label), kept by Postgres on every insert, with a pg_trgm
+--     GIN index: one ILIKE, one index scan
+--   * chat_messages.content — pg_trgm GIN index; the session list
+--     semi-joins the matching messages instead of probing per session
+--
+-- Measured with python -m scripts.bench_activity_search (PostgreSQL
+-- 18.6 with pg_trgm, local, default settings; median of 5 runs, ms).
+-- Production runs Postgres 15 and was not measured. The page query
+-- returns 25 rows, newest first.
+--
+--   activity log, 1,000,000 rows        page            count
+--     term          matches      before  after    before  after
+--     rare label          1      1416.0    2.9    1296.0    2.8
+--     one admin      25,000         1.3    1.3    1132.5  126.5
+--     common        250,000         0.3    0.5    1059.5  284.1
+--
+--   chat sessions, 50,000 sessions / 500,000 messages
+--     rare                1       376.0    1.9     364.3    1.7
+--     common         12,500         1.3    1.4     388.7  154.1
+--
+-- Common terms already filled a page early by walking the keyset index,
+-- and still do. The counts and the rare terms go from scanning every
+-- row to one bitmap scan of the trigram index. EXPLAIN of the rare-term
+-- queries after the change (the benchmark's temp tables carry the
+-- production index names):
+--
+--   Bitmap Heap Scan on bench_activity_log
+--     Recheck Cond: (search_text ~~* '%f1887d3f9e%'::text)
+--     ->  Bitmap Index Scan on ix_activity_search_trgm
+--
+--   Nested Loop
+--     ->  HashAggregate  (Group Key: bench_chat_messages.session_id)
+--           ->  Bitmap Heap Scan on bench_chat_messages
+--                 ->  Bitmap Index Scan on ix_chat_messages_content_trgm
+--     ->  Index Scan using bench_chat_sessions_session_id_key on bench_chat_sessions
+--
+-- Requires pg_trgm (also enabled by migrations_admin_search.sql).
+-- Idempotent. Adding a stored generated column rewrites
+-- admin_activity_log under an exclusive lock — run it in a quiet
+-- window. The indexes can then be built CONCURRENTLY (outside a
+-- transaction) to avoid blocking writes.
+-- =====================================================================
+
+create extension if not exists pg_trgm;
+
+alter table admin_activity_log
+    add column if not exists search_text text
+    generated always as (
+        admin_username || E'\n' || action_key || E'\n' || path
+        || E'\n' || coalesce(target_label, '')
+    ) stored;
+
+create index if not exists ix_activity_search_trgm
+    on admin_activity_log using gin (search_text gin_trgm_ops);
+
+create index if not exists ix_chat_messages_content_trgm
+    on chat_messages using gin (content gin_trgm_ops);
@@ -0,0 +1,21 @@
+-- =====================================================================
+-- MIGRATION — Chatbot: bounded history window
+--
+-- The chatbot now sends only the last few turns of a session to the model
+-- and folds older turns into a rolling summary stored on the session.
+--
+--   * chat_sessions.summary               — the rolling summary
+--   * chat_sessions.summarized_through_id — newest chat_messages.id already
+--                                           folded into it
+--   * (session_id, created_at) index      — serves "newest N messages of a
+--                                           session" without reading the
+--                                           whole transcript
+--
+-- Idempotent and additive.
+-- =====================================================================
+
+alter table chat_sessions add column if not exists summary text;
+alter table chat_sessions add column if not exists summarized_through_id integer;
+
+create index if not exists ix_chat_messages_session_created
+    on chat_messages (session_id, created_at);
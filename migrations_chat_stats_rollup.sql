@@ -0,0 +1,36 @@
+-- =====================================================================
+-- MIGRATION — Chatbot: daily statistics rollup
+--
+-- The chat statistics endpoint used to aggregate chat_sessions and
+-- chat_messages from scratch on every open, all-time distinct IPs
+-- included. A scheduled job (app.services.chat_stats.refresh_chat_stats)
+-- now rolls each UTC day up once and re-rolls only the last two days:
+--
+--   * chat_stats_daily     — sessions, messages, unique and new visitors
+--                            per day
+--   * chat_stats_visitors  — one row per (day, hashed visitor IP), for
+--                            distinct counts over weeks and months
+--   * chat_messages (created_at) index — the job's per-day message count
+--
+-- The tables fill on the job's first run. Idempotent and additive.
+-- =====================================================================
+
+create table if not exists chat_stats_daily (
+    day         date     primary key,
+    sessions    integer  not null default 0,
+    messages    integer  not null default 0,
+    unique_ips  integer  not null default 0,
+    new_ips     integer  not null default 0
+);
+
+create table if not exists chat_stats_visitors (
+    day           date      not null,
+    visitor_hash  char(64)  not null,
+    primary key (day, visitor_hash)
+);
+
+create index if not exists ix_chat_stats_visitors_hash_day
+    on chat_stats_visitors (visitor_hash, day);
+
+create index if not exists ix_chat_messages_created
+    on chat_messages (created_at);
@@ -0,0 +1,41 @@
+-- =====================================================================
+-- MIGRATION — Keyset (cursor) pagination indexes
+--
+-- News, announcements, the activity log and the chatbot session list can
+-- now be paged with an opaque cursor (WHERE sort key > last row's key)
+-- instead of OFFSET. Each index below matches one list's ORDER BY exactly,
+-- so a page is an index range scan however deep it is. Where the
+-- directions are mixed (news, announcements) the cursor condition is
+-- expanded into ORs, which Postgres cannot use as an index bound; it also
+-- carries a redundant bound on the leading column (display_order >= x),
+-- which starts the scan at the cursor. display_order is resequenced per
+-- row, so that bound is all but exact.
+--
+--   * news            (display_order, created_at desc, id desc), plus a
+--                     partial copy for the public feed's filter
+--   * announcement    (display_order, published_date desc nulls last, id desc)
+--   * admin_activity_log (created_at desc, id desc)
+--   * chat_sessions   (last_active_at desc, id desc), (started_at desc, id desc)
+--
+-- Idempotent and additive. On a busy database, run each statement with
+-- CONCURRENTLY (outside a transaction) to avoid blocking writes.
+-- =====================================================================
+
+create index if not exists ix_news_feed_order
+    on news (display_order, created_at desc, id desc);
+
+create index if not exists ix_news_public_feed_order
+    on news (display_order, created_at desc, id desc)
+    where is_active and show_in_all_news;
+
+create index if not exists ix_announcement_feed_order
+    on announcement (display_order, published_date desc nulls last, id desc);
+
+create index if not exists ix_activity_created_id
+    on admin_activity_log (created_at desc, id desc);
+
+create index if not exists ix_chat_sessions_last_active_id
+    on chat_sessions (last_active_at desc, id desc);
+
+create index if not exists ix_chat_sessions_started_id
+    on chat_sessions (started_at desc, id desc);
@@ -0,0 +1,24 @@
+-- =====================================================================
+-- MIGRATION — Uploads: content-addressed, reference-counted files
+--
+-- save_upload now hashes every upload (SHA-256) while streaming it. The
+-- first copy of some bytes is stored as before and recorded here; later
+-- uploads of the same bytes get that file's path back and bump ref_count
+-- instead of writing another copy. safe_delete_file decrements it and only
+-- removes the file when the last reference goes.
+--
+-- Files uploaded before this table existed have no row and keep the old
+-- behaviour: deleting them removes them immediately.
+--
+-- Idempotent and additive.
+-- =====================================================================
+
+create table if not exists upload_blobs (
+    sha256      char(64)     not null,
+    extension   varchar(10)  not null,
+    path        varchar(512) not null unique,
+    size        bigint       not null,
+    ref_count   integer      not null default 1,
+    created_at  timestamptz  not null default current_timestamp,
+    primary key (sha256, extension)
+);
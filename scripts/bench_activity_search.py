@@ -0,0 +1,272 @@
+"""Free-text filters of the activity log and the chatbot session list, before
+and after the trigram indexes (migrations_admin_text_filters.sql).
+
+Builds synthetic tables in this session's temp schema on DATABASE_URL — nothing
+else is touched — with the production expressions and index names, then times
+both shapes of each filter for terms of different selectivity:
+
+  * activity log — admin_username / target_label / action_key / path
+    ILIKE '%q%', vs. search_text ILIKE '%q%' on ix_activity_search_trgm
+  * chat sessions — a correlated EXISTS over unindexed message content, vs.
+    session_id IN (messages whose content ILIKE '%q%') on
+    ix_chat_messages_content_trgm
+
+Each query is the page (25 rows, newest first) and the count the endpoints
+run. The plans of the "after" queries are printed, so the index use can be
+checked. Needs Postgres with pg_trgm available.
+
+    python -m scripts.bench_activity_search
+    python -m scripts.bench_activity_search --rows 200000 --sessions 10000 --repeat 3
+"""
+
+import argparse
+import asyncio
+import hashlib
+import statistics
+import sys
+import time
+
+sys.path.insert(0, ".")
+
+from sqlalchemy import text  # noqa: E402
+
+from app.core.database import engine  # noqa: E402
+from app.core.text_search import like_pattern  # noqa: E402
+from app.models.admin.activity_log import SEARCH_TEXT_SQL  # noqa: E402
+
+PAGE_SIZE = 25
+# Row whose label supplies the "rare" term: it matches about one row.
+RARE_ROW = 123_457
+
+_CREATE = f"""
+create temp table bench_activity_log (
+    id              bigint       primary key,
+    admin_username  varchar(255) not null,
+    action_key      varchar(100) not null,
+    path            text         not null,
+    target_label    text,
+    created_at      timestamptz  not null,
+    search_text     text generated always as ({SEARCH_TEXT_SQL}) stored
+)
+"""
+
+_FILL = """
+insert into bench_activity_log (id, admin_username, action_key, path, target_label, created_at)
+select
+    i,
+    'admin' || (i % 40),
+    (array['news.create', 'news.update', 'announcements.update', 'employees.update',
+           'faculties.update', 'cafedras.update', 'menu.update', 'auth.login'])[1 + i % 8],
+    '/api/' || (array['news', 'news', 'announcement', 'employee',
+                      'faculty', 'cafedra', 'menu', 'auth'])[1 + i % 8] || '/' || (i % 5000),
+    case when i % 10 = 0 then null else 'Item ' || md5(i::text) end,
+    now() - make_interval(secs => i * 30)
+from generate_series(1, cast(:rows as integer)) as i
+"""
+
+_CHAT_CREATE = (
+    """
+    create temp table bench_chat_sessions (
+        id              integer      primary key,
+        session_id      varchar(36)  not null unique,
+        last_active_at  timestamptz  not null
+    )
+    """,
+    """
+    create temp table bench_chat_messages (
+        id          integer      primary key,
+        session_id  varchar(36)  not null,
+        content     text         not null
+    )
+    """,
+)
+
+# Ten messages per session; every fourth asks about exams.
+_CHAT_FILL = (
+    """
+    insert into bench_chat_sessions (id, session_id, last_active_at)
+    select i, md5('s' || i), now() - make_interval(secs => i * 60)
+    from generate_series(1, cast(:sessions as integer)) as i
+    """,
+    """
+    insert into bench_chat_messages (id, session_id, content)
+    select
+        i,
+        md5('s' || (1 + i % cast(:sessions as integer))),
+        case when i % 4 = 0
+            then 'Qəbul imtahanı nə vaxt başlayır? ' || md5(i::text)
+            else 'Salam, kafedra haqqında məlumat lazımdır ' || md5(i::text)
+        end
+    from generate_series(1, cast(:sessions as integer) * 10) as i
+    """,
+    "create index on bench_chat_sessions (last_active_at desc, id desc)",
+    "create index on bench_chat_messages (session_id)",
+)
+
+_BEFORE = (
+    "admin_username ilike :p or target_label ilike :p"
+    " or action_key ilike :p or path ilike :p"
+)
+_AFTER = "search_text ilike :p"
+
+_CHAT_BEFORE = (
+    "exists (select 1 from bench_chat_messages m"
+    " where m.session_id = s.session_id and m.content ilike :p)"
+)
+_CHAT_AFTER = "s.session_id in (select session_id from bench_chat_messages where content ilike :p)"
+
+
+def _terms() -> dict[str, str]:
+    return {
+        "rare label": hashlib.md5(str(RARE_ROW).encode()).hexdigest()[:10],
+        "one admin": "admin37",
+        "common": "news",
+    }
+
+
+def _chat_terms() -> dict[str, str]:
+    return {
+        "rare": hashlib.md5(str(RARE_ROW).encode()).hexdigest()[:10],
+        "common": "imtahan",
+    }
+
+
+async def _timed(conn, sql: str, params: dict, repeat: int) -> tuple[float, object]:
+    samples, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = (await conn.execute(text(sql), params)).all()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+def _activity_queries(where: str) -> tuple[str, str]:
+    return (
+        f"select id from bench_activity_log where {where}"
+        f" order by created_at desc, id desc limit {PAGE_SIZE + 1}",
+        f"select count(*) from bench_activity_log where {where}",
+    )
+
+
+def _chat_queries(where: str) -> tuple[str, str]:
+    return (
+        f"select s.id from bench_chat_sessions s where {where}"
+        f" order by s.last_active_at desc, s.id desc limit {PAGE_SIZE + 1}",
+        f"select count(*) from bench_chat_sessions s where {where}",
+    )
+
+
+async def _measure(conn, queries: tuple[str, str], term: str, repeat: int) -> tuple[float, float, int]:
+    params = {"p": like_pattern(term)}
+    page_sql, count_sql = queries
+    page_ms, _ = await _timed(conn, page_sql, params, repeat)
+    count_ms, rows = await _timed(conn, count_sql, params, repeat)
+    return page_ms, count_ms, rows[0][0]
+
+
+async def _explain(conn, title: str, sql: str, term: str) -> None:
+    plan = (await conn.execute(text(f"explain (costs off) {sql}"), {"p": like_pattern(term)})).scalars()
+    print(f"-- {title}")
+    for line in plan:
+        print(f"   {line}")
+
+
+def _report(title: str, before: dict, after: dict) -> None:
+    print(f"\n{title}")
+    print(f"{'term':<11} {'matches':>9} {'page before':>12} {'page after':>11}"
+          f" {'count before':>13} {'count after':>12}   (median ms)")
+    for name in before:
+        page_before, count_before, matches = before[name]
+        page_after, count_after, matches_after = after[name]
+        assert matches == matches_after, (name, matches, matches_after)
+        print(f"{name:<11} {matches:>9,} {page_before:>12.1f} {page_after:>11.1f}"
+              f" {count_before:>13.1f} {count_after:>12.1f}")
+
+
+async def _bench_activity(conn, rows: int, repeat: int) -> None:
+    await conn.execute(text(_CREATE))
+    start = time.perf_counter()
+    await conn.execute(text(_FILL), {"rows": rows})
+    await conn.execute(text(
+        "create index on bench_activity_log (created_at desc, id desc)"
+    ))
+    print(f"activity log: {rows:,} rows loaded in {time.perf_counter() - start:.1f}s")
+
+    await conn.execute(text("analyze bench_activity_log"))
+    before = {
+        name: await _measure(conn, _activity_queries(_BEFORE), term, repeat)
+        for name, term in _terms().items()
+    }
+
+    start = time.perf_counter()
+    await conn.execute(text(
+        "create index ix_activity_search_trgm on bench_activity_log"
+        " using gin (search_text gin_trgm_ops)"
+    ))
+    await conn.execute(text("analyze bench_activity_log"))
+    print(f"activity log: trigram index built in {time.perf_counter() - start:.1f}s")
+    after = {
+        name: await _measure(conn, _activity_queries(_AFTER), term, repeat)
+        for name, term in _terms().items()
+    }
+    _report("activity log", before, after)
+
+    page_sql, count_sql = _activity_queries(_AFTER)
+    rare = _terms()["rare label"]
+    await _explain(conn, "activity page, rare term", page_sql, rare)
+    await _explain(conn, "activity count, rare term", count_sql, rare)
+
+
+async def _bench_chat(conn, sessions: int, repeat: int) -> None:
+    for statement in _CHAT_CREATE:
+        await conn.execute(text(statement))
+    start = time.perf_counter()
+    for statement in _CHAT_FILL:
+        await conn.execute(text(statement), {"sessions": sessions})
+    print(f"\nchat: {sessions:,} sessions, {sessions * 10:,} messages loaded"
+          f" in {time.perf_counter() - start:.1f}s")
+
+    await conn.execute(text("analyze bench_chat_sessions"))
+    await conn.execute(text("analyze bench_chat_messages"))
+    before = {
+        name: await _measure(conn, _chat_queries(_CHAT_BEFORE), term, repeat)
+        for name, term in _chat_terms().items()
+    }
+
+    start = time.perf_counter()
+    await conn.execute(text(
+        "create index ix_chat_messages_content_trgm on bench_chat_messages"
+        " using gin (content gin_trgm_ops)"
+    ))
+    await conn.execute(text("analyze bench_chat_messages"))
+    print(f"chat: trigram index built in {time.perf_counter() - start:.1f}s")
+    after = {
+        name: await _measure(conn, _chat_queries(_CHAT_AFTER), term, repeat)
+        for name, term in _chat_terms().items()
+    }
+    _report("chat sessions", before, after)
+
+    page_sql, count_sql = _chat_queries(_CHAT_AFTER)
+    rare = _chat_terms()["rare"]
+    await _explain(conn, "session page, rare term", page_sql, rare)
+    await _explain(conn, "session count, rare term", count_sql, rare)
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="activity-log rows")
+    parser.add_argument("--sessions", type=int, default=50_000, help="chat sessions (10 messages each)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    async with engine.connect() as conn:
+        await conn.execute(text("create extension if not exists pg_trgm"))
+        await _bench_activity(conn, args.rows, args.repeat)
+        await _bench_chat(conn, args.sessions, args.repeat)
+        await conn.rollback()
+    await engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
@@ -0,0 +1,126 @@
+"""Per-request cost of the middleware stack on a trivial GET.
+
+Drives ASGI apps directly — no server, no sockets — so the numbers are the
+middleware layers and nothing else:
+
+  * bare         — the route alone
+  * base_http x5 — five pass-through ``BaseHTTPMiddleware`` layers, the shape
+                   of the stack before it was rewritten (SlowAPI, security
+                   headers, API key, audit log, ``@app.middleware`` logging)
+  * asgi x5      — five pass-through pure ASGI layers
+  * app stack    — the real middleware classes from app/middleware around the
+                   same route, in production order (CORS included)
+
+    python -m scripts.bench_middleware
+    python -m scripts.bench_middleware --requests 20000
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+
+sys.path.insert(0, ".")
+
+from slowapi import Limiter  # noqa: E402
+from slowapi.util import get_remote_address  # noqa: E402
+from starlette.applications import Starlette  # noqa: E402
+from starlette.middleware import Middleware  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+from starlette.middleware.cors import CORSMiddleware  # noqa: E402
+from starlette.responses import JSONResponse  # noqa: E402
+from starlette.routing import Route  # noqa: E402
+
+from app.middleware.api_key import PublicApiKeyMiddleware  # noqa: E402
+from app.middleware.audit_log import AuditLogMiddleware  # noqa: E402
+from app.middleware.rate_limit import RateLimitMiddleware  # noqa: E402
+from app.middleware.request_logging import RequestLoggingMiddleware  # noqa: E402
+from app.middleware.security_headers import SecurityHeadersMiddleware  # noqa: E402
+
+LAYERS = 5
+
+
+async def health(request):
+    return JSONResponse({"status": "ok"})
+
+
+class PassThroughHTTP(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+class PassThroughASGI:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        await self.app(scope, receive, send)
+
+
+def _app(middleware: list[Middleware]) -> Starlette:
+    app = Starlette(routes=[Route("/health", health)], middleware=middleware)
+    # Generous limits: the benchmark measures the check, not a rejection.
+    app.state.limiter = Limiter(key_func=get_remote_address, default_limits=["1000000/minute"])
+    return app
+
+
+def _apps() -> dict[str, Starlette]:
+    return {
+        "bare": _app([]),
+        f"base_http x{LAYERS}": _app([Middleware(PassThroughHTTP)] * LAYERS),
+        f"asgi x{LAYERS}": _app([Middleware(PassThroughASGI)] * LAYERS),
+        # Starlette applies this list outermost-first.
+        "app stack": _app([
+            Middleware(RequestLoggingMiddleware),
+            Middleware(CORSMiddleware, allow_origins=["https://aztu.edu.az"]),
+            Middleware(AuditLogMiddleware),
+            Middleware(PublicApiKeyMiddleware),
+            Middleware(SecurityHeadersMiddleware),
+            Middleware(RateLimitMiddleware),
+        ]),
+    }
+
+
+def _scope(app: Starlette) -> dict:
+    return {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": "/health", "raw_path": b"/health",
+        "root_path": "", "query_string": b"", "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000), "server": ("bench", 80), "app": app,
+    }
+
+
+async def _run(app: Starlette, requests: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200, message
+
+    for _ in range(200):  # build the middleware stack, warm caches
+        await app(_scope(app), receive, send)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(_scope(app), receive, send)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+    # Request lines are DEBUG; keep them out of the timing, as in production.
+    logging.getLogger("aztu.api").setLevel(logging.INFO)
+
+    results = {name: await _run(app, args.requests) for name, app in _apps().items()}
+    bare = results["bare"]
+    print(f"{'stack':<14} {'µs/request':>11} {'overhead':>9}")
+    for name, micros in results.items():
+        print(f"{name:<14} {micros:>11.1f} {micros - bare:>9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))